@@ -0,0 +1,1521 @@
+"""
+Performans ölçümleri.
+
+Ağa çıkmadan çalışır: crawler ölçümleri için yerel bir fixture HTTP sunucusu
+BloombergHT benzeri liste ve haber sayfaları üretir.
+
+Kullanım:
+    python benchmark.py crawl --haber 12 --gecikme 0.2
+    python benchmark.py http-cache --haber 12 --gecikme 0.2
+    python benchmark.py artimli --haber 12 --gecikme 0.2
+    python benchmark.py hiz-siniri --hiz 20 --istek 200
+    python benchmark.py parse --sayfa 40
+    python benchmark.py akis --haber 12 --sonuc 5 --gecikme 0.2
+    python benchmark.py kaynaklar --gecikmeler 0.1,0.2,0.3,0.4,0.6 --zaman-asimi 1.0
+    python benchmark.py arsiv --haber 12 --gecikme 0.2
+    python benchmark.py arsiv --oynat http_archive.jsonl.gz
+    python benchmark.py eslesme --kb 10,100,500
+    python benchmark.py onbellek --haber 200 --kb 3
+    python benchmark.py tokenizer --korpus tokenizer_korpus.jsonl.gz
+    python benchmark.py jsonl --haber 1000,10000 --kes 3
+    python benchmark.py yalin --haber 500 --kb 3
+    python benchmark.py kurallar --kurallar 6,100,300,1000
+    python benchmark.py depo --haber 20000
+    python benchmark.py baslatma --tekrar 5
+"""
+import argparse
+import asyncio
+import contextlib
+import glob
+import gzip
+import hashlib
+import io
+import json
+import os
+import pickle
+import random
+import re
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+import numpy as np
+from bs4 import BeautifulSoup
+
+import haber_analizi_bloomberght as hab
+
+# ==================== FIXTURE HTTP SUNUCUSU ====================
+
+PARAGRAFLAR = [
+    "Türkiye genelinde konut fiyatları Eylül ayında bir önceki yılın aynı ayına göre "
+    "nominal olarak yüzde 32,2 arttı.",
+    "TCMB verilerine göre bir önceki aya göre yüzde 1,7 oranında artan KFE 195,7 seviyesine yükseldi.",
+    "İstanbul'da konut fiyatları yıllık bazda yüzde 30,7 arttı, Ankara'da yüzde 41,1 artış kaydedildi.",
+    "Reel olarak ise konut fiyatları yüzde 0,8 azaldı ve reel değer kaybı sürdü.",
+    "Konut kredisi faiz oranı aylık %2,89 seviyesine geriledi, mortgage talebi arttı.",
+]
+
+
+EK_CUMLELER = [
+    "Merkez Bankası politika faizi kararını açıkladı, piyasa beklentisi faiz indirimi yönündeydi.",
+    "Kadıköy ve Beşiktaş'ta kira fiyatı artışı sürerken Anadolu yakası talebi güçlü kaldı.",
+    "Uzmanlar aşırı değerlenme ve balon riski konusunda uyardı, düşüş riski göz ardı edilmemeli.",
+    "Enflasyon baskısı altında gayrimenkul değer saklama aracı olarak cazip görünüyor.",
+    "Arz azlığı nedeniyle yeni konut arzı sınırlı kaldı ve fiyat endeksi yükseldi.",
+    "Belirsizlik ve volatilite yatırımcı talebini zayıf tuttu, satışlar geriledi.",
+    "Bölge genelinde proje stokları stabil seyretti, beklenti durağan.",
+]
+
+
+def uzun_makale(boyut_kb: int, tohum: int = 0) -> str:
+    """Yaklaşık 'boyut_kb' büyüklüğünde, karışık cümlelerden oluşan haber metni."""
+    rnd = random.Random(tohum)
+    cumleler = PARAGRAFLAR + EK_CUMLELER
+    parcalar, uzunluk = [], 0
+    while uzunluk < boyut_kb * 1024:
+        cumle = rnd.choice(cumleler)
+        parcalar.append(cumle)
+        uzunluk += len(cumle) + 1
+    return " ".join(parcalar)
+
+
+def ornek_liste_html(haber_sayisi: int) -> str:
+    """Konutla ilgili ve ilgisiz linkler içeren /haberler sayfası."""
+    linkler = ['<a href="/">Ana Sayfa</a>', '<a href="/piyasalar">Piyasalar</a>']
+    for i in range(haber_sayisi):
+        linkler.append(f'<a href="/haber/{i}">Konut fiyatları haber {i}</a>')
+        linkler.append(f'<a href="/borsa/{i}">Borsa günü yükselişle kapattı {i}</a>')
+    return f"<html><body><nav>{''.join(linkler)}</nav></body></html>"
+
+
+def ornek_haber_html(i: int) -> str:
+    """Tek bir haber sayfası; her beşinci haber Türkiye/İstanbul içermez."""
+    if i % 5 == 4:
+        paragraflar = ["Avrupa'da konut kredisi talebi geriledi."] * 4
+    else:
+        paragraflar = [PARAGRAFLAR[(i + k) % len(PARAGRAFLAR)] for k in range(4)]
+    govde = "".join(f"<p>{p}</p>" for p in paragraflar)
+    return (
+        "<html><head><title>BloombergHT</title>"
+        "<script>var reklam = {alan: 'ust'};</script></head><body>"
+        '<header><a href="/">Ana Sayfa</a><a href="/ekonomi">Ekonomi</a></header>'
+        f"<article><h1>Konut fiyatları haber {i}</h1>"
+        "<div class='tarih'><span>Giriş: 16 Ekim 2025, Perşembe 10:04</span></div>"
+        f"{govde}</article>"
+        "<footer><p>© BloombergHT</p></footer></body></html>"
+    )
+
+
+def ornek_agir_haber_html(i: int) -> str:
+    """Gerçek sayfalara benzer ağırlıkta haber: büyük menü, script'ler, yan sütun ve footer."""
+    menu = "".join(f'<li><a href="/kategori/{k}">Kategori {k}</a></li>' for k in range(300))
+    scriptler = "".join(
+        f"<script>window.dataLayer=window.dataLayer||[];dataLayer.push({{id:{k},a:'<b>'}});</script>"
+        for k in range(40)
+    )
+    yan_sutun = "".join(
+        f'<div class="kart"><a href="/haber/{k}"><img src="/i/{k}.jpg"><span>Öne çıkan {k}</span></a></div>'
+        for k in range(200)
+    )
+    sayfa = ornek_haber_html(i)
+    sayfa = sayfa.replace("</head>", f"{scriptler}<style>.kart{{color:red}}</style></head>")
+    sayfa = sayfa.replace("<header>", f"<header><nav><ul>{menu}</ul></nav>")
+    sayfa = sayfa.replace("</article>", f"</article><aside>{yan_sutun}</aside><!-- reklam -->")
+    return sayfa
+
+
+KAYNAK_HABERLERI = [
+    ("Kadıköy'de kentsel dönüşüm hızlandı", "Kadıköy'de kentsel dönüşüm projeleri için yeni ihaleler açıldı."),
+    ("Merkez Bankası'ndan faiz indirimi", "Faiz indirimi sonrası konut kredisi talebi artı."),
+    ("İnşaat maliyeti yüzde 40 arttı", "İnşaat maliyeti artışı yeni projeleri yavaşlatıyor."),
+    ("Beşiktaş'ta yeni metro istasyonu", "Beşiktaş hattına eklenecek metro istasyonu bölgeye değer katacak."),
+    ("Kira artışları gündemde", "Kiracılar ve ev sahipleri yeni düzenlemeyi bekliyor."),
+]
+
+
+def ornek_kaynak_html(kaynak: str, haber_sayisi: int) -> str:
+    """Emlak haber sitesi liste sayfası: <article> kartlarında başlık, özet ve tarih."""
+    kartlar = []
+    for i in range(haber_sayisi):
+        baslik, ozet = KAYNAK_HABERLERI[i % len(KAYNAK_HABERLERI)]
+        kartlar.append(
+            f'<article><h2><a href="/haber/{i}">{baslik} ({kaynak} {i})</a></h2>'
+            f'<p>{ozet}</p><time datetime="2025-10-{10 + i % 9:02d}T09:00:00">'
+            f'{10 + i % 9} Ekim</time></article>'
+        )
+    return f"<html><body><nav><a href='/'>{kaynak}</a></nav>{''.join(kartlar)}</body></html>"
+
+
+class _SessizHTTPServer(ThreadingHTTPServer):
+    """Zaman aşımıyla bağlantıyı kapatan istemcilerin hatalarını yazdırmaz."""
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class FixtureServer:
+    """Ayrı bir thread'de çalışan, sabit gecikmeli yerel HTTP sunucusu.
+
+    'sayfalar' yol -> HTML eşlemesidir; bilinmeyen yollar 404 döner. Sunucu
+    HTTP/1.1 konuşur, böylece istemci keep-alive bağlantılarını yeniden kullanabilir.
+    Yanıtlarda ETag / Last-Modified bulunur ve If-None-Match ile gelen
+    koşullu isteklere 304 döner. 'kisitla_her' > 0 ise her o kadar istekten
+    biri 429 (Retry-After: 1) ile reddedilir; 'retry_tarihi' True ise
+    Retry-After saniye yerine iki saniye sonrasının HTTP tarihidir.
+    """
+
+    LAST_MODIFIED = "Thu, 16 Oct 2025 07:04:00 GMT"
+
+    def __init__(self, sayfalar: Dict[str, str], gecikme: float = 0.0, kisitla_her: int = 0,
+                 retry_tarihi: bool = False):
+        self.sayfalar = sayfalar
+        self.gecikme = gecikme
+        self.kisitla_her = kisitla_her
+        self.retry_tarihi = retry_tarihi
+        self.istek_sayisi = 0
+        self.not_modified_sayisi = 0
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        sunucu = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with sunucu._lock:
+                    sunucu.istek_sayisi += 1
+                    kisitla = sunucu.kisitla_her and sunucu.istek_sayisi % sunucu.kisitla_her == 0
+                if kisitla:
+                    self.send_response(429)
+                    self.send_header("Retry-After", formatdate(time.time() + 2, usegmt=True)
+                                     if sunucu.retry_tarihi else "1")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                if sunucu.gecikme:
+                    time.sleep(sunucu.gecikme)
+                html = sunucu.sayfalar.get(self.path)
+                body = (html or "bulunamadı").encode("utf-8")
+                etag = f'"{hashlib.md5(body).hexdigest()}"'
+
+                if html is not None and self.headers.get("If-None-Match") == etag:
+                    with sunucu._lock:
+                        sunucu.not_modified_sayisi += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                self.send_response(200 if html is not None else 404)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                if html is not None:
+                    self.send_header("ETag", etag)
+                    self.send_header("Last-Modified", sunucu.LAST_MODIFIED)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._httpd = _SessizHTTPServer(("127.0.0.1", 0), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def bloomberght_fixture(haber_sayisi: int, gecikme: float) -> FixtureServer:
+    sayfalar = {"/haberler": ornek_liste_html(haber_sayisi)}
+    for i in range(haber_sayisi):
+        sayfalar[f"/haber/{i}"] = ornek_haber_html(i)
+    return FixtureServer(sayfalar, gecikme=gecikme)
+
+
+# ==================== ÖLÇÜMLER ====================
+
+def _sessiz(fn, *args, **kwargs):
+    """Crawler'ın ilerleme çıktısını bastırarak çalıştır, (sonuç, süre) döndür."""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def bench_crawl(args):
+    with bloomberght_fixture(args.haber, args.gecikme) as server:
+        limiter = hab.TokenBucketLimiter(rate=args.hiz, burst=args.patlama)
+        fetcher = hab.HttpFetcher(pool_size=args.eszamanli, limiter=limiter)
+        cache_sirali, cache_async = hab.DocumentCache(), hab.DocumentCache()
+
+        sirali, t_sirali = _sessiz(
+            hab.crawl_bloomberght_konut_tr_ist,
+            max_results=args.sonuc, base_url=server.base_url, fetcher=fetcher,
+            doc_cache=cache_sirali,
+        )
+        istek_sirali = server.istek_sayisi
+
+        server.istek_sayisi = 0
+        eszamanli, t_async = _sessiz(
+            asyncio.run,
+            hab.crawl_bloomberght_konut_tr_ist_async(
+                max_results=args.sonuc, max_concurrency=args.eszamanli,
+                max_per_host=args.host_limiti,
+                base_url=server.base_url, fetcher=fetcher, doc_cache=cache_async,
+            ),
+        )
+        istek_async = server.istek_sayisi
+        fetcher.close()
+
+    print(f"Sıralı crawl : {t_sirali:7.2f} sn  ({istek_sirali} istek, {len(sirali)} haber)")
+    print(f"Async crawl  : {t_async:7.2f} sn  ({istek_async} istek, {len(eszamanli)} haber)")
+    print(f"Hızlanma     : {t_sirali / t_async:7.2f}x")
+    print(f"Aynı sonuç   : {'evet' if sirali == eszamanli else 'HAYIR'}")
+    print(f"Sıralı {cache_sirali.report()}")
+    print(f"Async  {cache_async.report()}")
+    print(limiter.report())
+
+
+def bench_http_cache(args):
+    """Soğuk, koşullu (TTL=0, 304) ve taze (TTL içinde) önbellekle ardışık crawl süreleri."""
+    with bloomberght_fixture(args.haber, args.gecikme) as server, \
+            tempfile.TemporaryDirectory() as tmp:
+        cache = hab.HttpCache(os.path.join(tmp, "http_cache.sqlite"), ttl_seconds=0)
+        fetcher = hab.HttpFetcher(cache=cache)
+
+        for etiket, ttl in (("Soğuk", 0), ("Koşullu GET", 0), ("Taze (TTL)", 3600)):
+            cache.ttl_seconds = ttl
+            cache.stats = dict.fromkeys(cache.stats, 0)
+            server.istek_sayisi = server.not_modified_sayisi = 0
+            _, sure = _sessiz(
+                hab.crawl_bloomberght_konut_tr_ist,
+                max_results=args.sonuc, base_url=server.base_url, fetcher=fetcher,
+            )
+            print(f"{etiket:12}: {sure:6.2f} sn  sunucuya {server.istek_sayisi} istek "
+                  f"({server.not_modified_sayisi} adet 304)  {cache.report()}")
+
+        fetcher.close()
+        cache.close()
+
+
+def bench_artimli(args):
+    """Tam crawl ile ardından gelen artımlı (SeenIndex) crawl'un maliyeti."""
+    with bloomberght_fixture(args.haber, args.gecikme) as server, \
+            tempfile.TemporaryDirectory() as tmp:
+        index = hab.SeenIndex(os.path.join(tmp, "crawl_index.sqlite"))
+        fetcher = hab.HttpFetcher()
+
+        for etiket in ("İlk çalıştırma", "Tekrar (artımlı)"):
+            index.stats = dict.fromkeys(index.stats, 0)
+            server.istek_sayisi = 0
+            haberler, sure = _sessiz(
+                hab.crawl_bloomberght_konut_tr_ist,
+                max_results=args.sonuc, base_url=server.base_url,
+                fetcher=fetcher, seen_index=index,
+            )
+            print(f"{etiket:16}: {sure:6.2f} sn  sunucuya {server.istek_sayisi} istek, "
+                  f"{len(haberler)} haber  {index.report()}")
+
+        fetcher.close()
+        index.close()
+
+
+def bench_hiz_siniri(args):
+    """Paralel istemcilerle sınırlayıcının ulaştığı hız ve 429'lara tepkisi."""
+    sayfalar = {f"/s/{i}": f"<p>{i}</p>" for i in range(args.istek)}
+    with FixtureServer(sayfalar, gecikme=args.gecikme, kisitla_her=args.kisitla_her,
+                       retry_tarihi=args.retry_tarihi) as server:
+        limiter = hab.TokenBucketLimiter(rate=args.hiz, burst=args.patlama, backoff_base=0.05)
+        if args.aralik:
+            # crawl'un delay_seconds / min_interval parametrelerinin karşılığı
+            limiter.set_min_interval(server.base_url, args.aralik)
+        fetcher = hab.HttpFetcher(pool_size=args.thread, limiter=limiter)
+        urls = [f"{server.base_url}/s/{i}" for i in range(args.istek)]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.thread) as executor:
+            list(executor.map(fetcher.get_text, urls))
+        sure = time.perf_counter() - start
+        fetcher.close()
+
+    # Patlama kapasitesi kadar istek ilk anda gidebilir; kalanlar 'hiz' ile sınırlıdır
+    hiz, patlama = (min(args.hiz, 1 / args.aralik), 1) if args.aralik else (args.hiz, args.patlama)
+    ust_sinir = hiz * sure + patlama
+    print(f"Süre             : {sure:6.2f} sn")
+    print(f"Sunucuya istek   : {server.istek_sayisi} (izin verilen üst sınır {ust_sinir:.0f})")
+    print(f"Ortalama hız     : {server.istek_sayisi / sure:6.2f} istek/sn (hedef {hiz:g})")
+    print(limiter.report())
+
+
+def bench_parse(args):
+    """Tam html.parser ağacı ile kısıtlı (lxml + SoupStrainer) parse yolunu karşılaştır."""
+    if args.dizin:
+        sayfalar = []
+        for yol in sorted(glob.glob(os.path.join(args.dizin, "*.html"))):
+            with open(yol, encoding="utf-8") as f:
+                sayfalar.append(f.read())
+    else:
+        sayfalar = [ornek_agir_haber_html(i) for i in range(args.sayfa)]
+    if not sayfalar:
+        print("Parse edilecek sayfa bulunamadı")
+        return
+    item = {"title": "", "url": "https://www.bloomberght.com/haber"}
+
+    def tam_agac():
+        sonuc = []
+        for html in sayfalar:
+            soup = BeautifulSoup(html, "html.parser")
+            ilgili = hab.is_tr_istanbul_related(soup)
+            sonuc.append((ilgili, hab.extract_article(soup, item) if ilgili else None))
+        return sonuc
+
+    def hizli_yol():
+        sonuc = []
+        for html in sayfalar:
+            doc = hab.ParsedDocument(html)
+            ilgili = hab.is_tr_istanbul_related(doc)
+            sonuc.append((ilgili, hab.extract_article(doc, item) if ilgili else None))
+        return sonuc
+
+    eski, eski_sure = _sessiz(tam_agac)
+    yeni, yeni_sure = _sessiz(hizli_yol)
+    ortalama_kb = sum(len(h) for h in sayfalar) / len(sayfalar) / 1024
+
+    print(f"Sayfa sayısı     : {len(sayfalar)} (ortalama {ortalama_kb:.0f} KB)")
+    print(f"Parser           : {hab.HTML_PARSER}")
+    print(f"Tam ağaç         : {eski_sure * 1000 / len(sayfalar):7.2f} ms/sayfa")
+    print(f"Hızlı yol        : {yeni_sure * 1000 / len(sayfalar):7.2f} ms/sayfa")
+    print(f"Hızlanma         : {eski_sure / yeni_sure:5.2f}x")
+    print(f"Aynı sonuçlar    : {'evet' if eski == yeni else 'HAYIR'}")
+
+
+def bench_akis(args):
+    """Toplu crawl + analiz ile akış API'lerinin ilk sonuca ve toplam süreye etkisi."""
+    analyzer = hab.ImprovedHousingNewsAnalyzer()
+
+    def toplu(base_url, fetcher):
+        start = time.perf_counter()
+        ilk = None
+        sonuclar = []
+        for article in hab.crawl_bloomberght_konut_tr_ist(max_results=args.sonuc, base_url=base_url,
+                                                          fetcher=fetcher):
+            sonuclar.append(analyzer.analyze_article(article))
+            ilk = ilk or time.perf_counter() - start
+        return sonuclar, ilk
+
+    def akis(base_url, fetcher):
+        start = time.perf_counter()
+        ilk = None
+        sonuclar = []
+        articles = hab.iter_bloomberght_konut_tr_ist(max_results=args.sonuc, base_url=base_url,
+                                                     fetcher=fetcher)
+        for _, analysis in hab.iter_analyzed_articles(articles, analyzer):
+            sonuclar.append(analysis)
+            ilk = ilk or time.perf_counter() - start
+        return sonuclar, ilk
+
+    async def akis_async(base_url, fetcher):
+        start = time.perf_counter()
+        ilk = None
+        sonuclar = []
+        articles = hab.aiter_bloomberght_konut_tr_ist(max_results=args.sonuc, base_url=base_url,
+                                                      fetcher=fetcher, queue_size=args.kuyruk)
+        async for _, analysis in hab.aiter_analyzed_articles(articles, analyzer):
+            sonuclar.append(analysis)
+            ilk = ilk or time.perf_counter() - start
+        return sonuclar, ilk
+
+    olcumler = {}
+    for etiket, calistir in (("Toplu", toplu), ("Akış", akis),
+                             ("Async akış", lambda *a: asyncio.run(akis_async(*a)))):
+        with bloomberght_fixture(args.haber, args.gecikme) as server:
+            limiter = hab.TokenBucketLimiter(rate=args.hiz, burst=args.patlama)
+            fetcher = hab.HttpFetcher(limiter=limiter)
+            (sonuclar, ilk), toplam = _sessiz(calistir, server.base_url, fetcher)
+            fetcher.close()
+        olcumler[etiket] = sonuclar
+        ilk_metin = f"{ilk:6.2f} sn" if ilk is not None else "     -   "
+        print(f"{etiket:11}: ilk sonuç {ilk_metin}, toplam {toplam:6.2f} sn ({len(sonuclar)} analiz)")
+
+    # Analizde 'days_ago' gibi zamana bağlı alanlar da aynı çalıştırmada karşılaştırılır
+    ozet = {k: [a["decision_analysis"]["recommendation"] for a in v] for k, v in olcumler.items()}
+    ayni = len({repr(v) for v in ozet.values()}) == 1
+    print(f"Aynı öneriler : {'evet' if ayni else 'HAYIR'}")
+
+
+def bench_kaynaklar(args):
+    """Haber kaynaklarını sırayla ve eşzamanlı çekmenin süresi; yavaş kaynakta kısmi sonuç."""
+    import python as uygulama  # Flask uygulamasını yükler; sadece bu ölçümde gerekli
+
+    gecikmeler = [float(g) for g in args.gecikmeler.split(",")]
+    adaptorler = uygulama.varsayilan_haber_kaynaklari()[:len(gecikmeler)]
+    sunucular = [FixtureServer({"/": ornek_kaynak_html(a.ad, args.haber)}, gecikme=g)
+                 for a, g in zip(adaptorler, gecikmeler)]
+
+    with contextlib.ExitStack() as stack:
+        for adaptor, server in zip(adaptorler, sunucular):
+            stack.enter_context(server)
+            adaptor.url = f"{server.base_url}/"
+            adaptor.zaman_asimi = args.zaman_asimi
+        sistem = uygulama.HaberAnalizSistemi(kaynaklar=adaptorler)
+
+        start = time.perf_counter()
+        sirali = []
+        for adaptor in adaptorler:
+            try:
+                sirali.extend(adaptor.cek(args.haber))
+            except Exception:
+                pass
+        t_sirali = time.perf_counter() - start
+
+        start = time.perf_counter()
+        haberler = sistem.haber_cek(ilce="kadıköy", limit=len(adaptorler) * args.haber)
+        t_eszamanli = time.perf_counter() - start
+
+    print(f"Kaynak gecikmeleri : {', '.join(f'{g:.2f}' for g in gecikmeler)} sn "
+          f"(toplam {sum(gecikmeler):.2f}, en yavaş {max(gecikmeler):.2f})")
+    print(f"Sıralı çekim       : {t_sirali:6.2f} sn  ({len(sirali)} haber)")
+    print(f"Eşzamanlı çekim    : {t_eszamanli:6.2f} sn  ({len(haberler)} haber, "
+          f"üst sınır {args.zaman_asimi:.2f} sn)")
+    for ad, durum in sistem.haber_toplayici.son_durum.items():
+        print(f"  {ad:14}: {durum}")
+    if haberler:
+        ornek = haberler[0]
+        print(f"İlk haber          : {ornek['baslik']} (etki {ornek['etki']}, "
+              f"kategori {ornek['kategori']}, ilçe {ornek['ilgili_ilce']})")
+
+
+def bench_arsiv(args):
+    """Crawl'u arşive kaydet, ağa çıkmadan tam hızda ve kayıtlı gecikmeyle oynat.
+
+    '--oynat' verilirse kayıt adımı atlanır ve mevcut arşiv (ör. canlı
+    BloombergHT kaydı) kullanılır; NLP hızı da oynatılan haberlerle ölçülür.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        yol = args.oynat or os.path.join(tmp, "http_archive.jsonl.gz")
+        base_url = args.base_url
+
+        if not args.oynat:
+            with bloomberght_fixture(args.haber, args.gecikme) as server:
+                base_url = server.base_url
+                archive = hab.HttpArchive(yol, mode="record")
+                fetcher = hab.HttpFetcher(archive=archive,
+                                          limiter=hab.TokenBucketLimiter(rate=float("inf")))
+                kayit, sure = _sessiz(hab.crawl_bloomberght_konut_tr_ist,
+                                      max_results=args.sonuc, base_url=base_url, fetcher=fetcher)
+                fetcher.close()
+            print(f"Kayıt (ağ)        : {sure:6.2f} sn  {len(kayit)} haber  {archive.report()}  "
+                  f"{os.path.getsize(yol) / 1024:.1f} KB")
+
+        sonuclar = {}
+        for etiket, gecikmeli in (("Oynatma (tam hız)", False), ("Oynatma (gecikme)", True)):
+            archive = hab.HttpArchive(yol, mode="replay", replay_latency=gecikmeli)
+            fetcher = hab.HttpFetcher(archive=archive)
+            sonuclar[etiket], sure = _sessiz(hab.crawl_bloomberght_konut_tr_ist,
+                                             max_results=args.sonuc, base_url=base_url,
+                                             fetcher=fetcher)
+            fetcher.close()
+            print(f"{etiket:18}: {sure:6.2f} sn  {len(sonuclar[etiket])} haber  {archive.report()}")
+
+        haberler = sonuclar["Oynatma (tam hız)"]
+        if not args.oynat:
+            print(f"Aynı sonuçlar     : {'evet' if all(v == kayit for v in sonuclar.values()) else 'HAYIR'}")
+        if haberler:
+            analyzer = hab.ImprovedHousingNewsAnalyzer()
+            _, sure = _sessiz(lambda: [analyzer.analyze_article(article)
+                                       for _ in range(args.tekrar) for article in haberler])
+            print(f"NLP hızı          : {args.tekrar * len(haberler) / sure:6.1f} haber/sn")
+
+
+class NaifEslestirici:
+    """KeywordMatcher ile aynı arayüz; her desen için 'desen in metin' dener (eski yöntem)."""
+
+    def __init__(self, matcher):
+        self.tags = matcher.tags
+        self.max_length = matcher.max_length
+
+    def found(self, text):
+        return {pattern for pattern in self.tags if pattern in text}
+
+    def finditer(self, text):
+        for pattern in self.tags:
+            start = text.find(pattern)
+            while start >= 0:
+                yield start, pattern
+                start = text.find(pattern, start + 1)
+
+
+def bench_eslesme(args):
+    """Anahtar kelime, duygu ve kural aramasında Aho–Corasick ile desen başına aramanın karşılaştırması."""
+    aho = hab.ImprovedHousingNewsAnalyzer()
+    naif = hab.ImprovedHousingNewsAnalyzer()
+    naif.nlp_analyzer.matcher = NaifEslestirici(naif.nlp_analyzer.matcher)
+    print(f"Desen sayısı: {len(aho.nlp_analyzer.matcher.tags)}")
+
+    def calistir(analyzer, metin):
+        nlp = analyzer.nlp_analyzer
+        keywords = nlp.extract_keywords(metin)
+        sentiment = nlp.analyze_sentiment(metin)
+        rules = analyzer.apply_decision_rules(metin, keywords, {"percentages": []})
+        return keywords["category_keywords"], sentiment, rules
+
+    for kb in (int(k) for k in args.kb.split(",")):
+        metin = uzun_makale(kb)
+        sonuc_naif, t_naif = _sessiz(calistir, naif, metin)
+        sonuc_aho, t_aho = _sessiz(calistir, aho, metin)
+        print(f"{kb:5d} KB: desen başına {t_naif * 1000:8.1f} ms, Aho–Corasick {t_aho * 1000:8.1f} ms "
+              f"({t_naif / t_aho:4.1f}x)  aynı sonuç: {'evet' if sonuc_naif == sonuc_aho else 'HAYIR'}")
+
+
+def naif_finansal_tarama(text):
+    """Eski yöntem: her varlık türü için küçük harfli metin üzerinde ayrı re.findall geçişi."""
+    lower = text.lower()
+    yuzdeler = []
+    for desen in (r'yüzde\s+(\d+[.,]?\d*)', r'%(\d+[.,]?\d*)', r'oranında\s+(\d+[.,]?\d*)'):
+        yuzdeler += [float(m.replace(',', '.')) for m in re.findall(desen, lower)]
+    paralar = {}
+    for birim, desen in (('tl', r'(\d+[.,]?\d*)\s*(tl|₺|türk lirası)'),
+                         ('dolar', r'(\d+[.,]?\d*)\s*(\$|dolar|usd)'),
+                         ('euro', r'(\d+[.,]?\d*)\s*(€|euro|eur)')):
+        eslesmeler = re.findall(desen, lower)
+        if eslesmeler:
+            paralar[birim] = [float(m[0].replace(',', '.')) for m in eslesmeler]
+    return {
+        'percentages': yuzdeler,
+        'currency_values': paralar,
+        'time_expressions': re.findall(r'(\d+\s*(ay|yıl|hafta|gün|saat)\s*(önce|içinde|sonra)?)', lower),
+        'kfe_values': [float(m.replace(',', '.')) for m in re.findall(r'kfe.*?(\d+[.,]?\d+)', lower)]
+    }
+
+
+def bench_finansal(args):
+    """Finansal varlık taramasında desen başına findall ile tek geçişli tarayıcının karşılaştırması."""
+    metinler = [(f"{kb} KB makale", uzun_makale(kb)) for kb in (int(k) for k in args.kb.split(","))]
+    n = args.kotu
+    metinler += [
+        ("'kfe' dolu satır", "kfe " * (n // 10) + "\n%5 kfe 12,5"),
+        ("boşluk + yüzde", ("yüzde" + " " * 20 + "x ") * (n // 4) + "yüzde 3"),
+        ("rakam yığını", "1 " * n + "2,5 tl"),
+    ]
+    for ad, metin in metinler:
+        sonuc_naif, t_naif = _sessiz(naif_finansal_tarama, metin)
+        sonuc_tek, t_tek = _sessiz(hab.scan_financial_text, metin.lower())
+        print(f"{ad:18s} ({len(metin) // 1024:5d} KB): findall {t_naif * 1000:9.1f} ms, "
+              f"tek geçiş {t_tek * 1000:8.1f} ms ({t_naif / t_tek:5.1f}x)  "
+              f"aynı sonuç: {'evet' if sonuc_naif == sonuc_tek else 'HAYIR'}")
+
+
+# extract_tr_ist_features_from_text'in eski hali: tüm metin üzerinde '.*?' içeren tek regex
+ESKI_OZELLIK_DESENLERI = [
+    ("tr_yoy_change", r"(türkiye(?: genelinde)?|konut fiyat endeksi).*?(yüzde|%)[\s]*([\d]+[.,]\d+)"),
+    ("tr_yoy_change", r"bir önceki yılın aynı ayına göre.*?(yüzde|%)[\s]*([\d]+[.,]\d+)"),
+    ("tr_mom_change", r"bir önceki aya göre.*?(yüzde|%)[\s]*([\d]+[.,]\d+)\s*oranında artan kfe"),
+    ("tr_index_level", r"kfe.*?([\d]+[.,]\d+)\s*seviyesine"),
+    ("ist_yoy_change", r"istanbul.*?(yıllık|yıl bazında).*?(yüzde|%)[\s]*([\d]+[.,]\d+)"),
+    ("ist_mom_change", r"istanbul.*?bir önceki aya göre.*?(yüzde|%)[\s]*([\d]+[.,]\d+)"),
+]
+
+
+def naif_ozellik_cikar(text):
+    t = text.lower()
+    ozellikler = dict.fromkeys(ad for ad, _ in ESKI_OZELLIK_DESENLERI)
+    for ad, desen in ESKI_OZELLIK_DESENLERI:
+        if ozellikler[ad] is None:
+            m = re.search(desen, t)
+            if m:
+                ozellikler[ad] = float(m.groups()[-1].replace(",", "."))
+    return ozellikler
+
+
+def bench_ozellik(args):
+    """KFE özellik çıkarımında tüm metin regex'i ile cümle pencereli çıkarıcının uzunluğa göre süresi."""
+    for kb in (int(k) for k in args.kb.split(",")):
+        n = kb * 1024
+        metinler = [
+            ("makale", uzun_makale(kb), True),
+            ("'istanbul yıllık'", "istanbul yıllık " * (n // 16), kb <= args.naif_sinir),
+            ("'türkiye' tek satır", "türkiye " * (n // 8), kb <= args.naif_sinir),
+            ("kfe + rakam yığını", "kfe " + "1" * n, kb <= args.naif_sinir),
+        ]
+        for ad, metin, naif_olc in metinler:
+            yeni, t_yeni = _sessiz(hab.extract_tr_ist_features_from_text, metin)
+            if naif_olc:
+                eski, t_eski = _sessiz(naif_ozellik_cikar, metin)
+                naif = f"tek regex {t_eski * 1000:9.1f} ms"
+            else:
+                naif = "tek regex         -   "
+            print(f"{kb:5d} KB {ad:20s}: {naif}, pencereli {t_yeni * 1000:8.1f} ms  "
+                  f"bulunan: {sum(v is not None for v in yeni.values())}")
+
+
+def bench_belge(args):
+    """Analiz adımlarının metni ayrı ayrı işlemesi ile paylaşılan AnalyzedDocument'ın haber başına CPU süresi."""
+    analyzer = hab.ImprovedHousingNewsAnalyzer()
+    nlp = analyzer.nlp_analyzer
+
+    def adimlar(metin, baslik):
+        # İlk argüman str ise her adım metni kendisi küçültür / böler / tarar
+        keywords = nlp.extract_keywords(baslik)
+        sentiment = nlp.analyze_sentiment(metin)
+        finansal = nlp.extract_financial_entities(metin)
+        zaman = nlp.analyze_temporal_context(metin, "Giriş: 05.03.2025")
+        kurallar = analyzer.apply_decision_rules(metin, keywords, finansal)
+        return keywords, sentiment, finansal, zaman["time_context"], kurallar
+
+    for kb in (int(k) for k in args.kb.split(",")):
+        metinler = [(uzun_makale(kb, tohum), f"Konut piyasası raporu {tohum}") for tohum in range(args.haber)]
+        ayri, t_ayri = _sessiz(lambda: [adimlar(m, m + " " + b) for m, b in metinler])
+        paylasilan, t_pay = _sessiz(lambda: [adimlar(nlp.document(m), m + " " + b) for m, b in metinler])
+        print(f"{kb:5d} KB: ayrı ayrı {t_ayri / args.haber * 1000:8.2f} ms/haber, "
+              f"paylaşılan belge {t_pay / args.haber * 1000:8.2f} ms/haber "
+              f"({t_ayri / t_pay:4.2f}x)  aynı sonuç: {'evet' if repr(ayri) == repr(paylasilan) else 'HAYIR'}")
+
+
+def bench_toplu(args):
+    """Arşiv boyutunda bir haber grubunun tek tek ve seyrek matrislerle toplu analizi."""
+    analyzer = hab.ImprovedHousingNewsAnalyzer()
+    haberler = [{"title": f"Konut piyasası raporu {i}", "text": uzun_makale(args.kb, i),
+                 "giris": "Giriş: 05.03.2025", "url": f"{hab.BASE_URL}/arsiv-{i}"}
+                for i in range(args.haber)]
+    print(f"{args.haber} haber x {args.kb} KB, scipy: {'var' if hab.sparse is not None else 'yok'}")
+
+    tek_tek, t_tek = _sessiz(lambda: [analyzer.analyze_article(haber) for haber in haberler])
+    toplu, t_toplu = _sessiz(analyzer.analyze_articles, haberler)
+    print(f"Tek tek : {t_tek:7.2f} sn ({args.haber / t_tek:7.1f} haber/sn)")
+    print(f"Toplu   : {t_toplu:7.2f} sn ({args.haber / t_toplu:7.1f} haber/sn)  "
+          f"aynı sonuç: {'evet' if repr(tek_tek) == repr(toplu) else 'HAYIR'}")
+
+
+def bench_paralel(args):
+    """Süreç havuzuyla paralel analizin süreç sayısına göre ölçeklenmesi."""
+    haberler = [{"title": f"Konut piyasası raporu {i}", "text": uzun_makale(args.kb, i),
+                 "giris": "Giriş: 05.03.2025", "url": f"{hab.BASE_URL}/arsiv-{i}"}
+                for i in range(args.haber)]
+    analyzer = hab.ImprovedHousingNewsAnalyzer()
+    beklenen, t_sirali = _sessiz(analyzer.analyze_articles, haberler)
+    print(f"{args.haber} haber x {args.kb} KB, çekirdek: {os.cpu_count()}")
+    print(f"Tek süreç (havuzsuz) : {t_sirali:6.2f} sn ({args.haber / t_sirali:7.1f} haber/sn)")
+
+    taban = None
+    for surec in (int(s) for s in args.surecler.split(",")):
+        sonuc, sure = _sessiz(lambda: [analiz for _, analiz in hab.iter_analyzed_articles_parallel(
+            haberler, processes=surec, chunk_size=args.parca)])
+        taban = taban or sure * surec
+        print(f"{surec:2d} süreç             : {sure:6.2f} sn ({args.haber / sure:7.1f} haber/sn, "
+              f"ölçeklenme {taban / sure / surec * 100:5.1f}%)  "
+              f"aynı sonuç: {'evet' if repr(sonuc) == repr(beklenen) else 'HAYIR'}")
+
+
+def bench_onbellek(args):
+    """Analiz önbelleğinin soğuk, bellek, disk ve kural değişikliği sonrası etkisi."""
+    haberler = [{"title": f"Konut piyasası raporu {i}", "text": uzun_makale(args.kb, i),
+                 "giris": "Giriş: 05.03.2025", "url": f"{hab.BASE_URL}/arsiv-{i}"}
+                for i in range(args.haber)]
+    analyzer = hab.ImprovedHousingNewsAnalyzer()
+    _sessiz(analyzer.analyze_article, haberler[0])  # tokenizer'ların ilk kurulumu ölçüme girmesin
+    beklenen, t_yok = _sessiz(lambda: [analyzer.analyze_article(haber) for haber in haberler])
+    print(f"{args.haber} haber x {args.kb} KB, bellek katmanı {args.bellek} sonuç")
+    print(f"Önbelleksiz          : {t_yok:6.2f} sn")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        yol = os.path.join(tmp, "analysis_cache.sqlite")
+        cache = hab.AnalysisCache(yol, max_entries=args.bellek)
+        analyzer = hab.ImprovedHousingNewsAnalyzer(cache=cache)
+        adimlar = [("Soğuk (boş önbellek)", analyzer), ("Sıcak (aynı süreç)", analyzer)]
+        # Yeni süreç gibi: bellek katmanı boş, kayıtlar diskte
+        diskten = hab.ImprovedHousingNewsAnalyzer(cache=hab.AnalysisCache(yol, max_entries=args.bellek))
+        adimlar.append(("Diskten (yeni süreç)", diskten))
+        for etiket, a in adimlar:
+            once = dict(a.cache.stats)
+            sonuc, sure = _sessiz(lambda: [a.analyze_article(haber) for haber in haberler])
+            isabet = sum(a.cache.stats[k] - once[k] for k in ("memory_hits", "disk_hits"))
+            print(f"{etiket:21s}: {sure:6.2f} sn ({t_yok / sure:6.1f}x)  isabet {isabet}/{len(haberler)}  "
+                  f"aynı sonuç: {'evet' if sonuc == beklenen else 'HAYIR'}")
+
+        # Kural puanı değişince sürüm değişir, eski kayıtlar kullanılmaz
+        diskten.decision_rules['K1']['score'] += 1
+        diskten.compile_rules()
+        once = dict(diskten.cache.stats)
+        _, sure = _sessiz(lambda: [diskten.analyze_article(haber) for haber in haberler])
+        print(f"{'Kural değişikliği':21s}: {sure:6.2f} sn  yeni analiz "
+              f"{diskten.cache.stats['misses'] - once['misses']}/{len(haberler)}")
+        print(cache.report())
+        print(diskten.cache.report())
+        cache.close()
+        diskten.cache.close()
+
+
+# Kısaltma, tarih, ondalık virgül, sıra sayısı ve tırnak içeren cümleler
+ZOR_CUMLELER = [
+    "Prof. Dr. Ayşe Kaya, 05.03.2025 tarihli raporda konut fiyatlarının %32,2 arttığını söyledi.",
+    "Emlak Konut GYO A.Ş. ilk çeyrekte 12.500 konut sattı.",
+    "T.C. Merkez Bankası 3. çeyrek için enflasyon tahminini yüzde 41,5'e yükseltti.",
+    "Kadıköy'de (Moda Mah. Bahariye Cad.) kiralar 1,2 milyon TL'ye ulaştı.",
+    "\"Talep güçlü kalacak.\" diyen Doç. Dr. Mehmet Yılmaz uyardı.",
+    "Satışlar arttı mı? Uzmanlara göre evet!",
+    "Fiyatlar yükseldi... Ancak reel olarak kayıp sürüyor.",
+    "2024. Yılın son ayında konut kredisi faizi %2,89 oldu.",
+    "Doğuş Ltd. Şti. ve benzeri (vb.) firmalar yeni projeler açıkladı.",
+]
+
+
+def tokenizer_korpusu(yol: Optional[str], haber: int, boyut_kb: int):
+    """Kayıtlı korpusu (JSON satırları, .gz olabilir) oku; yoksa üretip kaydet."""
+    acici = gzip.open if yol and yol.endswith(".gz") else open
+    if yol and os.path.exists(yol):
+        with acici(yol, "rt", encoding="utf-8") as f:
+            return [json.loads(satir)["text"] for satir in f if satir.strip()], False
+    cumleler = PARAGRAFLAR + EK_CUMLELER + ZOR_CUMLELER
+    metinler = []
+    for i in range(haber):
+        rnd = random.Random(i)
+        parcalar = []
+        while sum(len(p) + 1 for p in parcalar) < boyut_kb * 1024:
+            parcalar.append(rnd.choice(cumleler))
+        metinler.append(" ".join(parcalar))
+    if yol:
+        with acici(yol, "wt", encoding="utf-8") as f:
+            for metin in metinler:
+                f.write(json.dumps({"text": metin}, ensure_ascii=False) + "\n")
+    return metinler, True
+
+
+def nltk_tokenizerlari():
+    """Karşılaştırma için NLTK: paketteki kısaltmalarla yerel punkt ve (indirilmişse) Türkçe punkt modeli."""
+    try:
+        from nltk.tokenize.punkt import PunktParameters, PunktSentenceTokenizer
+        from nltk.tokenize.destructive import NLTKWordTokenizer
+    except ImportError:
+        return {}
+    params = PunktParameters()
+    params.abbrev_types = set(hab.load_nlp_resources()["sentence_abbreviations"])
+    kelime = NLTKWordTokenizer()
+    sistemler = {"nltk punkt (yerel)": (PunktSentenceTokenizer(params), kelime)}
+    try:
+        from nltk.tokenize import PunktTokenizer
+        sistemler["nltk punkt (model)"] = (PunktTokenizer("turkish"), kelime)
+    except (ImportError, LookupError, OSError):
+        pass
+    return sistemler
+
+
+def bench_tokenizer(args):
+    """Regex tabanlı Türkçe tokenizer ile NLTK punkt + treebank: hız ve bölme uyumu."""
+    metinler, uretildi = tokenizer_korpusu(args.korpus, args.haber, args.kb)
+    print(f"Korpus: {len(metinler)} metin, {sum(map(len, metinler)) // 1024} KB"
+          + (f" ({args.korpus} dosyasına kaydedildi)" if uretildi and args.korpus else ""))
+    # tokenize_lower'ın kelime ayırıcıya verdiği metin
+    temiz = [re.sub(r'[^\w\s%.,]', ' ', metin.lower()) for metin in metinler]
+
+    hab.tr_sent_tokenize("Isınma. Turu.")
+    t0 = time.perf_counter()
+    cumleler = [hab.tr_sent_tokenize(metin) for metin in metinler]
+    t_cumle = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    kelimeler = [hab.tr_word_tokenize(metin) for metin in temiz]
+    t_kelime = time.perf_counter() - t0
+    print(f"{'regex (modül)':20s}: cümle {t_cumle * 1000:8.1f} ms, kelime {t_kelime * 1000:8.1f} ms")
+
+    sistemler = nltk_tokenizerlari()
+    if not sistemler:
+        print("NLTK kurulu değil; karşılaştırma atlandı")
+    for ad, (cumle_ayirici, kelime_ayirici) in sistemler.items():
+        t0 = time.perf_counter()
+        ref_cumleler = [cumle_ayirici.tokenize(metin) for metin in metinler]
+        t_ref_cumle = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        ref_kelimeler = [[token for cumle in cumle_ayirici.tokenize(metin) for token in kelime_ayirici.tokenize(cumle)]
+                         for metin in temiz]
+        t_ref_kelime = time.perf_counter() - t0
+        ayni_cumle = sum(a == b for a, b in zip(cumleler, ref_cumleler)) / len(metinler) * 100
+        ayni_kelime = sum(a == b for a, b in zip(kelimeler, ref_kelimeler)) / len(metinler) * 100
+        print(f"{ad:20s}: cümle {t_ref_cumle * 1000:8.1f} ms ({t_ref_cumle / t_cumle:5.1f}x), "
+              f"kelime {t_ref_kelime * 1000:8.1f} ms ({t_ref_kelime / t_kelime:5.1f}x)  "
+              f"aynı bölme: cümle %{ayni_cumle:.1f}, kelime %{ayni_kelime:.1f}")
+
+
+def _cli_calistir(girdi: str, cikti: str, kes: Optional[float] = None):
+    """Modülün JSONL CLI'ını ayrı süreçte çalıştır; (süre, en yüksek RSS MB) döndür.
+
+    'kes' verilirse süreç o kadar saniye sonra SIGKILL ile öldürülür (çökme benzetimi).
+    """
+    modul = os.path.join(os.path.dirname(os.path.abspath(__file__)), "haber_analizi_bloomberght.py")
+    baslangic = time.perf_counter()
+    surec = subprocess.Popen([sys.executable, modul, "--girdi", girdi, "--cikti", cikti, "--depo-yok"],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if kes is not None:
+        time.sleep(kes)
+        surec.send_signal(signal.SIGKILL)
+    _, _, kullanim = os.wait4(surec.pid, 0)
+    surec.returncode = 0  # wait4 süreci topladı; Popen'ın tekrar beklemesini önle
+    # Linux'ta ru_maxrss KB cinsindendir
+    return time.perf_counter() - baslangic, kullanim.ru_maxrss / 1024
+
+
+def _satir_sayisi(yol: str) -> int:
+    """Tam satır sayısı; öldürülen süreçten kalan kesik gzip kuyruğu sayılmaz."""
+    sayi = 0
+    with contextlib.suppress(EOFError), hab.open_jsonl(yol) as f:
+        for satir in f:
+            sayi += satir.endswith("\n")
+    return sayi
+
+
+def bench_jsonl(args):
+    """JSONL arşiv CLI'ı: arşiv boyutuna göre hız ve bellek, çökme sonrası devam."""
+    with tempfile.TemporaryDirectory() as tmp:
+        for haber in (int(n) for n in args.haber.split(",")):
+            girdi = os.path.join(tmp, f"arsiv_{haber}.jsonl.gz")
+            with hab.open_jsonl(girdi, "w") as f:
+                for i in range(haber):
+                    f.write(json.dumps({"title": f"Konut piyasası raporu {i}", "text": uzun_makale(args.kb, i),
+                                        "giris": "Giriş: 05.03.2025", "url": f"{hab.BASE_URL}/arsiv-{i}"},
+                                       ensure_ascii=False) + "\n")
+            cikti = os.path.join(tmp, f"sonuc_{haber}.jsonl.gz")
+            sure, rss = _cli_calistir(girdi, cikti)
+            print(f"{haber:8d} haber: {sure:7.2f} sn ({haber / sure:6.1f} haber/sn), en yüksek RSS {rss:6.1f} MB, "
+                  f"{os.path.getsize(cikti) / haber:6.0f} B/haber (gzip)")
+
+        if args.kes:
+            yarim = os.path.join(tmp, "yarim.jsonl.gz")
+            _cli_calistir(girdi, yarim, kes=args.kes)
+            kesilen = _satir_sayisi(yarim) if os.path.exists(yarim) else 0
+            sure, _ = _cli_calistir(girdi, yarim)
+            with hab.open_jsonl(cikti) as a, hab.open_jsonl(yarim) as b:
+                ayni = all(x == y for x, y in zip(a, b)) and _satir_sayisi(yarim) == haber
+            print(f"Çökme ({args.kes} sn sonra SIGKILL): ~{kesilen} satır yazılmıştı, devam {sure:6.2f} sn  "
+                  f"kesintisiz çıktıyla aynı: {'evet' if ayni else 'HAYIR'}")
+
+
+def bench_yalin(args):
+    """Tam ve yalın analiz sonuçlarının bellekte ve JSON/pickle olarak haber başına boyutu."""
+    haberler = [{"title": f"Konut piyasası raporu {i}", "text": uzun_makale(args.kb, i),
+                 "giris": "Giriş: 05.03.2025", "url": f"{hab.BASE_URL}/arsiv-{i}"}
+                for i in range(args.haber)]
+    analyzer = hab.ImprovedHousingNewsAnalyzer(cache=hab.AnalysisCache(":memory:", max_entries=args.haber))
+    _sessiz(analyzer.analyze_articles, haberler)  # NLP bir kez; ölçümler yalnızca sonuç kurmayı kapsar
+    print(f"{args.haber} haber x {args.kb} KB")
+
+    taban = None
+    for etiket, alanlar in [("tam sonuç", None), ("yalın (çekirdek)", ()),
+                            ("yalın + keywords,rules", ("keywords", "rules")),
+                            ("yalın + tüm alanlar", hab.LEAN_RESULT_FIELDS)]:
+        tracemalloc.start()
+        sonuclar, sure = _sessiz(analyzer.analyze_articles, haberler, alanlar)
+        bellek = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        json_boyut = sum(len(json.dumps(sonuc, ensure_ascii=False, separators=(",", ":"),
+                                        default=hab._json_default).encode("utf-8")) for sonuc in sonuclar)
+        pickle_boyut = sum(len(pickle.dumps(sonuc)) for sonuc in sonuclar)
+        taban = taban or json_boyut
+        print(f"{etiket:24s}: bellek {bellek / args.haber:7.0f} B/haber, JSON {json_boyut / args.haber:6.0f} B/haber "
+              f"(%{json_boyut / taban * 100:5.1f}), pickle {pickle_boyut / args.haber:6.0f} B/haber")
+        if alanlar is not None and not alanlar:
+            ozet, t_ozet = _sessiz(lambda: [analyzer.render_summary(sonuc) for sonuc in sonuclar])
+            print(f"{'':24s}  istenince özet: {t_ozet / args.haber * 1e6:5.1f} µs/haber")
+
+
+def naif_kural_uygula(analyzer, found, keywords, finansal, kelime_kurallari):
+    """Eski yöntem: her kural için anahtar kelimelerini ve tüm kategori kelimelerini tek tek dolaş."""
+    matcher = analyzer.nlp_analyzer.matcher
+    tetiklenen = {}
+    for kural_id, kural in analyzer.decision_rules.items():
+        kelimeler = [kelime for kelime in kural["keywords"] if kelime in found]
+        for kategori_kelimeleri in keywords.get("category_keywords", {}).values():
+            for kelime in kategori_kelimeleri:
+                kurallar = kelime_kurallari.get(kelime)
+                if kurallar is None:
+                    kurallar = {ad for desen in matcher.found(kelime.lower())
+                                for tur, ad in matcher.tags[desen] if tur == "rule"}
+                    kelime_kurallari[kelime] = kurallar
+                if kural_id in kurallar:
+                    kelimeler.append(kelime)
+        esik = kural.get("min_percentage")
+        if esik is not None:
+            yuksek = [p for p in finansal.get("percentages", []) if p > esik]
+            if yuksek:
+                kelimeler.append(f"Yüksek oranlar: {yuksek}")
+        if kelimeler:
+            tetiklenen[kural_id] = kelimeler
+    return tetiklenen
+
+
+def sentetik_kurallar(sayi: int, sozluk, oran: float, tohum: int = 0) -> Dict:
+    """Gerçek K1–K6 kurallarına uydurma kelimelerden oluşan sentetik kurallar ekle; kuralların
+    'oran' kadarı sözlükten bir kelime de içerir ve haberlerde tetiklenebilir."""
+    rng = random.Random(tohum)
+    kurallar = dict(hab.load_rule_config()[1])
+    for i in range(sayi - len(kurallar)):
+        kelimeler = [f"sentetik{i}x{j}" for j in range(rng.randint(2, 8))]
+        if rng.random() < oran:
+            kelimeler.insert(0, rng.choice(sozluk))
+        kurallar[f"S{i:04d}"] = {"name": f"Sentetik kural {i}", "keywords": kelimeler,
+                                 "score": rng.choice([-2, -1, 1, 2]), "description": "Ölçüm için üretildi"}
+    return kurallar
+
+
+def bench_kurallar(args):
+    """Derlenmiş kural dizini ile kural başına döngünün kural sayısına göre süresi ve yeniden yükleme."""
+    haberler = [uzun_makale(args.kb, i) for i in range(args.haber)]
+    with tempfile.TemporaryDirectory() as dizin:
+        yol = os.path.join(dizin, "kurallar.json")
+        sozluk = sorted({kelime for kelimeler in hab.load_nlp_resources()["keyword_categories"].values()
+                         for kelime in kelimeler})
+        for sayi in (int(k) for k in args.kurallar.split(",")):
+            kurallar = sentetik_kurallar(sayi, sozluk, args.oran)
+            with open(yol, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "rules": kurallar}, f, ensure_ascii=False)
+            analyzer, _ = _sessiz(hab.ImprovedHousingNewsAnalyzer, rules_path=yol)
+            nlp = analyzer.nlp_analyzer
+            girdiler = []
+            for metin in haberler:
+                doc = nlp.document(metin)
+                girdiler.append((doc, nlp.extract_keywords(doc), nlp.extract_financial_entities(doc)))
+            index = analyzer.rule_index
+            kelime_kurallari = {}
+
+            def naif():
+                return [naif_kural_uygula(analyzer, doc.hits, kw, fin, kelime_kurallari) for doc, kw, fin in girdiler]
+
+            def dizinli():
+                return [index.evaluate(doc.hits, kw["category_keywords"], fin["percentages"])
+                        for doc, kw, fin in girdiler]
+
+            naif(), dizinli()  # kelime -> kural önbelleklerini ısıt
+            sonuc_naif, t_naif = _sessiz(naif)
+            sonuc_dizin, t_dizin = _sessiz(dizinli)
+            _, t_tam = _sessiz(analyzer.apply_decision_rules_batch, *zip(*girdiler))
+            ayni = [{kural_id: list(dict.fromkeys(kelimeler)) for kural_id, kelimeler in tetiklenen.items()}
+                    for tetiklenen in sonuc_naif] == sonuc_dizin
+            tekrar = sum(len(k) - len(set(k)) for tetiklenen in sonuc_naif for k in tetiklenen.values())
+            isabet = sum(len(doc.hits) for doc, _, _ in girdiler) / len(girdiler)
+            tetik = sum(map(len, sonuc_dizin)) / len(girdiler)
+            print(f"{sayi:5d} kural: kural başına {t_naif / len(haberler) * 1e3:7.3f} ms/haber, "
+                  f"dizin {t_dizin / len(haberler) * 1e3:6.3f} ms/haber ({t_naif / t_dizin:5.1f}x), "
+                  f"puan+ayrıntı dahil {t_tam / len(haberler) * 1e3:6.3f} ms/haber  "
+                  f"isabet {isabet:.0f}, tetiklenen {tetik:.1f}/haber, eski tekrar {tekrar}  "
+                  f"aynı sonuç (tekrarsız): {'evet' if ayni else 'HAYIR'}")
+
+            # Yapılandırma değişince analizci yeniden başlatılmadan kuralları yeniden derler
+            kurallar["K1"] = dict(kurallar["K1"], score=kurallar["K1"]["score"] + 1)
+            with open(yol, "w", encoding="utf-8") as f:
+                json.dump({"version": 2, "rules": kurallar}, f, ensure_ascii=False)
+            yuklendi, t_yukle = _sessiz(analyzer.reload_rules)
+            print(f"{'':12s}yeniden yükleme: {t_yukle * 1e3:6.1f} ms, "
+                  f"{'sürüm ' + str(analyzer.rules_version) if yuklendi else 'YÜKLENMEDİ'}")
+
+
+DEPO_SORGULARI = [
+    ("Kadıköy + KFE + negatif, son 90 gün", {"district": "Kadıköy", "keyword": "kfe", "sentiment": "negatif", "days": 90}),
+    ("K4 tetiklenen, son 30 gün", {"rule": "K4", "days": 30}),
+    ("Sarıyer, tüm tarihler", {"district": "Sarıyer"}),
+    ("pozitif, son 7 gün", {"sentiment": "pozitif", "days": 7}),
+    ("son 365 günün ilk 50'si", {"days": 365, "limit": 50}),
+]
+
+# İlçe ayıklamanın kişi ve cins adlarını ilçe saymadığını gösteren örnekler
+ILCE_ORNEKLERI = [
+    ("TCMB Başkanı Fatih Karahan faiz kararını açıkladı; Kartal kulübü ve Adalar Denizi", []),
+    ("Kadıköy'de kiralar arttı, KADIKÖY'DEKİ satışlar geriledi", ["kadıköy"]),
+    ("Fatih'te ve Kartal Belediyesi sınırlarında, Tuzla sahilinde konut", ["fatih", "kartal", "tuzla"]),
+    ("Maltepe ilçesinde ve Üsküdar'da talep; kartallar ve Esenyurtlu alıcılar", ["maltepe", "üsküdar"]),
+]
+
+
+AYLAR = ("Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran", "Temmuz",
+         "Ağustos", "Eylül", "Ekim", "Kasım", "Aralık")
+GUNLER = ("Pazartesi", "Salı", "Çarşamba", "Perşembe", "Cuma", "Cumartesi", "Pazar")
+
+
+def site_tarihi(tarih: datetime) -> str:
+    """Sitedeki giriş tarihi biçimi: '16 Ekim 2025, Perşembe 10:04'."""
+    return (f"{tarih.day} {AYLAR[tarih.month - 1]} {tarih.year}, "
+            f"{GUNLER[tarih.weekday()]} {tarih:%H:%M}")
+
+
+def depo_haberleri(sayi: int, ornekler, sonuclar, gun: int, tohum: int = 0):
+    """Analiz edilmiş örnekleri farklı URL, tarih ve ilçelerle çoğaltarak (haber, sonuç) üret."""
+    rng = random.Random(tohum)
+    ilceler = [ilce.title() for ilce in hab.load_nlp_resources()["istanbul_districts"]]
+    bugun = datetime.now()
+    for i in range(sayi):
+        j = i % len(ornekler)
+        tarih = site_tarihi(bugun - timedelta(days=rng.randrange(gun), minutes=rng.randrange(1440)))
+        giris = " ".join(f"{ilce} bölgesinde satışlar izleniyor." for ilce in rng.sample(ilceler, rng.randint(0, 2)))
+        haber = dict(ornekler[j], text=f"{giris} {ornekler[j]['text']}", giris=f"Giriş: {tarih}",
+                     url=f"{hab.BASE_URL}/depo-{i}")
+        yield haber, sonuclar[j]
+
+
+def bench_depo(args):
+    """Haber deposuna toplu ve tek tek yazma hızı, dizinli sorguların süresi."""
+    ornekler = [{"title": f"Konut piyasası raporu {i}", "text": uzun_makale(args.kb, i)} for i in range(args.ornek)]
+    analyzer, _ = _sessiz(hab.ImprovedHousingNewsAnalyzer)
+    sonuclar, _ = _sessiz(analyzer.analyze_articles, ornekler)
+    with tempfile.TemporaryDirectory() as dizin:
+        tekli = hab.NewsAnalysisStore(os.path.join(dizin, "tekli.sqlite"))
+        haberler = list(depo_haberleri(args.tekli, ornekler, sonuclar, args.gun))
+        _, t_tekli = _sessiz(lambda: [tekli.add(haber, sonuc) for haber, sonuc in haberler])
+        tekli.close()
+
+        yol = os.path.join(dizin, "depo.sqlite")
+        depo = hab.NewsAnalysisStore(yol, batch_size=args.parti)
+        _, t_toplu = _sessiz(depo.add_many, depo_haberleri(args.haber, ornekler, sonuclar, args.gun))
+        print(f"Yazma: tek tek {args.tekli / t_tekli:7.0f} haber/sn, {args.parti}'lik işlemlerle "
+              f"{args.haber / t_toplu:7.0f} haber/sn ({args.haber} haber, {t_toplu:.1f} sn)")
+        print(f"Depo boyutu: {os.path.getsize(yol) / 2 ** 20:.1f} MB ({os.path.getsize(yol) / args.haber:.0f} B/haber)")
+        # Fixture sayfasından crawler'ın çıkardığı giriş tarihi gerçek site biçimindedir
+        giris = hab.extract_article(BeautifulSoup(ornek_haber_html(0), "html.parser"),
+                                    {"url": f"{hab.BASE_URL}/haber/0", "title": ""})["giris"]
+        tarihli = depo.query(days=args.gun + 1)
+        print(f"Tarih çözümü: fixture '{giris}' -> {hab.parse_publish_date(giris)}, "
+              f"tarihi çözülen haber {len(tarihli)}/{args.haber}")
+        dogru = sum(hab.extract_districts(metin) == beklenen for metin, beklenen in ILCE_ORNEKLERI)
+        print(f"İlçe ayıklama: {dogru}/{len(ILCE_ORNEKLERI)} örnek beklendiği gibi")
+
+        for etiket, filtre in DEPO_SORGULARI:
+            for sonuclu in (False, True):
+                sureler = []
+                for _ in range(args.tekrar):
+                    bulunan, sure = _sessiz(depo.query, results=sonuclu, **filtre)
+                    sureler.append(sure)
+                print(f"{etiket:36s} {'sonuçlarla' if sonuclu else 'yalnız dizin':12s}: "
+                      f"{len(bulunan):6d} haber, medyan {statistics.median(sureler) * 1e3:7.2f} ms")
+        print(depo.report())
+        depo.close()
+
+
+def iklim_yeniden_hesapla(depo, ilce: str, gun: int) -> Dict:
+    """Pencere özetini saklanan haberlerden bastan hesapla (toplamlar olmadan yapılacak iş)."""
+    bugun = datetime.now().date()
+    sql = ("SELECT COUNT(*), SUM(dominant_sentiment = 'pozitif'), SUM(dominant_sentiment = 'negatif'),"
+           " SUM(sentiment_score), SUM(total_score), SUM(percentage_sum), SUM(percentage_count),"
+           " SUM(kfe_sum), SUM(kfe_count) FROM articles WHERE publish_date BETWEEN ? AND ?")
+    params = [(bugun - timedelta(days=gun - 1)).isoformat(), bugun.isoformat()]
+    if ilce != hab.ALL_DISTRICTS:
+        sql += " AND EXISTS (SELECT 1 FROM article_districts WHERE district = ? AND article_id = articles.id)"
+        params.append(hab.turkish_lower(ilce))
+    sayi, pozitif, negatif, duygu, puan, yuzde, yuzde_sayi, kfe, kfe_sayi = depo._conn.execute(sql, params).fetchone()
+    kurallar = dict(depo._conn.execute(
+        "SELECT rule_id, COUNT(*) FROM article_rules JOIN articles ON articles.id = article_id"
+        " WHERE " + sql.split(" WHERE ", 1)[1] + " GROUP BY rule_id", params).fetchall())
+    return {"articles": sayi, "positive": pozitif or 0, "negative": negatif or 0,
+            "avg_score": (puan or 0) / sayi if sayi else 0.0, "rules": kurallar}
+
+
+def bench_iklim(args):
+    """İlçe/gün toplamlarıyla 7/30/90 günlük pencere okuması ile haberlerden yeniden hesaplama."""
+    ornekler = [{"title": f"Konut piyasası raporu {i}", "text": uzun_makale(args.kb, i)} for i in range(args.ornek)]
+    analyzer, _ = _sessiz(hab.ImprovedHousingNewsAnalyzer)
+    sonuclar, _ = _sessiz(analyzer.analyze_articles, ornekler)
+    with tempfile.TemporaryDirectory() as dizin:
+        yol = os.path.join(dizin, "depo.sqlite")
+        depo = hab.NewsAnalysisStore(yol)
+        _, t_yaz = _sessiz(depo.add_many, depo_haberleri(args.haber, ornekler, sonuclar, args.gun))
+        print(f"Yazma (toplamlar dahil): {args.haber / t_yaz:7.0f} haber/sn ({args.haber} haber, {args.gun} güne yayılmış)")
+
+        for ilce in (hab.ALL_DISTRICTS, "Kadıköy", "Sarıyer"):
+            _, t_ilk = _sessiz(depo.climate, ilce)
+            okuma, hesap = [], []
+            for _ in range(args.tekrar):
+                iklim, sure = _sessiz(depo.climate, ilce)
+                okuma.append(sure)
+                bastan = {}
+                for gun in hab.AGGREGATE_WINDOWS:
+                    bastan[gun], sure = _sessiz(iklim_yeniden_hesapla, depo, ilce, gun)
+                    hesap.append(sure)
+            ayni = all(iklim[gun]["articles"] == bastan[gun]["articles"]
+                       and iklim[gun]["negative"] == bastan[gun]["negative"]
+                       and abs(iklim[gun]["avg_score"] - bastan[gun]["avg_score"]) < 1e-9
+                       and {k: v["fired"] for k, v in iklim[gun]["rules"].items()} == bastan[gun]["rules"]
+                       for gun in hab.AGGREGATE_WINDOWS)
+            t_hesap = statistics.median(hesap) * len(hab.AGGREGATE_WINDOWS)
+            print(f"{ilce:8s}: {'/'.join(str(iklim[g]['articles']) for g in hab.AGGREGATE_WINDOWS):>14s} haber  "
+                  f"toplamlardan {statistics.median(okuma) * 1e3:7.3f} ms (ilk yükleme {t_ilk * 1e3:6.1f} ms), "
+                  f"haberlerden {t_hesap * 1e3:8.2f} ms ({t_hesap / statistics.median(okuma):6.0f}x)  "
+                  f"aynı sonuç: {'evet' if ayni else 'HAYIR'}")
+
+        # Yeni haber eklendikçe pencereler yazma sırasında güncellenir
+        ekle = list(depo_haberleri(args.parti, ornekler, sonuclar, 7, tohum=1))
+        ekle = [(dict(haber, url=f"{haber['url']}-yeni"), sonuc) for haber, sonuc in ekle]
+        _, t_ekle = _sessiz(depo.add_many, ekle)
+        _, t_oku = _sessiz(depo.climate)
+        print(f"{len(ekle)} yeni haber: yazma {t_ekle * 1e3:6.1f} ms, ardından okuma {t_oku * 1e3:6.3f} ms")
+
+        # Başka bir bağlantı yazdıysa pencereler günlük sayaçlardan yeniden kurulur
+        diger = hab.NewsAnalysisStore(yol)
+        diger.add_many([(dict(haber, url=f"{haber['url']}-diger"), sonuc) for haber, sonuc in ekle[:10]])
+        diger.close()
+        _, t_yeniden = _sessiz(depo.climate)
+        print(f"Başka süreç yazdıktan sonra okuma (yeniden kurma): {t_yeniden * 1e3:6.1f} ms")
+        depo.close()
+
+
+def derlem_taramali_bm25(haber_tokenlari, i: int, top_n: int = 20) -> Dict:
+    """Belge sıklıklarını her haberde derlemi baştan tarayarak bulan BM25 (karşılaştırma için)."""
+    sayac = hab.Counter()
+    toplam = 0
+    for tokenlar in haber_tokenlari[:i + 1]:
+        sayac.update(set(tokenlar))
+        toplam += len(tokenlar)
+    tablo = hab.DocumentFrequencyTable.__new__(hab.DocumentFrequencyTable)
+    tablo.df, tablo.documents, tablo.total_tokens = sayac, i + 1, toplam
+    tokenlar = haber_tokenlari[i]
+    return tablo.top_terms(hab.Counter(tokenlar), len(tokenlar), top_n)
+
+
+def bench_anahtar(args):
+    """Sıklık, TF-IDF ve BM25 anahtar kelime çıkarımının haber başına süresi ve tablo boyutu."""
+    haberler = [{"title": f"Konut piyasası raporu {i}", "text": uzun_makale(args.kb, i)} for i in range(args.haber)]
+    with tempfile.TemporaryDirectory() as dizin:
+        for puanlama in hab.KEYWORD_SCORING_MODES:
+            tablo = None if puanlama == "frequency" else hab.DocumentFrequencyTable(
+                os.path.join(dizin, f"{puanlama}.sqlite"))
+            nlp = hab.ImprovedTurkishNLPAnalyzer(tablo, puanlama)
+            belgeler = [nlp.document(haber["text"]) for haber in haberler]
+            for belge in belgeler:
+                belge.tokens, belge.hits  # token ve eşleşmeler ölçüme katılmaz
+            anahtarlar = [hab.content_hash(haber) for haber in haberler]
+            sonuclar, sure = _sessiz(lambda: [nlp.extract_keywords(belge, document_key=anahtar)
+                                             for belge, anahtar in zip(belgeler, anahtarlar)])
+            boyut = ""
+            if tablo is not None:
+                tablo.close()
+                bayt = os.path.getsize(tablo.path)
+                boyut = f"  tablo {bayt / 2 ** 10:7.0f} KB ({len(tablo)} terim, {bayt / args.haber:.0f} B/haber)"
+            print(f"{puanlama:9s}: {sure / args.haber * 1e3:6.3f} ms/haber{boyut}")
+            print(f"{'':11s}ilk kelimeler: {', '.join(list(sonuclar[-1]['top_keywords'])[:8])}")
+
+        # Belge sıklıklarını her haberde derlemden yeniden hesaplamak derlem boyutuyla büyür
+        haber_tokenlari = [belge.tokens for belge in belgeler]
+        for i in sorted({args.haber // 10, args.haber // 2, args.haber - 1}):
+            _, sure = _sessiz(derlem_taramali_bm25, haber_tokenlari, i)
+            print(f"derlem taramalı BM25, {i + 1:6d}. haber: {sure * 1e3:8.2f} ms")
+
+
+def kopya_derlemi(tekil: int, kopya_orani: float, boyut_kb: int, degisim: float, tohum: int = 0):
+    """Tekil haberler ve yeniden başlıklandırılmış, kelimeleri az değiştirilmiş kopyaları.
+
+    (haber, asıl haber no) listesi döner; her haberin kopya sayısı
+    geometriktir (ortalama kopya_orani / (1 - kopya_orani)).
+    """
+    rng = random.Random(tohum)
+    sozluk = sorted({kelime for cumle in PARAGRAFLAR + EK_CUMLELER for kelime in cumle.split()})
+    kelime_sayisi = boyut_kb * 1024 // 8
+    derlem = []
+    for i in range(tekil):
+        kelimeler = [rng.choice(sozluk) for _ in range(kelime_sayisi)]
+        derlem.append(({"title": f"Konut piyasası raporu {i}", "text": " ".join(kelimeler),
+                        "url": f"{hab.BASE_URL}/kopya-{i}"}, i))
+        j = 0
+        while rng.random() < kopya_orani and j < 8:
+            j += 1
+            kopya = list(kelimeler)
+            for _ in range(max(1, int(len(kopya) * degisim))):
+                kopya[rng.randrange(len(kopya))] = rng.choice(sozluk)
+            if rng.random() < 0.5:
+                kopya = kopya[:len(kopya) - len(kopya) // 20]
+            derlem.append(({"title": f"Ajans {j}: konut piyasası {i}", "text": f"Kaynak: Ajans {j}. " + " ".join(kopya),
+                            "url": f"{hab.BASE_URL}/kopya-{i}-{j}"}, i))
+    rng.shuffle(derlem)
+    return derlem
+
+
+def _cift_isabeti(kumeler, gercek):
+    """Aynı kümeye düşen haber çiftlerinin kesinlik ve duyarlılığı."""
+    def ciftler(etiketler):
+        gruplar = {}
+        for i, etiket in enumerate(etiketler):
+            gruplar.setdefault(etiket, []).append(i)
+        return {(a, b) for grup in gruplar.values() for k, a in enumerate(grup) for b in grup[k + 1:]}
+    bulunan, dogru = ciftler(kumeler), ciftler(gercek)
+    ortak = len(bulunan & dogru)
+    return (ortak / len(bulunan) if bulunan else 1.0), (ortak / len(dogru) if dogru else 1.0)
+
+
+def bench_kopya(args):
+    """MinHash/LSH yakın kopya kümelemesinin hızı, doğruluğu ve analize etkisi."""
+    derlem = kopya_derlemi(args.tekil, args.kopya, args.kb, args.degisim)
+    haberler = [haber for haber, _ in derlem]
+    gercek = [asil for _, asil in derlem]
+    print(f"Derlem: {len(haberler)} haber, {args.tekil} asıl haber, {args.kb} KB, kelime değişimi %{args.degisim * 100:.0f}")
+    with tempfile.TemporaryDirectory() as dizin:
+        for esik in [float(e) for e in args.esikler.split(",")]:
+            dizinleyici = hab.NearDuplicateIndex(os.path.join(dizin, f"kopya-{esik}.sqlite"), esik)
+            anahtarlar = [hab.content_hash(haber) for haber in haberler]
+            baslangic = time.perf_counter()
+            kumeler = [dizinleyici.assign(anahtar, haber["text"])[0] for anahtar, haber in zip(anahtarlar, haberler)]
+            sure = time.perf_counter() - baslangic
+            kesinlik, duyarlilik = _cift_isabeti(kumeler, gercek)
+            print(f"eşik {esik:.2f}: {len(haberler) / sure:7.0f} haber/sn, {len(dizinleyici):6d} küme, "
+                  f"çift kesinliği %{kesinlik * 100:5.1f}, duyarlılığı %{duyarlilik * 100:5.1f}  "
+                  f"({dizinleyici.bands} bant x {dizinleyici.rows} satır, "
+                  f"{dizinleyici.stats['candidates'] / len(haberler):.1f} aday/arama)")
+            dizinleyici.close()
+
+        # Arama süresi: LSH bantları ile tüm imzalarla karşılaştırma, dizin boyutuna göre
+        dizinleyici = hab.NearDuplicateIndex(os.path.join(dizin, "olcek.sqlite"))
+        imzalar = [dizinleyici.signature(haber["text"]) for haber in haberler]
+        _, t_imza = _sessiz(lambda: [dizinleyici.signature(haber["text"]) for haber in haberler[:500]])
+        print(f"İmza: {min(500, len(haberler)) / t_imza:7.0f} haber/sn")
+        olcek = sorted({n for n in (1000, 10000, 50000) if n < len(haberler) - 200} | {len(haberler) - 200})
+        eklenen = 0
+        for boyut in olcek:
+            for i in range(eklenen, boyut):
+                dizinleyici._insert(str(i), imzalar[i], dizinleyici._best_match(imzalar[i]))
+            eklenen = boyut
+            ornek = imzalar[boyut:boyut + 200]
+            _, t_lsh = _sessiz(lambda: [dizinleyici._best_match(imza) for imza in ornek])
+            matris = np.vstack(imzalar[:boyut])
+            _, t_kaba = _sessiz(lambda: [np.count_nonzero(matris == imza, axis=1).argmax() for imza in ornek])
+            print(f"{boyut:7d} imzalı dizinde arama: LSH {t_lsh / len(ornek) * 1e6:7.1f} µs, "
+                  f"tümüyle karşılaştırma {t_kaba / len(ornek) * 1e6:8.1f} µs")
+        dizinleyici.close()
+
+        # Uçtan uca: kümelemeyle her küme bir kez analiz edilir (aynı kopya oranıyla küçük bir derlem)
+        ornek = [haber for haber, _ in kopya_derlemi(args.analiz, args.kopya, args.kb, args.degisim, tohum=1)]
+        analyzer, _ = _sessiz(hab.ImprovedHousingNewsAnalyzer)
+        _, t_tam = _sessiz(lambda: [analyzer.analyze_article(haber) for haber in ornek])
+        kopyali = _sessiz(hab.ImprovedHousingNewsAnalyzer,
+                          near_duplicates=hab.NearDuplicateIndex(os.path.join(dizin, "analiz.sqlite")))[0]
+        sonuclar, t_kume = _sessiz(lambda: [kopyali.analyze_article(haber) for haber in ornek])
+        kopya_sayisi = sum(sonuc["article_info"]["duplicate_of"] is not None for sonuc in sonuclar)
+        print(f"analyze_article, {len(ornek)} haber: kümelemesiz {t_tam / len(ornek) * 1e3:6.2f} ms/haber, "
+              f"kümelemeyle {t_kume / len(ornek) * 1e3:6.2f} ms/haber ({kopya_sayisi} kopya analiz edilmedi)")
+        print(kopyali.near_duplicates.report())
+
+
+BASLATMA_ADIMLARI = {
+    "boş yorumlayıcı": "pass",
+    "import": "import haber_analizi_bloomberght",
+    "ilk analizci": "import haber_analizi_bloomberght as h; h.ImprovedHousingNewsAnalyzer()",
+    "ilk analiz": ("import haber_analizi_bloomberght as h\n"
+                   "h.ImprovedHousingNewsAnalyzer().analyze_article("
+                   "{'title': 'Konut satışları arttı', 'text': 'Prof. Dr. Ali faizin %3,5 düştüğünü söyledi. Talep arttı.'})"),
+    # Eski modülün import anında yaptığı iş: nltk yükle, üç veri paketini indirmeyi dene
+    "eski nltk yükü": ("import nltk\nfrom nltk.corpus import stopwords\n"
+                       "for paket in ('punkt', 'stopwords', 'punkt_tab'):\n"
+                       "    try: nltk.download(paket, quiet=True)\n"
+                       "    except Exception: pass\n"
+                       "set(stopwords.words('turkish'))"),
+}
+
+
+def bench_baslatma(args):
+    """Soğuk süreçte import ve ilk analize kadar geçen süre (her ölçüm yeni bir yorumlayıcıda)."""
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    for ad, kod in BASLATMA_ADIMLARI.items():
+        sureler = []
+        for _ in range(args.tekrar):
+            baslangic = time.perf_counter()
+            sonuc = subprocess.run([sys.executable, "-c", kod], cwd=cwd,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            sureler.append(time.perf_counter() - baslangic)
+            if sonuc.returncode != 0:
+                break
+        if sonuc.returncode != 0:
+            print(f"{ad:16s}: başarısız (çıkış kodu {sonuc.returncode})")
+            continue
+        print(f"{ad:16s}: medyan {statistics.median(sureler):6.3f} sn, en iyi {min(sureler):6.3f} sn")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Haber analizi performans ölçümleri")
+    sub = parser.add_subparsers(dest="olcum", required=True)
+
+    p = sub.add_parser("crawl", help="Sıralı ve async crawl'u fixture sunucuya karşı karşılaştır")
+    p.add_argument("--haber", type=int, default=12, help="Listedeki konut haberi sayısı")
+    p.add_argument("--gecikme", type=float, default=0.2, help="Sunucu yanıt gecikmesi (sn)")
+    p.add_argument("--sonuc", type=int, default=3, help="max_results")
+    p.add_argument("--eszamanli", type=int, default=8, help="Async modda uçuştaki istek sayısı")
+    p.add_argument("--host-limiti", type=int, default=4, help="Host başına eşzamanlı istek")
+    p.add_argument("--hiz", type=float, default=8.0, help="Host başına istek/sn sınırı")
+    p.add_argument("--patlama", type=int, default=2, help="Token bucket patlama kapasitesi")
+    p.set_defaults(func=bench_crawl)
+
+    p = sub.add_parser("http-cache", help="Kalıcı HTTP önbelleğinin ardışık crawl'lara etkisi")
+    p.add_argument("--haber", type=int, default=12, help="Listedeki konut haberi sayısı")
+    p.add_argument("--gecikme", type=float, default=0.2, help="Sunucu yanıt gecikmesi (sn)")
+    p.add_argument("--sonuc", type=int, default=3, help="max_results")
+    p.set_defaults(func=bench_http_cache)
+
+    p = sub.add_parser("artimli", help="Artımlı crawl'un tekrar çalıştırma maliyeti")
+    p.add_argument("--haber", type=int, default=12, help="Listedeki konut haberi sayısı")
+    p.add_argument("--gecikme", type=float, default=0.2, help="Sunucu yanıt gecikmesi (sn)")
+    p.add_argument("--sonuc", type=int, default=20, help="max_results")
+    p.set_defaults(func=bench_artimli)
+
+    p = sub.add_parser("hiz-siniri", help="Token bucket sınırlayıcının isabeti ve 429 tepkisi")
+    p.add_argument("--istek", type=int, default=200, help="Toplam istek sayısı")
+    p.add_argument("--thread", type=int, default=16, help="Paralel istemci sayısı")
+    p.add_argument("--hiz", type=float, default=20.0, help="Host başına istek/sn sınırı")
+    p.add_argument("--patlama", type=int, default=5, help="Token bucket patlama kapasitesi")
+    p.add_argument("--gecikme", type=float, default=0.05, help="Sunucu yanıt gecikmesi (sn)")
+    p.add_argument("--kisitla-her", type=int, default=0, help="Her N istekte bir 429 döndür")
+    p.add_argument("--retry-tarihi", action="store_true", help="429'larda Retry-After'ı HTTP tarihi olarak gönder")
+    p.add_argument("--aralik", type=float, default=0.0, help="Host için istekler arası en az süre (delay_seconds)")
+    p.set_defaults(func=bench_hiz_siniri)
+
+    p = sub.add_parser("parse", help="Tam ağaç ile kısıtlı parse yolunun süre ve çıktı karşılaştırması")
+    p.add_argument("--sayfa", type=int, default=40, help="Üretilecek ağır haber sayfası sayısı")
+    p.add_argument("--dizin", help="Üretmek yerine bu dizindeki *.html dosyalarını kullan")
+    p.set_defaults(func=bench_parse)
+
+    p = sub.add_parser("akis", help="Toplu ve akış (generator/async) analizde ilk sonuca kadar geçen süre")
+    p.add_argument("--haber", type=int, default=12, help="Listedeki konut haberi sayısı")
+    p.add_argument("--gecikme", type=float, default=0.2, help="Sunucu yanıt gecikmesi (sn)")
+    p.add_argument("--sonuc", type=int, default=5, help="max_results")
+    p.add_argument("--kuyruk", type=int, default=hab.STREAM_QUEUE_SIZE, help="Async akış kuyruk boyu")
+    p.add_argument("--hiz", type=float, default=20.0, help="Host başına istek/sn sınırı")
+    p.add_argument("--patlama", type=int, default=5, help="Token bucket patlama kapasitesi")
+    p.set_defaults(func=bench_akis)
+
+    p = sub.add_parser("kaynaklar", help="Çoklu haber kaynağının eşzamanlı çekilmesi ve zaman aşımı")
+    p.add_argument("--gecikmeler", default="0.1,0.2,0.3,0.4,0.6",
+                   help="Kaynak başına sunucu gecikmesi (sn, virgülle ayrılmış)")
+    p.add_argument("--zaman-asimi", type=float, default=1.0, help="Kaynak başına zaman aşımı (sn)")
+    p.add_argument("--haber", type=int, default=8, help="Kaynak başına haber sayısı")
+    p.set_defaults(func=bench_kaynaklar)
+
+    p = sub.add_parser("arsiv", help="HTTP arşivine kayıt ve ağsız oynatma ile crawl / NLP ölçümü")
+    p.add_argument("--haber", type=int, default=12, help="Listedeki konut haberi sayısı")
+    p.add_argument("--gecikme", type=float, default=0.2, help="Sunucu yanıt gecikmesi (sn)")
+    p.add_argument("--sonuc", type=int, default=5, help="max_results")
+    p.add_argument("--oynat", help="Kayıt yapmadan bu arşivi oynat")
+    p.add_argument("--base-url", default=hab.BASE_URL, help="--oynat ile kullanılacak site adresi")
+    p.add_argument("--tekrar", type=int, default=20, help="NLP ölçümünde haber listesi tekrar sayısı")
+    p.set_defaults(func=bench_arsiv)
+
+    p = sub.add_parser("eslesme", help="Aho–Corasick ve desen başına anahtar kelime aramasının hızı")
+    p.add_argument("--kb", default="10,100,500", help="Makale boyutları (KB, virgülle ayrılmış)")
+    p.set_defaults(func=bench_eslesme)
+
+    p = sub.add_parser("finansal", help="Tek geçişli finansal tarayıcı ile desen başına findall karşılaştırması")
+    p.add_argument("--kb", default="10,100,1000", help="Makale boyutları (KB, virgülle ayrılmış)")
+    p.add_argument("--kotu", type=int, default=20000, help="Kötü durum girdilerinde tekrar sayısı")
+    p.set_defaults(func=bench_finansal)
+
+    p = sub.add_parser("ozellik", help="KFE özellik çıkarımının metin uzunluğuna göre süresi")
+    p.add_argument("--kb", default="2,10,100,1000", help="Metin boyutları (KB, virgülle ayrılmış)")
+    p.add_argument("--naif-sinir", type=int, default=2,
+                   help="Kötü durum girdilerinde eski regex yalnızca bu boyuta (KB) kadar ölçülür")
+    p.set_defaults(func=bench_ozellik)
+
+    p = sub.add_parser("belge", help="Paylaşılan AnalyzedDocument ile haber başına NLP CPU süresi")
+    p.add_argument("--kb", default="2,10,50", help="Makale boyutları (KB, virgülle ayrılmış)")
+    p.add_argument("--haber", type=int, default=20, help="Boyut başına haber sayısı")
+    p.set_defaults(func=bench_belge)
+
+    p = sub.add_parser("toplu", help="analyze_articles ile arşiv boyutunda toplu analiz")
+    p.add_argument("--haber", type=int, default=2000, help="Haber sayısı")
+    p.add_argument("--kb", type=int, default=3, help="Haber başına metin boyutu (KB)")
+    p.set_defaults(func=bench_toplu)
+
+    p = sub.add_parser("paralel", help="Süreç havuzuyla paralel analizin çekirdek sayısına göre ölçeklenmesi")
+    p.add_argument("--haber", type=int, default=2000, help="Haber sayısı")
+    p.add_argument("--kb", type=int, default=3, help="Haber başına metin boyutu (KB)")
+    p.add_argument("--surecler", default=",".join(str(2 ** i) for i in range((os.cpu_count() or 1).bit_length())),
+                   help="Denenecek süreç sayıları (virgülle ayrılmış)")
+    p.add_argument("--parca", type=int, default=hab.ANALYSIS_CHUNK_SIZE, help="İşçiye tek seferde giden haber sayısı")
+    p.set_defaults(func=bench_paralel)
+
+    p = sub.add_parser("onbellek", help="İçerik özetli analiz önbelleğinin bellek ve disk katmanları")
+    p.add_argument("--haber", type=int, default=200, help="Haber sayısı")
+    p.add_argument("--kb", type=int, default=3, help="Haber başına metin boyutu (KB)")
+    p.add_argument("--bellek", type=int, default=hab.ANALYSIS_CACHE_SIZE, help="Bellek katmanındaki en fazla sonuç")
+    p.set_defaults(func=bench_onbellek)
+
+    p = sub.add_parser("tokenizer", help="Regex Türkçe tokenizer ile NLTK punkt'un hız ve bölme karşılaştırması")
+    p.add_argument("--korpus", help="Metin korpusu (JSON satırları, .gz olabilir); yoksa üretilip buraya kaydedilir")
+    p.add_argument("--haber", type=int, default=500, help="Üretilecek metin sayısı")
+    p.add_argument("--kb", type=int, default=3, help="Üretilen metin başına boyut (KB)")
+    p.set_defaults(func=bench_tokenizer)
+
+    p = sub.add_parser("jsonl", help="JSONL arşiv CLI'ının arşiv boyutuna göre hızı, belleği ve çökme sonrası devamı")
+    p.add_argument("--haber", default="1000,10000", help="Arşiv boyutları (haber, virgülle ayrılmış)")
+    p.add_argument("--kb", type=int, default=1, help="Haber başına metin boyutu (KB)")
+    p.add_argument("--kes", type=float, default=3.0, help="Son arşivde CLI'ı bu kadar saniye sonra öldür (0: kapalı)")
+    p.set_defaults(func=bench_jsonl)
+
+    p = sub.add_parser("yalin", help="Tam ve yalın (alan maskeli) analiz sonucunun bellek ve serileştirme boyutu")
+    p.add_argument("--haber", type=int, default=500, help="Haber sayısı")
+    p.add_argument("--kb", type=int, default=3, help="Haber başına metin boyutu (KB)")
+    p.set_defaults(func=bench_yalin)
+
+    p = sub.add_parser("kurallar", help="Derlenmiş kural dizininin yüzlerce sentetik kuralla hızı ve yeniden yüklenmesi")
+    p.add_argument("--kurallar", default="6,100,300,1000", help="Kural sayıları (virgülle ayrılmış)")
+    p.add_argument("--oran", type=float, default=0.1, help="Sözlük kelimesi içeren sentetik kural oranı")
+    p.add_argument("--haber", type=int, default=200, help="Haber sayısı")
+    p.add_argument("--kb", type=int, default=3, help="Haber başına metin boyutu (KB)")
+    p.set_defaults(func=bench_kurallar)
+
+    p = sub.add_parser("depo", help="SQLite haber deposuna yazma hızı ve tarih/ilçe/kural/duygu sorgularının süresi")
+    p.add_argument("--haber", type=int, default=20000, help="Depoya yazılacak haber sayısı")
+    p.add_argument("--ornek", type=int, default=200, help="Analiz edilip çoğaltılacak farklı haber sayısı")
+    p.add_argument("--kb", type=int, default=3, help="Haber başına metin boyutu (KB)")
+    p.add_argument("--gun", type=int, default=730, help="Yayın tarihlerinin yayıldığı gün sayısı")
+    p.add_argument("--parti", type=int, default=hab.NEWS_STORE_BATCH, help="Tek işlemde yazılan haber sayısı")
+    p.add_argument("--tekli", type=int, default=500, help="Tek tek yazma ölçümündeki haber sayısı")
+    p.add_argument("--tekrar", type=int, default=5, help="Sorgu başına tekrar sayısı")
+    p.set_defaults(func=bench_depo)
+
+    p = sub.add_parser("iklim", help="İlçe/gün toplamlarından 7/30/90 günlük pencere okuması ile yeniden hesaplama")
+    p.add_argument("--haber", type=int, default=20000, help="Depoya yazılacak haber sayısı")
+    p.add_argument("--ornek", type=int, default=200, help="Analiz edilip çoğaltılacak farklı haber sayısı")
+    p.add_argument("--kb", type=int, default=3, help="Haber başına metin boyutu (KB)")
+    p.add_argument("--gun", type=int, default=365, help="Yayın tarihlerinin yayıldığı gün sayısı")
+    p.add_argument("--parti", type=int, default=hab.NEWS_STORE_BATCH, help="Sonradan eklenen haber sayısı")
+    p.add_argument("--tekrar", type=int, default=5, help="Okuma başına tekrar sayısı")
+    p.set_defaults(func=bench_iklim)
+
+    p = sub.add_parser("anahtar", help="Sıklık, TF-IDF ve BM25 anahtar kelime çıkarımı ile belge sıklığı tablosu")
+    p.add_argument("--haber", type=int, default=5000, help="Analiz edilecek haber sayısı")
+    p.add_argument("--kb", type=int, default=3, help="Haber başına metin boyutu (KB)")
+    p.set_defaults(func=bench_anahtar)
+
+    p = sub.add_parser("kopya", help="MinHash/LSH yakın kopya kümelemesinin hızı, doğruluğu ve analize etkisi")
+    p.add_argument("--tekil", type=int, default=20000, help="Asıl (kopyası olmayan) haber sayısı")
+    p.add_argument("--kopya", type=float, default=0.5, help="Her haberin bir kopya daha alma olasılığı")
+    p.add_argument("--kb", type=int, default=2, help="Haber başına metin boyutu (KB)")
+    p.add_argument("--degisim", type=float, default=0.01, help="Kopyada değiştirilen kelime oranı")
+    p.add_argument("--esikler", default="0.6,0.8,0.9", help="Virgülle ayrılmış benzerlik eşikleri")
+    p.add_argument("--analiz", type=int, default=1000, help="Uçtan uca analizdeki asıl haber sayısı")
+    p.set_defaults(func=bench_kopya)
+
+    p = sub.add_parser("baslatma", help="Ağsız NLP paketiyle import ve ilk analiz süresi, eski nltk yüküyle karşılaştırma")
+    p.add_argument("--tekrar", type=int, default=5, help="Adım başına soğuk süreç sayısı")
+    p.set_defaults(func=bench_baslatma)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
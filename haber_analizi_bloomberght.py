@@ -1,19 +1,54 @@
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from bs4 import BeautifulSoup, SoupStrainer
+from urllib.parse import urljoin, urlparse
+from html import unescape as html_unescape
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from contextlib import asynccontextmanager, redirect_stdout, suppress
+import os
+import sys
 import time
+import random
+import math
+import heapq
 import re
-from collections import Counter
-import nltk
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.corpus import stopwords
+from collections import Counter, OrderedDict, deque
+from array import array
+from bisect import bisect_right
+from functools import partial
+from itertools import islice
+import threading
+import sqlite3
+import hashlib
+import gzip
+import zlib
+import pickle
+import argparse
 import numpy as np
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import warnings
-from typing import List, Dict, Tuple, Optional
+from typing import (List, Dict, Tuple, Optional, Callable, Awaitable, Any, Union,
+                    Iterable, Iterator, AsyncIterable, AsyncIterator)
 import json
 warnings.filterwarnings('ignore')
 
+# lxml kuruluysa hızlı parse yolu kullanılır, değilse html.parser ile tam ağaç kurulur
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Toplu analizde doküman-terim matrisleri scipy.sparse ile kurulur; scipy yoksa
+# haberler tek tek analiz edilir
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
 # ==================== BLOOMBERGHT CRAWLER KODU ====================
 
 BASE_URL = "https://www.bloomberght.com"
@@ -42,24 +77,730 @@ COUNTRY_CITY_KEYWORDS = [
     "Türkiye Cumhuriyet Merkez Bankası (TCMB)"
 ]
 
-def fetch_listing_html():
-    resp = requests.get(NEWS_LIST_URL, headers=HEADERS, timeout=10)
-    resp.raise_for_status()
-    return resp.text
+# Bağlantı havuzu ve zaman aşımı
+HTTP_POOL_SIZE = 10
+HTTP_TIMEOUT = 10
+
+# Ön kontrolde en fazla kaç ilgili haber linki tutulacağı
+PREFILTER_LIMIT = 10
+
+# Bir crawl boyunca bellekte tutulacak en fazla haber sayfası
+DOCUMENT_CACHE_SIZE = 32
+
+# Async akışta tüketiciyi bekleyen en fazla haber sayısı
+STREAM_QUEUE_SIZE = 4
+
+# Paralel analizde bir işçi sürecine tek seferde gönderilen haber sayısı
+ANALYSIS_CHUNK_SIZE = 16
+
+# JSONL arşiv analizinde çıktının kaç sonuçta bir diske yazılacağı ve
+# ilerleme hızının kaç saniyede bir raporlanacağı
+JSONL_FLUSH_EVERY = 100
+PROGRESS_INTERVAL = 10.0
+
+# Hızlı parse yolunda kurulacak kısıtlı ağaçlar: liste sayfasında sadece linkler,
+# haberde sadece başlık ve paragraflar (giriş tarihi ağaçsız metinden okunur)
+LISTING_STRAINER = SoupStrainer("a")
+ARTICLE_STRAINER = SoupStrainer(["h1", "p"])
+
+# Kalıcı HTTP önbelleği: dosya yolu ve ağa hiç çıkılmayacak tazelik süresi (sn)
+HTTP_CACHE_PATH = "http_cache.sqlite"
+HTTP_CACHE_TTL = 15 * 60
+
+# Host başına varsayılan hız sınırı (istek/sn), patlama kapasitesi ve yeniden deneme sayısı
+RATE_LIMIT_PER_SECOND = 1.5
+RATE_LIMIT_BURST = 2
+HTTP_MAX_RETRIES = 3
+
+# Artımlı crawl dizini ve görülmüş bir haberin yeniden kontrol edilme aralığı (sn)
+SEEN_INDEX_PATH = "crawl_index.sqlite"
+SEEN_RECHECK_AFTER = 24 * 60 * 60
+
+# Record/replay HTTP arşivi (gzip'li JSON satırları)
+HTTP_ARCHIVE_PATH = "http_archive.jsonl.gz"
+
+# Stopword listesi, sözlükler ve cümle bölme kısaltmalarını içeren yerel NLP paketi
+NLP_RESOURCES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "nlp_kaynaklari.json")
+
+# Sürümlü karar kuralı yapılandırması; dosya değişirse çalışan analizci
+# kuralları bir sonraki analizden önce yeniden yükler
+RULES_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "karar_kurallari.json")
+
+# Analiz önbelleği: kalıcı dosya yolu ve bellekte tutulacak en fazla sonuç sayısı.
+# Önbellekteki sonucun biçimi değişirse ANALYSIS_CACHE_FORMAT artırılır.
+ANALYSIS_CACHE_PATH = "analysis_cache.sqlite"
+ANALYSIS_CACHE_SIZE = 256
+ANALYSIS_CACHE_FORMAT = 3
+
+# Anahtar kelime puanlaması: metin içi sıklık ('frequency'), 'tfidf' ya da 'bm25'.
+# TF-IDF/BM25 belge sıklıkları kalıcı tabloda haber geldikçe artımlı güncellenir
+# ve tabloya KEYWORD_STATS_FLUSH haberde bir yazılır
+KEYWORD_SCORING_MODES = ('frequency', 'tfidf', 'bm25')
+KEYWORD_STATS_PATH = "anahtar_kelime_df.sqlite"
+KEYWORD_STATS_FLUSH = 500
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Yakın kopya (yeniden başlıklandırılmış, dağıtılmış) haber tespiti: tahmini
+# Jaccard benzerlik eşiği, MinHash imza uzunluğu, kelime shingle boyu, kalıcı
+# dizin ve kopyaların paylaştığı küme analizlerinin bellekteki en fazla sayısı
+NEAR_DUPLICATE_THRESHOLD = 0.8
+MINHASH_PERMUTATIONS = 128
+SHINGLE_SIZE = 4
+NEAR_DUPLICATE_INDEX_PATH = "yakin_kopya_dizini.sqlite"
+NEAR_DUPLICATE_CACHE_SIZE = 1024
+
+# Analiz edilmiş haberlerin kalıcı, sorgulanabilir deposu ve tek işlemde
+# yazılan en fazla haber sayısı
+NEWS_STORE_PATH = "haber_deposu.sqlite"
+NEWS_STORE_BATCH = 500
+
+# Depo şemasının sürümü (PRAGMA user_version); eski sürümle yazılmış dosyalar
+# açılırken _NEWS_STORE_MIGRATIONS'taki sütunlar eklenerek yükseltilir
+NEWS_STORE_SCHEMA = 3
+
+# Depodaki ilçe/gün toplamlarından okunan kayan pencereler (gün) ve tüm
+# haberlerin toplandığı ilçe adı
+AGGREGATE_WINDOWS = (7, 30, 90)
+ALL_DISTRICTS = "genel"
+
+# Yalın analiz sonucunda alan maskesiyle istenebilecek isteğe bağlı bölümler ve
+# cümle duygularının küçük tamsayı kodları
+LEAN_RESULT_FIELDS = ('keywords', 'financial', 'temporal', 'numerical', 'rules', 'risks', 'features')
+SENTIMENT_CODES = {'pozitif': 1, 'negatif': -1, 'nötr': 0}
+
+# KFE özellik çıkarımında bir ifadenin (çapa kelimeden sayıya) sığması gereken pencere (karakter)
+FEATURE_WINDOW = 300
+
+
+class HttpCache:
+    """SQLite tabanlı kalıcı HTTP yanıt önbelleği.
+
+    Gövdeler ETag ve Last-Modified başlıklarıyla birlikte saklanır. 'ttl_seconds'
+    içindeki kayıtlar ağa çıkmadan döner; daha eski kayıtlar koşullu GET ile
+    doğrulanır ve 304 gelirse saklı gövde kullanılır.
+    """
+
+    def __init__(self, path: str = HTTP_CACHE_PATH, ttl_seconds: float = HTTP_CACHE_TTL):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " url TEXT PRIMARY KEY,"
+                " body TEXT NOT NULL,"
+                " etag TEXT,"
+                " last_modified TEXT,"
+                " fetched_at REAL NOT NULL)"
+            )
+        self.stats = {"fresh_hits": 0, "revalidated": 0, "misses": 0}
+
+    def get(self, url: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"body": row[0], "etag": row[1], "last_modified": row[2], "fetched_at": row[3]}
+
+    def is_fresh(self, entry: Dict) -> bool:
+        return time.time() - entry["fetched_at"] < self.ttl_seconds
+
+    def put(self, url: str, body: str, etag: Optional[str], last_modified: Optional[str]):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, body, etag, last_modified, fetched_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (url, body, etag, last_modified, time.time()),
+            )
+
+    def touch(self, url: str):
+        """304 sonrası kaydın tazelik süresini yenile."""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE responses SET fetched_at = ? WHERE url = ?", (time.time(), url))
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def report(self) -> str:
+        st = self.stats
+        return (f"💾 HTTP önbelleği: {st['fresh_hits']} taze, {st['revalidated']} doğrulandı (304), "
+                f"{st['misses']} indirme")
+
+    def close(self):
+        self._conn.close()
+
+
+class HttpArchive:
+    """Ağ trafiğini kaydedip sonradan ağa çıkmadan yeniden oynatan arşiv.
+
+    mode="record": HttpFetcher'ın ağdan aldığı her yanıt (url, status,
+    headers, body, elapsed) gzip'li JSON satırı olarak dosyaya eklenir.
+    mode="replay": istekler arşivden karşılanır; 'replay_latency' True ise
+    kaydedilen süre kadar beklenir, değilse tam hızda döner. Arşivde olmayan
+    URL'ler bağlantı hatası olarak yükselir. Aynı URL birden fazla kez
+    kaydedildiyse sonuncusu kullanılır.
+    Kayıt sırasında HttpCache'in taze kayıtları ağa çıkmadığından arşive
+    yazılmaz; eksiksiz kayıt için önbelleksiz bir fetcher kullanılmalıdır.
+    """
+
+    def __init__(self, path: str = HTTP_ARCHIVE_PATH, mode: str = "replay",
+                 replay_latency: bool = False):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Geçersiz arşiv modu: {mode}")
+        self.path = path
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = {}
+        self._file = None
+        if mode == "record":
+            self._file = gzip.open(path, "at", encoding="utf-8")
+        else:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    entry = json.loads(line)
+                    self._entries[entry["url"]] = entry
+        self.stats = {"recorded": 0, "replayed": 0, "missing": 0}
+
+    def record(self, url: str, status: int, headers: Dict, body: str, elapsed: float):
+        line = json.dumps({"url": url, "status": status, "headers": dict(headers),
+                           "body": body, "elapsed": elapsed}, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self.stats["recorded"] += 1
+
+    def replay(self, url: str, headers: Optional[Dict] = None) -> requests.Response:
+        """Kaydedilmiş yanıtı requests.Response olarak döndür.
+
+        İstekteki If-None-Match kaydın ETag'iyle eşleşirse 304 üretilir;
+        böylece HttpCache ile birlikte kullanılabilir.
+        """
+        entry = self._entries.get(url)
+        with self._lock:
+            self.stats["missing" if entry is None else "replayed"] += 1
+        if entry is None:
+            raise requests.ConnectionError(f"Arşivde kayıt yok: {url}")
+        if self.replay_latency:
+            time.sleep(entry["elapsed"])
+
+        resp = requests.Response()
+        resp.url = url
+        resp.headers = CaseInsensitiveDict(entry["headers"])
+        resp.encoding = "utf-8"
+        etag = resp.headers.get("ETag")
+        if headers and etag and headers.get("If-None-Match") == etag:
+            resp.status_code = 304
+            resp._content = b""
+        else:
+            resp.status_code = entry["status"]
+            resp._content = entry["body"].encode("utf-8")
+        return resp
+
+    def report(self) -> str:
+        st = self.stats
+        if self.mode == "record":
+            return f"📼 HTTP arşivi ({self.path}): {st['recorded']} yanıt kaydedildi"
+        return (f"📼 HTTP arşivi ({self.path}): {st['replayed']} yanıt oynatıldı, "
+                f"{st['missing']} eksik")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Retry-After başlığını (saniye ya da HTTP tarihi) bekleme süresine çevir."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        until = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if until.tzinfo is None:
+        until = until.replace(tzinfo=timezone.utc)
+    return max(0.0, (until - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucketLimiter:
+    """Host başına token bucket hız sınırlayıcı.
+
+    Her host için kova saniyede 'rate' token dolar ve en fazla 'burst' token
+    biriktirir; her istek bir token harcar. Token yoksa istek, kovanın borcu
+    kapanana kadar bekler, böylece uzun vadede hız hiçbir zaman 'rate'i aşmaz
+    ama isteğin kendisi uzun sürdüyse gereksiz bekleme de olmaz.
+
+    429 / 5xx yanıtlarında hostun hızı yarıya iner (en az 'min_rate') ve
+    Retry-After (saniye ya da HTTP tarihi) varsa o ana kadar istek verilmez;
+    başarılı yanıtlarla hız kademeli olarak hostun üst sınırına geri çıkar.
+    set_min_interval ile bir host için istekler arası en az süre (patlamasız,
+    daha düşük bir üst sınır) konabilir. Yeniden denemeler için jitter'lı
+    üstel bekleme süresi backoff_delay ile hesaplanır. Thread-safe'tir.
+    """
+
+    THROTTLE_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, rate: float = RATE_LIMIT_PER_SECOND, burst: int = RATE_LIMIT_BURST,
+                 min_rate: float = 0.1, backoff_base: float = 1.0, backoff_max: float = 60.0):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Dict] = {}
+        self.stats = {"requests": 0, "waited_seconds": 0.0, "throttled": 0, "retries": 0}
+
+    def _host_state(self, host: str, now: float) -> Dict:
+        state = self._hosts.get(host)
+        if state is None:
+            state = {"tokens": float(self.burst), "updated": now, "rate": self.rate,
+                     "max_rate": self.rate, "burst": self.burst,
+                     "blocked_until": 0.0, "first": now, "last": now, "requests": 0}
+            self._hosts[host] = state
+        return state
+
+    def reserve(self, url: str) -> float:
+        """Bir token ayır ve isteğin başlamadan önce beklemesi gereken süreyi döndür."""
+        host = urlparse(url).netloc
+        now = time.monotonic()
+        with self._lock:
+            st = self._host_state(host, now)
+            if math.isinf(st["rate"]):
+                wait = 0.0
+            else:
+                st["tokens"] = min(st["burst"], st["tokens"] + (now - st["updated"]) * st["rate"])
+                st["updated"] = now
+                st["tokens"] -= 1
+                wait = -st["tokens"] / st["rate"] if st["tokens"] < 0 else 0.0
+            wait = max(wait, st["blocked_until"] - now)
+            st["requests"] += 1
+            st["last"] = now + wait
+            self.stats["requests"] += 1
+            self.stats["waited_seconds"] += wait
+        return wait
+
+    def set_min_interval(self, url: str, min_interval: Optional[float]):
+        """URL'nin hostuna istekler arasında en az 'min_interval' saniye bırak.
+
+        Host 1 / min_interval istek/sn'yi aşmaz ve patlama yapmaz; None ya da
+        0 verilirse hostun sınırı varsayılan 'rate' ve 'burst'e döner.
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            st = self._host_state(host, time.monotonic())
+            if min_interval:
+                st["max_rate"], st["burst"] = 1.0 / min_interval, 1
+            else:
+                st["max_rate"], st["burst"] = self.rate, self.burst
+            st["rate"] = min(st["rate"], st["max_rate"]) if min_interval else st["max_rate"]
+            st["tokens"] = min(st["tokens"], float(st["burst"]))
+
+    def acquire(self, url: str):
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_response(self, url: str, status: Optional[int], retry_after: Optional[str] = None):
+        """Yanıta göre hostun hızını ayarla. status None ise bağlantı hatasıdır."""
+        host = urlparse(url).netloc
+        now = time.monotonic()
+        with self._lock:
+            st = self._host_state(host, now)
+            if status is None or status in self.THROTTLE_STATUSES:
+                self.stats["throttled"] += 1
+                st["rate"] = max(self.min_rate, st["rate"] / 2)
+                st["tokens"] = min(st["tokens"], 0.0)
+                delay = _retry_after_seconds(retry_after)
+                if delay is not None:
+                    st["blocked_until"] = max(st["blocked_until"], now + delay)
+            elif st["rate"] < st["max_rate"]:
+                st["rate"] = min(st["max_rate"], st["rate"] + st["max_rate"] / 10)
 
-def fetch_article_raw(url: str) -> BeautifulSoup:
-    resp = requests.get(url, headers=HEADERS, timeout=10)
-    resp.raise_for_status()
-    return BeautifulSoup(resp.text, "html.parser")
+    def backoff_delay(self, attempt: int) -> float:
+        """attempt. yeniden deneme için tam jitter'lı üstel bekleme süresi."""
+        with self._lock:
+            self.stats["retries"] += 1
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def host_rates(self) -> Dict[str, float]:
+        """Host başına gerçekleşen ortalama hız (istek/sn)."""
+        with self._lock:
+            return {host: (st["requests"] - 1) / (st["last"] - st["first"])
+                    for host, st in self._hosts.items()
+                    if st["requests"] > 1 and st["last"] > st["first"]}
+
+    def report(self) -> str:
+        st = self.stats
+        rates = ", ".join(f"{host} {rate:.2f}/sn" for host, rate in self.host_rates().items())
+        return (f"🚦 Hız sınırı: {st['requests']} istek, {st['waited_seconds']:.1f} sn bekleme, "
+                f"{st['throttled']} yavaşlatma, {st['retries']} yeniden deneme"
+                + (f" ({rates})" if rates else ""))
+
+
+class HttpFetcher:
+    """Keep-alive bağlantı havuzu kullanan HTTP istemcisi.
+
+    Tüm istekler tek bir requests.Session üzerinden gider; aynı host'a
+    giden ardışık isteklerde TCP/TLS bağlantısı yeniden kullanılır.
+    'cache' verilirse yanıtlar HttpCache üzerinden saklanır ve doğrulanır.
+    Ağa giden her istek 'limiter'dan geçer; 429 / 5xx ve bağlantı
+    hatalarında en fazla 'max_retries' kez jitter'lı beklemeyle tekrar denenir.
+    'archive' kayıt modundaysa ağdan gelen yanıtlar arşive yazılır; oynatma
+    modundaysa ağa ve limiter'a hiç uğranmaz.
+    """
+
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE, timeout: float = HTTP_TIMEOUT,
+                 cache: Optional[HttpCache] = None, limiter: Optional[TokenBucketLimiter] = None,
+                 max_retries: int = HTTP_MAX_RETRIES, archive: Optional[HttpArchive] = None):
+        self.timeout = timeout
+        self.cache = cache
+        self.archive = archive
+        self.limiter = limiter if limiter is not None else TokenBucketLimiter()
+        self.max_retries = max_retries
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _request(self, url: str, headers: Optional[Dict] = None) -> requests.Response:
+        if self.archive is not None and self.archive.mode == "replay":
+            return self.archive.replay(url, headers)
+        resp = self._send(url, headers)
+        if self.archive is not None and resp.status_code != 304:
+            self.archive.record(url, resp.status_code, resp.headers, resp.text,
+                                resp.elapsed.total_seconds())
+        return resp
+
+    def _send(self, url: str, headers: Optional[Dict] = None) -> requests.Response:
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(url)
+            try:
+                resp = self.session.get(url, timeout=self.timeout, headers=headers)
+            except requests.RequestException:
+                self.limiter.on_response(url, None)
+                if attempt == self.max_retries:
+                    raise
+            else:
+                self.limiter.on_response(url, resp.status_code, resp.headers.get("Retry-After"))
+                if resp.status_code not in self.limiter.THROTTLE_STATUSES or attempt == self.max_retries:
+                    return resp
+            time.sleep(self.limiter.backoff_delay(attempt))
+
+    def get_text(self, url: str) -> str:
+        if self.cache is None:
+            resp = self._request(url)
+            resp.raise_for_status()
+            return resp.text
+
+        entry = self.cache.get(url)
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache._count("fresh_hits")
+            return entry["body"]
+
+        headers = {}
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        resp = self._request(url, headers)
+        if resp.status_code == 304 and entry is None:
+            # Saklı gövde yokken gelen 304 (kayıt bu arada silindi ya da sunucu
+            # koşulsuz isteğe 304 döndü) ıska sayılır: gövde koşulsuz yeniden istenir
+            resp = self._request(url)
+            if resp.status_code == 304:
+                raise requests.HTTPError(f"304 yanıtı için saklı gövde yok: {url}", response=resp)
+        if resp.status_code == 304:
+            self.cache.touch(url)
+            self.cache._count("revalidated")
+            if self.archive is not None and self.archive.mode == "record":
+                # Oynatmada gövde gerekeceği için 304 yerine saklı gövde kaydedilir
+                self.archive.record(url, 200, resp.headers, entry["body"],
+                                    resp.elapsed.total_seconds())
+            return entry["body"]
+        resp.raise_for_status()
+
+        self.cache._count("misses")
+        self.cache.put(url, resp.text, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+        return resp.text
+
+    def close(self):
+        self.session.close()
+        if self.archive is not None:
+            self.archive.close()
+
+
+_default_fetcher: Optional[HttpFetcher] = None
+
+def get_default_fetcher() -> HttpFetcher:
+    """Modül genelinde paylaşılan HTTP istemcisini döndür (ilk çağrıda oluşturulur)."""
+    global _default_fetcher
+    if _default_fetcher is None:
+        _default_fetcher = HttpFetcher()
+    return _default_fetcher
+
+def set_default_fetcher(fetcher: HttpFetcher):
+    """Paylaşılan HTTP istemcisini değiştir (ör. arşiv kaydı / oynatma için).
+
+    fetch_listing_html / fetch_article_raw gibi 'fetcher' almadan çağrılan
+    fonksiyonlar bundan sonra bu istemciyi kullanır.
+    """
+    global _default_fetcher
+    _default_fetcher = fetcher
+
+_NON_TEXT_BLOCK = re.compile(r"<(script|style|template)\b[^>]*>.*?</\1\s*>|<!--.*?-->",
+                             re.S | re.I)
+_HTML_TAG = re.compile(r"<[^>]*>")
+
+def html_text_strings(html: str) -> List[str]:
+    """Ağaç kurmadan, soup.stripped_strings ile aynı metin parçalarını çıkar.
+
+    script/style/template blokları ve yorumlar get_text'te olduğu gibi atlanır.
+    """
+    html = _NON_TEXT_BLOCK.sub(" ", html)
+    parts = (html_unescape(part).strip() for part in _HTML_TAG.split(html))
+    return [part for part in parts if part]
+
+def parse_html(html: str, strainer: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """lxml varsa 'strainer' ile kısıtlanmış ağaç, yoksa tam html.parser ağacı kur."""
+    if HTML_PARSER == "lxml":
+        return BeautifulSoup(html, "lxml", parse_only=strainer)
+    return BeautifulSoup(html, "html.parser")
+
+
+class ParsedDocument:
+    """Bir haber sayfasının ham HTML'i, parse ağacı ve metni.
+
+    Ağaç ve metin ilk kullanımda üretilip saklanır. get_text / find / find_all
+    BeautifulSoup ile aynı imzaya sahiptir; bu yüzden soup bekleyen
+    fonksiyonlara doğrudan verilebilir.
+
+    lxml varsa ağaç yalnızca ARTICLE_STRAINER düğümlerini içerir ve
+    get_text(..., strip=True) tüm sayfanın metnini ağaçsız olarak üretir;
+    böylece ön kontrol hiç parse gerektirmez. strip=False çağrıları ise
+    kısıtlı ağacın metnini döndürür.
+    """
+
+    def __init__(self, html: str, cache: Optional["DocumentCache"] = None):
+        self.html = html
+        self._cache = cache
+        self._soup: Optional[BeautifulSoup] = None
+        self._strings: Optional[List[str]] = None
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = parse_html(self.html, ARTICLE_STRAINER)
+            if self._cache is not None:
+                self._cache._count("parses")
+        return self._soup
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        if not strip:
+            return self.soup.get_text(separator)
+        # strip=True çıktısı ayraçtan bağımsız parçaların birleşimi; parçaları bir kez topla
+        if self._strings is None:
+            if HTML_PARSER == "lxml":
+                self._strings = html_text_strings(self.html)
+            else:
+                self._strings = list(self.soup.stripped_strings)
+        return separator.join(self._strings)
+
+    def find(self, *args, **kwargs):
+        return self.soup.find(*args, **kwargs)
+
+    def find_all(self, *args, **kwargs):
+        return self.soup.find_all(*args, **kwargs)
+
+
+class DocumentCache:
+    """URL -> ParsedDocument, boyut sınırlı LRU önbellek.
+
+    Ön kontrol (is_tr_istanbul_related) ile haber çıkarma aşaması aynı
+    sayfayı tekrar indirmez ve tekrar parse etmez. Thread'ler arasında
+    paylaşılabilir.
+    """
+
+    def __init__(self, max_entries: int = DOCUMENT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._docs: "OrderedDict[str, ParsedDocument]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"fetches": 0, "saved_fetches": 0, "parses": 0, "saved_parses": 0, "evictions": 0}
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def lookup(self, url: str) -> Optional[ParsedDocument]:
+        with self._lock:
+            doc = self._docs.get(url)
+            if doc is not None:
+                self._docs.move_to_end(url)
+                self.stats["saved_fetches"] += 1
+                if doc._soup is not None:
+                    self.stats["saved_parses"] += 1
+            return doc
+
+    def store(self, url: str, html: str) -> ParsedDocument:
+        doc = ParsedDocument(html, cache=self)
+        with self._lock:
+            self.stats["fetches"] += 1
+            self._docs[url] = doc
+            self._docs.move_to_end(url)
+            while len(self._docs) > self.max_entries:
+                self._docs.popitem(last=False)
+                self.stats["evictions"] += 1
+        return doc
+
+    def fetch(self, url: str, fetcher: Optional[HttpFetcher] = None) -> ParsedDocument:
+        doc = self.lookup(url)
+        if doc is None:
+            fetcher = fetcher or get_default_fetcher()
+            doc = self.store(url, fetcher.get_text(url))
+        return doc
+
+    def report(self) -> str:
+        st = self.stats
+        return (f"📦 Belge önbelleği: {st['fetches']} indirme ({st['saved_fetches']} tasarruf), "
+                f"{st['parses']} parse ({st['saved_parses']} tasarruf)")
+
+
+def content_hash(article: Dict) -> str:
+    """Haberin başlık ve metninden içerik özeti (değişiklik tespiti için)."""
+    h = hashlib.sha256()
+    h.update(article.get("title", "").encode("utf-8"))
+    h.update(b"\0")
+    h.update(article.get("text", "").encode("utf-8"))
+    return h.hexdigest()
+
+
+class SeenIndex:
+    """Artımlı crawl için kalıcı URL dizini.
+
+    Her URL için içerik özeti, ilk görülme, son kontrol ve son analiz zamanı
+    tutulur. 'recheck_after' süresi dolmamış URL'ler liste sayfasında atlanır;
+    yeniden çekilen haberler yalnızca içerikleri değiştiyse döndürülür.
+    Son kontrol ve son analiz zamanları last_run() ile okunur (ör. cron'dan).
+    """
+
+    def __init__(self, path: str = SEEN_INDEX_PATH, recheck_after: float = SEEN_RECHECK_AFTER):
+        self.path = path
+        self.recheck_after = recheck_after
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS seen_urls ("
+                " url TEXT PRIMARY KEY,"
+                " content_hash TEXT,"
+                " first_seen REAL NOT NULL,"
+                " last_checked REAL NOT NULL,"
+                " last_analyzed REAL)"
+            )
+        self.stats = {"skipped": 0, "new": 0, "changed": 0, "unchanged": 0}
+
+    def filter_due(self, items: List[Dict], now: Optional[float] = None) -> List[Dict]:
+        """Hiç görülmemiş ya da yeniden kontrol zamanı gelmiş linkleri döndür."""
+        now = time.time() if now is None else now
+        urls = [item["url"] for item in items]
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT url, last_checked FROM seen_urls WHERE url IN ({','.join('?' * len(urls))})",
+                urls,
+            ).fetchall() if urls else []
+        last_checked = dict(rows)
+        due = [item for item in items
+               if item["url"] not in last_checked
+               or now - last_checked[item["url"]] >= self.recheck_after]
+        with self._lock:
+            self.stats["skipped"] += len(items) - len(due)
+        return due
+
+    def mark_checked(self, url: str, now: Optional[float] = None):
+        """İçeriği saklanmayan (ör. ön kontrolden geçmeyen) bir URL'i görüldü say."""
+        now = time.time() if now is None else now
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO seen_urls (url, first_seen, last_checked) VALUES (?, ?, ?)"
+                " ON CONFLICT(url) DO UPDATE SET last_checked = excluded.last_checked",
+                (url, now, now),
+            )
+
+    def record(self, article: Dict, now: Optional[float] = None) -> bool:
+        """Haberin özetini kaydet; yeni ya da değişmişse True döndür."""
+        now = time.time() if now is None else now
+        digest = content_hash(article)
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT content_hash FROM seen_urls WHERE url = ?", (article["url"],)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT INTO seen_urls (url, content_hash, first_seen, last_checked) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(url) DO UPDATE SET content_hash = excluded.content_hash,"
+                " last_checked = excluded.last_checked",
+                (article["url"], digest, now, now),
+            )
+            if row is None or row[0] is None:
+                key = "new"
+            elif row[0] != digest:
+                key = "changed"
+            else:
+                key = "unchanged"
+            self.stats[key] += 1
+        return key != "unchanged"
+
+    def mark_analyzed(self, url: str, now: Optional[float] = None):
+        now = time.time() if now is None else now
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE seen_urls SET last_analyzed = ? WHERE url = ?", (now, url))
+
+    def last_run(self) -> Dict[str, Optional[float]]:
+        """Dizindeki en son kontrol ve analiz zamanı (epoch saniye; hiç yoksa None)"""
+        with self._lock:
+            checked, analyzed = self._conn.execute(
+                "SELECT MAX(last_checked), MAX(last_analyzed) FROM seen_urls").fetchone()
+        return {"last_checked": checked, "last_analyzed": analyzed}
+
+    def report(self) -> str:
+        st = self.stats
+        stamps = {name: "yok" if value is None else datetime.fromtimestamp(value).strftime("%Y-%m-%d %H:%M:%S")
+                  for name, value in self.last_run().items()}
+        return (f"🔖 Artımlı crawl: {st['skipped']} link atlandı, {st['new']} yeni, "
+                f"{st['changed']} değişmiş, {st['unchanged']} değişmemiş haber "
+                f"(son kontrol {stamps['last_checked']}, son analiz {stamps['last_analyzed']})")
+
+    def close(self):
+        self._conn.close()
+
+
+def fetch_listing_html(base_url: str = BASE_URL, fetcher: Optional[HttpFetcher] = None):
+    fetcher = fetcher or get_default_fetcher()
+    return fetcher.get_text(f"{base_url}/haberler")
+
+def fetch_article_raw(url: str, fetcher: Optional[HttpFetcher] = None) -> ParsedDocument:
+    """Haber sayfasını crawl'la aynı parse katmanından (ParsedDocument, parse_html) geçir."""
+    fetcher = fetcher or get_default_fetcher()
+    return ParsedDocument(fetcher.get_text(url))
 
 def is_tr_istanbul_related(soup: BeautifulSoup) -> bool:
     """Haber gövdesinde Türkiye / İstanbul geçiyor mu?"""
     full_text = soup.get_text(" ", strip=True).lower()
     return any(kw in full_text for kw in COUNTRY_CITY_KEYWORDS)
 
-def find_tr_istanbul_real_estate_links(max_results=20):
-    html = fetch_listing_html()
-    soup = BeautifulSoup(html, "html.parser")
+def extract_listing_candidates(html: str, base_url: str = BASE_URL) -> List[Dict]:
+    """Liste sayfasından başlığı konutla ilgili, URL'e göre tekilleştirilmiş linkleri çıkar."""
+    soup = parse_html(html, LISTING_STRAINER)
 
     candidates = []
 
@@ -80,9 +821,9 @@ def find_tr_istanbul_real_estate_links(max_results=20):
         if href.startswith("//"):
             href = "https:" + href
         elif href.startswith("/"):
-            href = urljoin(BASE_URL, href)
+            href = urljoin(base_url, href)
 
-        if not href.startswith(BASE_URL):
+        if not href.startswith(base_url):
             continue
 
         candidates.append({"title": title, "url": href})
@@ -91,25 +832,44 @@ def find_tr_istanbul_real_estate_links(max_results=20):
     uniq = {}
     for item in candidates:
         uniq[item["url"]] = item["title"]
-    deduped = [{"url": u, "title": t} for u, t in uniq.items()]
+    return [{"url": u, "title": t} for u, t in uniq.items()]
+
+def iter_tr_istanbul_real_estate_links(base_url: str = BASE_URL,
+                                       fetcher: Optional[HttpFetcher] = None,
+                                       doc_cache: Optional[DocumentCache] = None,
+                                       seen_index: Optional[SeenIndex] = None) -> Iterator[Dict]:
+    """Ön kontrolden geçen linkleri, sayfaları çekildikçe tek tek üret.
+
+    Sayfa yalnızca bir sonraki link istendiğinde çekilir; tüketici durduğunda
+    fazladan istek atılmaz.
+    """
+    html = fetch_listing_html(base_url, fetcher)
+    deduped = extract_listing_candidates(html, base_url)
+    doc_cache = doc_cache if doc_cache is not None else DocumentCache()
+    if seen_index is not None:
+        deduped = seen_index.filter_due(deduped)
 
     # Şimdi her biri için sayfa çek, "Türkiye/İstanbul içermeyenleri" at
-    filtered = []
     for item in deduped:
         try:
-            soup_article = fetch_article_raw(item["url"])
+            doc = doc_cache.fetch(item["url"], fetcher)
+            related = is_tr_istanbul_related(doc)
         except Exception as e:
             print("Hata (ön kontrol):", e)
             continue
 
-        if is_tr_istanbul_related(soup_article):
-            filtered.append(item)
+        if related:
+            yield item
+        elif seen_index is not None:
+            seen_index.mark_checked(item["url"])
 
-        if len(filtered) >= max_results:
-            break
-        time.sleep(0.7)
-
-    return filtered
+def find_tr_istanbul_real_estate_links(max_results=20, base_url: str = BASE_URL,
+                                       fetcher: Optional[HttpFetcher] = None,
+                                       doc_cache: Optional[DocumentCache] = None,
+                                       seen_index: Optional[SeenIndex] = None):
+    links = iter_tr_istanbul_real_estate_links(base_url=base_url, fetcher=fetcher,
+                                               doc_cache=doc_cache, seen_index=seen_index)
+    return list(islice(links, max_results))
 
 def parse_article_text(soup: BeautifulSoup) -> str:
     """Paragrafları birleştirerek temiz bir metin döndür."""
@@ -117,219 +877,1000 @@ def parse_article_text(soup: BeautifulSoup) -> str:
     text = " ".join(paragraphs)
     return text
 
+# Cümle / yan cümle sınırları: ondalık ayırıcı olan nokta (32.2) bölmez
+_CLAUSE_BOUNDARY = re.compile(r"[!?;\n]|\.(?!\d)")
+_PERCENT_VALUE = r"(?:yüzde|%)\s*(\d+[.,]\d+)"
+
+# Her özellik için sırayla denenen desen zincirleri; zincirin son deseninin
+# ilk grubu değerdir
+_FEATURE_CHAINS = {
+    # 1) Türkiye için yıllık artış (yüzde 32,2 / %32,2 / yüzde 32.2)
+    # yedek: "bir önceki yılın aynı ayına göre nominal olarak yüzde 32,2"
+    "tr_yoy_change": [
+        (re.compile(r"türkiye(?: genelinde)?|konut fiyat endeksi"), re.compile(_PERCENT_VALUE)),
+        (re.compile(r"bir önceki yılın aynı ayına göre"), re.compile(_PERCENT_VALUE)),
+    ],
+    # 2) Türkiye için aylık artış (bir önceki aya göre yüzde 1,7 artan KFE)
+    "tr_mom_change": [
+        (re.compile(r"bir önceki aya göre"), re.compile(_PERCENT_VALUE + r"\s*oranında artan kfe")),
+    ],
+    # 3) KFE seviye (195,7 seviyesine yükseldi)
+    "tr_index_level": [
+        (re.compile(r"kfe"), re.compile(r"(?<!\d)(\d+[.,]\d+)\s*seviyesine")),
+    ],
+    # 4) İstanbul için yıllık artış (haberlerde genelde "istanbul'da yıllık artış %xx,x")
+    "ist_yoy_change": [
+        (re.compile(r"istanbul"), re.compile(r"yıllık|yıl bazında"), re.compile(_PERCENT_VALUE)),
+    ],
+    # 5) İstanbul için aylık artış (daha nadir ama koyalım)
+    "ist_mom_change": [
+        (re.compile(r"istanbul"), re.compile(r"bir önceki aya göre"), re.compile(_PERCENT_VALUE)),
+    ],
+}
+
+class _NextMatch:
+    """Bir desenin verilen konumdan sonraki ilk eşleşmesi; sorgu konumları
+    artan sırada geldiği için son sonuç yeniden kullanılır ve metnin her
+    bölgesi en fazla bir kez taranır."""
+
+    def __init__(self, pattern, text: str):
+        self.pattern = pattern
+        self.text = text
+        self.last = None
+        self.exhausted = False
+
+    def after(self, pos: int):
+        if self.exhausted:
+            return None
+        if self.last is None or self.last.start() < pos:
+            self.last = self.pattern.search(self.text, pos)
+            self.exhausted = self.last is None
+        return self.last
+
+def match_chain(text: str, chain, window: int = FEATURE_WINDOW) -> Optional[str]:
+    """
+    Zincirdeki desenleri sırayla, her biri bir öncekinin bittiği yerden
+    sonra başlayacak şekilde eşleştir; son desenin ilk grubunu döndür.
+
+    Zincirin tamamı tek bir cümlede / yan cümlede (arada _CLAUSE_BOUNDARY
+    yok) ve ilk desenin başından itibaren `window` karakter içinde kalmalıdır.
+    Her çapa için sonraki desenlerin en erken eşleşmesi alınır; sorgular
+    artan sırada olduğundan metin bir kez taranır ve '.*?' içeren tek bir
+    regex'in uzun metinlerdeki karesel taramasına düşülmez.
+    """
+    steps = [_NextMatch(pattern, text) for pattern in chain[1:]]
+    boundary = _NextMatch(_CLAUSE_BOUNDARY, text)
+    for anchor in chain[0].finditer(text):
+        m = anchor
+        for step in steps:
+            m = step.after(m.end())
+            if m is None:
+                # Sonraki çapalar daha geride bitmez, onlar da eşleşemez
+                return None
+        if m.end() - anchor.start() > window:
+            continue
+        end_of_clause = boundary.after(anchor.start())
+        if end_of_clause is None or end_of_clause.start() >= m.end():
+            return m.group(1)
+    return None
+
 def extract_tr_ist_features_from_text(text: str) -> dict:
     """
     BloombergHT konut haberi metninden Türkiye geneli ve İstanbul için
     bazı sayısal özellikleri çekmeye çalışır.
+
+    Çapa kelime ile sayı aynı cümlede ve FEATURE_WINDOW karakter içinde
+    olmalıdır; böylece ilgisiz paragraflardaki sayılar eşleşmez ve süre
+    metin uzunluğuyla doğrusal kalır.
     """
     t = text.lower()
-    features = {
-        "tr_yoy_change": None,
-        "tr_mom_change": None,
-        "tr_index_level": None,
-        "ist_yoy_change": None,
-        "ist_mom_change": None,
+    features = {}
+
+    for name, chains in _FEATURE_CHAINS.items():
+        value = None
+        for chain in chains:
+            value = match_chain(t, chain)
+            if value:
+                break
+        features[name] = float(value.replace(",", ".")) if value else None
+
+    return features
+
+def extract_article(soup, item: Dict) -> Dict:
+    """Haber sayfasından başlık, giriş tarihi, metin ve sayısal özellikleri çıkar."""
+    # Başlık
+    title_tag = soup.find("h1")
+    title = title_tag.get_text(strip=True) if title_tag else item["title"]
+
+    # Giriş tarihi (çok kaba, ama iş görür)
+    full_text = soup.get_text("\n", strip=True)
+    giris = None
+    m_giris = re.search(r"Giriş:\s*(.+)", full_text)
+    if m_giris:
+        giris = m_giris.group(1).strip()
+
+    # Metin
+    text = parse_article_text(soup)
+
+    # Feature çıkar
+    features = extract_tr_ist_features_from_text(text)
+
+    return {
+        "url": item["url"],
+        "title": title,
+        "giris": giris,
+        "text": text,
+        "features": features
     }
 
-    # 1) Türkiye için yıllık artış (yüzde 32,2 / %32,2 / yüzde 32.2)
-    # pattern: "türkiye genelinde ... yüzde xx,x" veya "bir önceki yılın aynı ayına göre ... yüzde xx,x"
-    m_tr_yoy = re.search(
-        r"(türkiye(?: genelinde)?|konut fiyat endeksi).*?(yüzde|%)[\s]*([\d]+[.,]\d+)",
-        t
-    )
-    if not m_tr_yoy:
-        # yedek: "bir önceki yılın aynı ayına göre nominal olarak yüzde 32,2"
-        m_tr_yoy = re.search(
-            r"bir önceki yılın aynı ayına göre.*?(yüzde|%)[\s]*([\d]+[.,]\d+)",
-            t
-        )
-        if m_tr_yoy:
-            value = m_tr_yoy.group(2)
-            features["tr_yoy_change"] = float(value.replace(",", "."))
-    else:
-        value = m_tr_yoy.group(3)
-        features["tr_yoy_change"] = float(value.replace(",", "."))
+def _print_crawl_reports(fetcher: HttpFetcher, doc_cache: DocumentCache,
+                         seen_index: Optional[SeenIndex]):
+    print(doc_cache.report())
+    print(fetcher.limiter.report())
+    if fetcher.cache is not None:
+        print(fetcher.cache.report())
+    if fetcher.archive is not None:
+        print(fetcher.archive.report())
+    if seen_index is not None:
+        print(seen_index.report())
 
-    # 2) Türkiye için aylık artış (bir önceki aya göre yüzde 1,7 artan KFE)
-    m_tr_mom = re.search(
-        r"bir önceki aya göre.*?(yüzde|%)[\s]*([\d]+[.,]\d+)\s*oranında artan kfe",
-        t
-    )
-    if m_tr_mom:
-        value = m_tr_mom.group(2)
-        features["tr_mom_change"] = float(value.replace(",", "."))
+def iter_bloomberght_konut_tr_ist(max_results=3, base_url: str = BASE_URL,
+                                  fetcher: Optional[HttpFetcher] = None,
+                                  doc_cache: Optional[DocumentCache] = None,
+                                  seen_index: Optional[SeenIndex] = None,
+                                  delay_seconds: Optional[float] = None) -> Iterator[Dict]:
+    """
+    crawl_bloomberght_konut_tr_ist'in akış (generator) sürümü.
 
-    # 3) KFE seviye (195,7 seviyesine yükseldi)
-    m_index = re.search(
-        r"kfe.*?([\d]+[.,]\d+)\s*seviyesine",
-        t
-    )
-    if m_index:
-        value = m_index.group(1)
-        features["tr_index_level"] = float(value.replace(",", "."))
+    Her haber çıkarıldığı anda üretilir; ilk sonuç tüm crawl'un bitmesini
+    beklemez ve bellekte aynı anda tek bir haber tutulur. Raporlar yalnızca
+    generator sonuna kadar tüketildiğinde yazılır.
+    """
+    fetcher = fetcher or get_default_fetcher()
+    if delay_seconds is not None:
+        fetcher.limiter.set_min_interval(base_url, delay_seconds)
+    doc_cache = doc_cache if doc_cache is not None else DocumentCache()
+    links = islice(iter_tr_istanbul_real_estate_links(base_url=base_url, fetcher=fetcher,
+                                                      doc_cache=doc_cache, seen_index=seen_index),
+                   PREFILTER_LIMIT)  # geniş tutuyoruz
 
-    # 4) İstanbul için yıllık artış (haberlerde genelde "istanbul'da yıllık artış %xx,x")
-    m_ist_yoy = re.search(
-        r"istanbul.*?(yıllık|yıl bazında).*?(yüzde|%)[\s]*([\d]+[.,]\d+)",
-        t
-    )
-    if m_ist_yoy:
-        value = m_ist_yoy.group(3)
-        features["ist_yoy_change"] = float(value.replace(",", "."))
+    produced = 0
+    # ❗️ 3 HABER LİMİTİ: limit dolunca bir sonraki link için istek atılmaz
+    for item in (links if max_results > 0 else ()):
+        url = item["url"]
+        print(f"Haber çekiliyor: {item['title']} → {url}")
 
-    # 5) İstanbul için aylık artış (daha nadir ama koyalım)
-    m_ist_mom = re.search(
-        r"istanbul.*?bir önceki aya göre.*?(yüzde|%)[\s]*([\d]+[.,]\d+)",
-        t
-    )
-    if m_ist_mom:
-        value = m_ist_mom.group(2)
-        features["ist_mom_change"] = float(value.replace(",", "."))
+        try:
+            doc = doc_cache.fetch(url, fetcher)
+            article = extract_article(doc, item)
+        except Exception as e:
+            print("Hata:", e)
+            continue
 
-    return features
+        if seen_index is None or seen_index.record(article):
+            produced += 1
+            yield article
+            if produced >= max_results:
+                break
+
+    _print_crawl_reports(fetcher, doc_cache, seen_index)
 
-def crawl_bloomberght_konut_tr_ist(max_results=3, delay_seconds=1.0):
+def crawl_bloomberght_konut_tr_ist(max_results=3, delay_seconds: Optional[float] = None, base_url: str = BASE_URL,
+                                   fetcher: Optional[HttpFetcher] = None,
+                                   doc_cache: Optional[DocumentCache] = None,
+                                   seen_index: Optional[SeenIndex] = None):
     """
     1) BloombergHT haber listesinden sadece başlığı konutla ilgili
        ve metni Türkiye/İstanbul içeren haberleri bulur.
     2) En fazla 'max_results' kadar haber döndürür. (Varsayılan: 3)
+
+    Ön kontrolde indirilen sayfalar 'doc_cache' üzerinden haber çıkarma
+    aşamasında yeniden kullanılır; verilmezse crawl'a özel bir önbellek açılır.
+    İstekler arası bekleme fetcher.limiter ile yapılır; 'delay_seconds'
+    verilirse siteye giden istekler arasında en az o kadar saniye bırakılır
+    (sınırlayıcıda bu host için geçerli kalır, 0 varsayılana döndürür).
+    'seen_index' verilirse artımlı çalışır: yalnızca yeni ya da içeriği
+    değişmiş haberler döner.
+    Haberleri geldikçe işlemek için iter_bloomberght_konut_tr_ist kullanılabilir.
     """
-    links = find_tr_istanbul_real_estate_links(max_results=10)  # geniş tutuyoruz
+    return list(iter_bloomberght_konut_tr_ist(max_results=max_results, base_url=base_url,
+                                              fetcher=fetcher, doc_cache=doc_cache,
+                                              seen_index=seen_index, delay_seconds=delay_seconds))
 
-    results = []
-    for item in links:
+# ==================== ASYNC CRAWLER ====================
 
-        # ❗️ 3 HABER LİMİTİ
-        if len(results) >= max_results:
-            break
+class HostPoliteness:
+    """Host başına eşzamanlılık bütçesi: aynı host'a aynı anda en fazla
+    'max_in_flight' istek gider. Hız sınırı fetcher.limiter'dadır."""
 
-        url = item["url"]
-        print(f"Haber çekiliyor: {item['title']} → {url}")
+    def __init__(self, max_in_flight: int = 4):
+        self.max_in_flight = max_in_flight
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
 
+    @asynccontextmanager
+    async def slot(self, url: str):
+        host = urlparse(url).netloc
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self.max_in_flight))
+        async with semaphore:
+            yield
+
+
+async def _stream_in_order(items: List[Dict], worker: Callable[[Dict], Awaitable[Any]],
+                           need: Callable[[], int], window: int) -> AsyncIterator[Any]:
+    """Elemanları en fazla 'window' büyüklüğünde gruplar halinde eşzamanlı işle.
+
+    Sonuçlar giriş sırasıyla, kendisi ve öncekiler hazır olur olmaz üretilir;
+    None dönenler atlanır. need() tüketicinin hâlâ kaç sonuca ihtiyacı
+    olduğunu verir ve her grup başlarken sorulur; grup yalnızca o kadar
+    eleman alır. Böylece sıralı taramanın atmayacağı istekler önceden
+    atılmaz ve çıktı sıralı taramayla aynı olur. Tüketici erken durursa
+    gruptaki bekleyen işler iptal edilir.
+    """
+    i = 0
+    while i < len(items):
+        size = min(window, need())
+        if size <= 0:
+            return
+        tasks = [asyncio.ensure_future(worker(item)) for item in items[i:i + size]]
+        i += size
         try:
-            soup = fetch_article_raw(url)
-
-            # Başlık
-            title_tag = soup.find("h1")
-            title = title_tag.get_text(strip=True) if title_tag else item["title"]
-
-            # Giriş tarihi (çok kaba, ama iş görür)
-            full_text = soup.get_text("\n", strip=True)
-            giris = None
-            m_giris = re.search(r"Giriş:\s*(.+)", full_text)
-            if m_giris:
-                giris = m_giris.group(1).strip()
-
-            # Metin
-            text = parse_article_text(soup)
-
-            # Feature çıkar
-            features = extract_tr_ist_features_from_text(text)
-
-            results.append({
-                "url": url,
-                "title": title,
-                "giris": giris,
-                "text": text,
-                "features": features
-            })
+            for task in tasks:
+                result = await task
+                if result is not None:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
 
-        except Exception as e:
-            print("Hata:", e)
 
-        time.sleep(delay_seconds)
+async def aiter_bloomberght_konut_tr_ist(max_results=3, max_concurrency: int = 8,
+                                         max_per_host: int = 4,
+                                         base_url: str = BASE_URL,
+                                         fetcher: Optional[HttpFetcher] = None,
+                                         doc_cache: Optional[DocumentCache] = None,
+                                         seen_index: Optional[SeenIndex] = None,
+                                         queue_size: int = STREAM_QUEUE_SIZE,
+                                         min_interval: Optional[float] = None) -> AsyncIterator[Dict]:
+    """
+    iter_bloomberght_konut_tr_ist'in asyncio sürümü: haberleri çıkarıldıkça üretir.
+
+    Crawl arka planda bir görev olarak ilerler ve haberleri en fazla
+    'queue_size' elemanlık bir kuyruğa koyar; kuyruk dolunca tüketiciyi
+    bekler, böylece bellek kullanımı korpus boyutuna değil kuyruğa bağlıdır.
+    En fazla 'max_concurrency' istek aynı anda uçuşta olur; istekler paylaşılan
+    keep-alive havuzu üzerinden thread'lerde çalışır. Host başına en fazla
+    'max_per_host' istek uçuşta olur ve hız fetcher.limiter ile sınırlanır;
+    'min_interval' verilirse aynı hosta giden isteklerin başlangıçları
+    arasında en az o kadar saniye bırakılır (bkz. set_min_interval).
+    Kullanım: async for article in aiter_bloomberght_konut_tr_ist(): ...
+    """
+    fetcher = fetcher or get_default_fetcher()
+    if min_interval is not None:
+        fetcher.limiter.set_min_interval(base_url, min_interval)
+    doc_cache = doc_cache if doc_cache is not None else DocumentCache()
+    politeness = HostPoliteness(max_in_flight=max_per_host)
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    finished = object()
+    failures: List[Exception] = []
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
 
-    return results
+        async def fetch_doc(url: str) -> ParsedDocument:
+            doc = doc_cache.lookup(url)
+            if doc is None:
+                async with politeness.slot(url):
+                    html = await loop.run_in_executor(executor, fetcher.get_text, url)
+                doc = doc_cache.store(url, html)
+            return doc
+
+        async def prefilter(item: Dict) -> Optional[Dict]:
+            try:
+                doc = await fetch_doc(item["url"])
+                # Parse ve metin çıkarma host slotunu ve event loop'u meşgul etmesin
+                related = await loop.run_in_executor(executor, is_tr_istanbul_related, doc)
+            except Exception as e:
+                print("Hata (ön kontrol):", e)
+                return None
+            if not related and seen_index is not None:
+                seen_index.mark_checked(item["url"])
+            return item if related else None
+
+        async def extract(item: Dict) -> Optional[Dict]:
+            print(f"Haber çekiliyor: {item['title']} → {item['url']}")
+            try:
+                doc = await fetch_doc(item["url"])
+                article = await loop.run_in_executor(executor, extract_article, doc, item)
+            except Exception as e:
+                print("Hata:", e)
+                return None
+            if seen_index is not None and not seen_index.record(article):
+                return None
+            return article
+
+        async def produce():
+            try:
+                listing_url = f"{base_url}/haberler"
+                async with politeness.slot(listing_url):
+                    html = await loop.run_in_executor(executor, fetcher.get_text, listing_url)
+                candidates = extract_listing_candidates(html, base_url)
+                if seen_index is not None:
+                    candidates = seen_index.filter_due(candidates)
+
+                passed = produced = 0
+                # Ön kontrol yalnızca max_results'ın hâlâ gerektirdiği kadar
+                # linki eşzamanlı çeker (en fazla PREFILTER_LIMIT geçen link)
+                links = _stream_in_order(candidates, prefilter,
+                                         lambda: min(PREFILTER_LIMIT - passed, max_results - produced),
+                                         max_concurrency)
+                try:
+                    # Ön kontrolden geçen her link beklemeden çıkarılır
+                    async for item in links:
+                        passed += 1
+                        article = await extract(item)
+                        if article is None:
+                            continue
+                        await queue.put(article)
+                        produced += 1
+                        if produced >= max_results:
+                            break
+                finally:
+                    await links.aclose()
+                _print_crawl_reports(fetcher, doc_cache, seen_index)
+            except Exception as e:
+                failures.append(e)
+            # İptal edildiyse (tüketici erken durdu) buraya gelinmez
+            await queue.put(finished)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                article = await queue.get()
+                if article is finished:
+                    break
+                yield article
+        finally:
+            if not producer.done():
+                producer.cancel()
+                with suppress(asyncio.CancelledError):
+                    await producer
+    if failures:
+        raise failures[0]
+
+
+async def crawl_bloomberght_konut_tr_ist_async(max_results=3, max_concurrency: int = 8,
+                                               max_per_host: int = 4,
+                                               base_url: str = BASE_URL,
+                                               fetcher: Optional[HttpFetcher] = None,
+                                               doc_cache: Optional[DocumentCache] = None,
+                                               seen_index: Optional[SeenIndex] = None,
+                                               min_interval: Optional[float] = None):
+    """
+    crawl_bloomberght_konut_tr_ist ile aynı haber sözlüklerini döndüren asyncio sürümü.
+
+    aiter_bloomberght_konut_tr_ist'in tüm çıktısını toplar.
+    Kullanım: asyncio.run(crawl_..._async())
+    """
+    return [article async for article in aiter_bloomberght_konut_tr_ist(
+        max_results=max_results, max_concurrency=max_concurrency, max_per_host=max_per_host,
+        base_url=base_url, fetcher=fetcher, doc_cache=doc_cache, seen_index=seen_index,
+        min_interval=min_interval)]
 
 # ==================== NLP ANALİZ KODU ====================
 
-# NLTK verilerini indir (ilk çalıştırmada gerekli)
-try:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    nltk.download('punkt_tab', quiet=True)
-except:
-    pass
+# NLP kaynakları import sırasında yüklenmez ve hiçbir zaman indirilmez: paket
+# ilk analizci kurulurken, tokenizer desenleri ilk metin bölünürken hazırlanır
+_nlp_resources: Dict[str, Dict] = {}
+_tokenizer_patterns: Dict[str, Any] = {}
+
+# Cümle sonu adayı: boşluktan sonra başlayan token, bitiş noktalaması, kapanan
+# tırnak/parantezler ve ardından metnin devam ettiği boşluk
+_SENTENCE_END = re.compile(r"(?<!\S)(\S*?)([.!?]+)([\"'”’»)\]}]*)\s+(?=\S)")
+_SENTENCE_TOKEN_OPENERS = "\"'“‘«([{"
+_SENTENCE_CONTINUATIONS = ";:,.!?"
+_NUMBER_TOKEN = re.compile(r"-?[.,]?\d[\d,.-]*")
+
+# Kelime token'ları: sayılar ve kelimeler (iç nokta, ek kesme işareti, rakamdan
+# önce virgül: 32,2 12.500 05.03.2025 a.ş İstanbul'da), cümle içinde boşluktan
+# önce gelen nokta (kısaltma, sıra sayısı), üç nokta ve tek noktalama karakterleri.
+# 'İ'.lower() birleşen nokta (U+0307) ürettiği için birleşen işaretler kelimeye dahildir.
+_WORD_TOKEN = re.compile(r"[\w\u0300-\u036f]+(?:(?:[.'’]|,(?=\d))[\w\u0300-\u036f]+)*(?:\.(?=\s))?"
+                         r"|\.\.\.|[^\w\s\u0300-\u036f]")
+
+def load_nlp_resources(path: str = NLP_RESOURCES_PATH) -> Dict:
+    """Yerel NLP paketini (JSON) ilk çağrıda yükle; sonraki çağrılar aynı sözlüğü döndürür."""
+    resources = _nlp_resources.get(path)
+    if resources is None:
+        with open(path, encoding='utf-8') as f:
+            resources = json.load(f)
+        _nlp_resources[path] = resources
+    return resources
+
+def _sentence_abbreviations() -> set:
+    abbreviations = _tokenizer_patterns.get('abbreviations')
+    if abbreviations is None:
+        abbreviations = frozenset(load_nlp_resources()['sentence_abbreviations'])
+        _tokenizer_patterns['abbreviations'] = abbreviations
+    return abbreviations
+
+def _is_sentence_break(token: str, end: str, following: str, abbreviations: set) -> bool:
+    """Punkt kuralları: kısaltmadan ve birden çok noktadan sonra cümle bitmez; tek
+    harf (baş harf) ve sayıdan sonraki nokta, küçük harf ya da tek noktalamayla
+    devam ediliyorsa cümleyi bitirmez (A. Yılmaz, 3. çeyrek).
+    'following' adaydan sonraki ilk iki karakterdir."""
+    if '!' in end or '?' in end:
+        return True
+    if len(end) > 1:
+        return False
+    word = token.lstrip(_SENTENCE_TOKEN_OPENERS)
+    next_char = following[:1]
+    continues = next_char in _SENTENCE_CONTINUATIONS and following != '..'
+    if not word:
+        return True
+    if word.lower() in abbreviations:
+        return False
+    if len(word) == 1 and word.isalpha():
+        return not (next_char.isalpha() or continues)
+    if _NUMBER_TOKEN.fullmatch(word):
+        return not (next_char.islower() or continues)
+    return True
+
+def tr_sent_tokenize(text: str) -> List[str]:
+    """Türkçe cümle bölücü (nltk.sent_tokenize(text, 'turkish') yerine).
+
+    Tek bir derlenmiş regex yalnızca boşlukla biten [.!?] adaylarını bulur;
+    '32,2', '12.500', '05.03.2025', 'a.ş.' gibi ifadelerin içinde bölme olmaz.
+    Kısaltmalar yerel NLP paketinden gelir.
+    """
+    abbreviations = _sentence_abbreviations()
+    sentences = []
+    start = 0
+    for m in _SENTENCE_END.finditer(text):
+        if _is_sentence_break(m.group(1), m.group(2), text[m.end():m.end() + 2], abbreviations):
+            sentence = text[start:m.end(3)].strip()
+            if sentence:
+                sentences.append(sentence)
+            start = m.end()
+    sentence = text[start:].strip()
+    if sentence:
+        sentences.append(sentence)
+    return sentences
+
+def tr_word_tokenize(text: str) -> List[str]:
+    """Türkçe kelime ayırıcı (nltk.word_tokenize(text, 'turkish') yerine).
+
+    Metin cümlelere bölünür; cümle sonundaki nokta ayrı token olur, cümle içinde
+    kalan noktalar (kısaltma, sıra sayısı) kelimede kalır. Sayılar ondalık
+    virgülü, binlik ve tarih noktalarıyla tek token'dır; '%' ayrı token'dır.
+    """
+    return [token for sentence in tr_sent_tokenize(text) for token in _WORD_TOKEN.findall(sentence)]
+
+class KeywordMatcher:
+    """Aho–Corasick tabanlı çoklu anahtar kelime eşleyici.
+
+    Desenler bir kez trie'ye, hata bağlantıları çözülerek tam geçiş tablosuna
+    (DFA) derlenir; metin karakter başına tek sözlük aramasıyla, tek geçişte
+    taranır ve her eşleşme başlangıç konumu ve etiketleriyle döner. Eşleşme anlamı
+    'desen in metin' ile aynıdır (alt dize; kelime sınırı aranmaz).
+    Her desene (tür, ad) etiketleri eklenebilir, ör. ('category', 'faiz').
+    """
 
-class ImprovedTurkishNLPAnalyzer:
     def __init__(self):
-        # Türkçe stopwords
-        self.turkish_stopwords = set(stopwords.words('turkish'))
-        # Ek stopwords ekleyelim
-        self.turkish_stopwords.update([
-            'bir', 've', 'ile', 'olarak', 'için', 'kadar', 'göre',
-            'da', 'de', 'bu', 'şu', 'o', 'ise', 'mi', 'mı', 'mu', 'mü',
-            'haber', 'haberi', 'haberler', 'bloomberg', 'ht', 'tcmb',
-            'ise', 'iken', 'ile', 'idi', 'imiş', 'yok', 'var', 'dır',
-            'dir', 'dur', 'dür', 'tır', 'tir', 'tur', 'tür'
-        ])
-        
-        # Anahtar kelime kategorileri - GÜNCELLENMİŞ
-        self.keyword_categories = {
-            'faiz': ['faiz', 'faizi', 'faizler', 'faizleri', 'faiz oranı', 'faiz indirimi', 
-                    'faiz artışı', 'politika faizi', 'referans faiz', 'tcmb'],
-            
-            'kredi': ['kredi', 'kredisi', 'krediler', 'konut kredisi', 'mortgage', 
-                     'ipotek', 'kredi faizi', 'kredi oranı', 'kredi talebi'],
-            
-            'fiyat': ['fiyat', 'fiyatı', 'fiyatlar', 'fiyatları', 'konut fiyatı', 
-                     'ev fiyatı', 'kira fiyatı', 'fiyat artışı', 'fiyat düşüşü',
-                     'fiyat endeksi', 'kfe'],
-            
-            'enflasyon': ['enflasyon', 'enflasyonu', 'enflasyonda', 'enflasyonist',
-                         'reel', 'nominal', 'enflasyon baskısı', 'reel değer'],
-            
-            'talep': ['talep', 'talebi', 'talep artışı', 'talepte', 'talep yönelimi',
-                     'tüketici talebi', 'yatırımcı talebi', 'arttı', 'artış'],
-            
-            'arz': ['arz', 'arzı', 'arz azlığı', 'arz fazlası', 'arz-talep', 
-                   'piyasa arzı', 'konut arzı'],
-            
-            'semt_bölge': ['istanbul', 'ankara', 'izmir', 'kadıköy', 'beşiktaş',
-                          'şişli', 'avrupa yakası', 'anadolu yakası', 'bölge',
-                          'semt', 'ilçe', 'mahalle'],
-            
-            'ekonomi': ['ekonomi', 'ekonomik', 'büyüme', 'gsyh', 'yatırım',
-                       'piyasa', 'finans', 'ekonomi politikası', 'merkez bankası'],
-            
-            'değer': ['değer', 'değeri', 'değer artışı', 'değer kaybı', 'değerleme',
-                     'değer saklama', 'yatırım değeri', 'reel değer'],
-            
-            'risk': ['risk', 'riski', 'riskler', 'risk faktörü', 'risk algısı',
-                    'belirsizlik', 'volatilite', 'istikrar', 'kayıp', 'kaybı']
-        }
+        self._goto: List[Dict[str, int]] = [{}]
+        self._own: List[List[str]] = [[]]
+        self._delta: List[Dict[str, int]] = [{}]
+        self._out: List[Tuple[str, ...]] = [()]
+        self.tags: Dict[str, List[Tuple[str, str]]] = {}
+        self.max_length = 0
+        self._built = True
+
+    def add(self, pattern: str, *tags: Tuple[str, str]):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._own.append([])
+                self._goto[state][ch] = nxt
+            state = nxt
+        if pattern not in self.tags:
+            self._own[state].append(pattern)
+            self.tags[pattern] = []
+            self.max_length = max(self.max_length, len(pattern))
+        self.tags[pattern].extend(tags)
+        self._built = False
+
+    def _build(self):
+        """Hata bağlantılarını ve çıktıları BFS ile hesapla, geçiş tablosunu doldur.
+
+        Bir durumun tablosu, hata durumunun tablosu üzerine kendi trie
+        geçişleri yazılarak elde edilir; tabloda olmayan karakter köke döner.
+        """
+        goto = self._goto
+        fail = [0] * len(goto)
+        out: List[Tuple[str, ...]] = [()] * len(goto)
+        delta: List[Dict[str, int]] = [{}] * len(goto)
+        delta[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        for state in queue:
+            out[state] = tuple(self._own[state])
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0)
+                out[nxt] = tuple(self._own[nxt]) + out[fail[nxt]]
+                queue.append(nxt)
+        self._delta, self._out = delta, out
+        self._built = True
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Metindeki tüm (örtüşenler dahil) eşleşmeleri (başlangıç, desen) olarak üret."""
+        if not self._built:
+            self._build()
+        delta, out = self._delta, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            state = delta[state].get(ch, 0)
+            for pattern in out[state]:
+                yield i - len(pattern) + 1, pattern
+
+    def found(self, text: str) -> set:
+        """Metinde geçen desenlerin kümesi."""
+        if not self._built:
+            self._build()
+        delta, out = self._delta, self._out
+        hits = set()
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                hits.update(out[state])
+        return hits
+
+    def scan(self, text: str) -> List[Dict]:
+        """Her eşleşmeyi konumu ve etiketleriyle (kategori, duygu, kural) listele."""
+        return [{'start': start, 'keyword': pattern, 'tags': self.tags[pattern]}
+                for start, pattern in self.finditer(text)]
+
+
+# Finansal tarayıcı desenleri: hepsi bir kez derlenir ve sayı başlangıçlarına
+# sabitlenerek (.match) çalışır
+_DIGIT_RUN = re.compile(r'\d+')
+_ALL_NUMBERS = re.compile(r'\b(\d+[.,]?\d*)\b')
+_NUMBER_AT = re.compile(r'\d+[.,]?\d*')
+_KFE_NUMBER_AT = re.compile(r'\d+[.,]?\d+')
+_CURRENCY_AT = {
+    'tl': re.compile(r'(\d+[.,]?\d*)\s*(?:tl|₺|türk lirası)'),
+    'dolar': re.compile(r'(\d+[.,]?\d*)\s*(?:\$|dolar|usd)'),
+    'euro': re.compile(r'(\d+[.,]?\d*)\s*(?:€|euro|eur)')
+}
+_TIME_AT = re.compile(r'(\d+\s*(ay|yıl|hafta|gün|saat)\s*(önce|içinde|sonra)?)')
+# Yukarıdaki para birimi ve zaman desenlerinin ortak ön süzgeci
+_CONTEXT_AT = re.compile(r'\d+[.,]?\d*\s*(?:tl|₺|türk lirası|\$|dolar|usd|€|eur|ay|yıl|hafta|gün|saat)')
+
+def scan_financial_text(lower: str) -> Dict:
+    """Küçük harfli metindeki sayıları tek geçişte bulup bağlamına göre sınıflandır.
+
+    Her rakam dizisinin başlangıcı bir kez bulunur; yüzde ('yüzde 5', '%5',
+    'oranında 5'), para birimi, zaman ifadesi ve KFE değerleri bu
+    başlangıçlara sabitlenmiş derlenmiş desenlerle okunur. Sonuçlar her
+    desenin ayrı re.findall ile taranmasıyla birebir aynıdır (eşleşmeler
+    çakışmaz, yüzde listeleri desen sırasıyla birleştirilir) ve süre metin
+    uzunluğuyla doğrusaldır.
+    """
+    has_kfe = 'kfe' in lower
+    percent_word, percent_sign, percent_rate = [], [], []
+    context_starts, candidates = [], []
+    for run in _DIGIT_RUN.finditer(lower):
+        start = run.start()
+        prev = lower[start - 1] if start else ''
+        target = None
+        if prev == '%':
+            target = percent_sign
+        elif prev.isspace():
+            k = start - 1
+            while k > 0 and lower[k - 1].isspace():
+                k -= 1
+            if k >= 5 and lower[k - 5:k] == 'yüzde':
+                target = percent_word
+            elif k >= 8 and lower[k - 8:k] == 'oranında':
+                target = percent_rate
+        if target is not None:
+            target.append(float(_NUMBER_AT.match(lower, start).group().replace(',', '.')))
+        # Para birimi / zaman desenlerinden biri burada başlayabiliyor mu?
+        if _CONTEXT_AT.match(lower, start):
+            context_starts.append(start)
+        if has_kfe:
+            m = _KFE_NUMBER_AT.match(lower, start)
+            if m:
+                candidates.append(m)
+    
+    def findall_at_runs(pattern):
+        """re.findall ile aynı sırada, çakışmayan sabitlenmiş eşleşmeler"""
+        matches, last_end = [], 0
+        for start in context_starts:
+            if start < last_end:
+                continue
+            m = pattern.match(lower, start)
+            if m:
+                matches.append(m)
+                last_end = m.end()
+        return matches
+    
+    currency_values = {}
+    for currency, pattern in _CURRENCY_AT.items():
+        matches = findall_at_runs(pattern)
+        if matches:
+            currency_values[currency] = [float(m.group(1).replace(',', '.')) for m in matches]
+    
+    time_expressions = [(m.group(1), m.group(2), m.group(3) or '')
+                        for m in findall_at_runs(_TIME_AT)]
+    
+    # r'kfe.*?(\d+[.,]?\d+)': her 'kfe'den sonra aynı satırdaki ilk uygun sayı
+    kfe_values = []
+    pos = ci = 0
+    newline = -1
+    while ci < len(candidates):
+        k = lower.find('kfe', pos)
+        if k < 0:
+            break
+        after = k + 3
+        while ci < len(candidates) and candidates[ci].start() < after:
+            ci += 1
+        if ci == len(candidates):
+            break
+        if newline < after:
+            newline = lower.find('\n', after)
+            if newline < 0:
+                newline = len(lower)
+        m = candidates[ci]
+        if newline < m.start():
+            pos = k + 1
+            continue
+        kfe_values.append(float(m.group().replace(',', '.')))
+        pos = m.end()
+    
+    return {
+        'percentages': percent_word + percent_sign + percent_rate,
+        'currency_values': currency_values,
+        'time_expressions': time_expressions,
+        'kfe_values': kfe_values
+    }
+
+class AnalyzedDocument:
+    """
+    Bir haber metninin analiz için ortak, değiştirilemez görünümü.
+
+    Küçük harfli metin, token'lar, cümleler ve sözlük eşleşmeleri ilk
+    istendiklerinde bir kez hesaplanıp saklanır; böylece analiz adımları
+    aynı metni tekrar tekrar küçültmez, bölmez ve taramaz. Token ve
+    eşleşmeler, belgeyi oluşturan analizcinin sözlüklerine göredir.
+    """
+    
+    def __init__(self, text: str, analyzer: 'ImprovedTurkishNLPAnalyzer'):
+        self._text = text
+        self._analyzer = analyzer
+        self._memo: Dict[str, Any] = {}
+    
+    def _cached(self, name: str, compute: Callable[[], Any]):
+        if name not in self._memo:
+            self._memo[name] = compute()
+        return self._memo[name]
+    
+    @property
+    def text(self) -> str:
+        return self._text
+    
+    @property
+    def lower(self) -> str:
+        return self._cached('lower', self._text.lower)
+    
+    @property
+    def tokens(self) -> Tuple[str, ...]:
+        """Stopword ve kısa kelimeleri ayıklanmış token'lar (kök bulma yok)"""
+        return self._cached('tokens', lambda: tuple(self._analyzer.tokenize_lower(self.lower)))
+    
+    @property
+    def sentences(self) -> Tuple[str, ...]:
+        return self._cached('sentences', lambda: tuple(tr_sent_tokenize(self._text)))
+    
+    @property
+    def matches(self) -> Tuple[Tuple[int, str], ...]:
+        """Küçük harfli metindeki tüm (başlangıç, desen) sözlük eşleşmeleri (tek tarama)"""
+        return self._cached('matches', lambda: tuple(self._analyzer.matcher.finditer(self.lower)))
+    
+    @property
+    def hits(self) -> set:
+        """Metinde geçen sözlük desenleri (anahtar kelime, duygu, kural)"""
+        return self._cached('hits', lambda: {pattern for _, pattern in self.matches})
+    
+    @property
+    def head_hits(self) -> set:
+        """İlk 100 karakterde (başlık ve giriş) geçen sözlük desenleri"""
+        def compute():
+            head = self._text[:100].lower()
+            if not self.lower.startswith(head):
+                return self._analyzer.matcher.found(head)
+            return {pattern for start, pattern in self.matches if start + len(pattern) <= len(head)}
+        return self._cached('head_hits', compute)
+    
+    @property
+    def sentence_hits(self) -> Tuple[set, ...]:
+        """Her cümlede geçen sözlük desenleri (sentences ile aynı sırada)"""
+        return self._cached('sentence_hits', self._split_hits)
+    
+    def _split_hits(self) -> Tuple[set, ...]:
+        """Cümle eşleşmelerini metnin tek taramasından, konumlara göre dağıtarak bul.
         
-        # Duygu yüklü kelimeler - GÜNCELLENMİŞ
-        self.sentiment_words = {
-            'pozitif': ['artış', 'yükseliş', 'kazanç', 'getiri', 'olumlu', 'iyi',
-                       'güçlü', 'cazip', 'avantaj', 'fırsat', 'talep', 'büyüme',
-                       'gelişme', 'iyileşme', 'kazandırıyor', 'kazançlı', 'artan',
-                       'yükseldi', 'arttı', 'pozitif', 'yukarı', 'güçlü'],
-            
-            'negatif': ['düşüş', 'kayıp', 'zarar', 'risk', 'olumsuz', 'kötü',
-                       'zayıf', 'tehlike', 'dezavantaj', 'tehdit', 'azalma',
-                       'gerileme', 'kaybediyor', 'zararlı', 'düşük', 'kaybı',
-                       'düştü', 'azaldı', 'negatif', 'aşağı', 'zayıf', 'kayıp'],
-            
-            'nötr': ['stabil', 'durağan', 'sabit', 'koruma', 'beklenti', 'tahmin',
-                    'projeksiyon', 'öngörü', 'bekleniyor', 'nominal', 'reel',
-                    'endeks', 'seviye', 'oran', 'yüzde']
-        }
+        Her cümlenin küçük harfli hali küçük harfli metinde sırayla aranır;
+        bulunamayan olursa (ör. 'İ' gibi bağlama göre küçülen harfler) cümleler
+        ayrı ayrı taranır. Sonuç her durumda cümle başına taramayla aynıdır.
+        """
+        sentences = self.sentences
+        lower = self.lower
+        starts, ends = [], []
+        pos = 0
+        for sentence in sentences:
+            sentence_lower = sentence.lower()
+            start = lower.find(sentence_lower, pos)
+            if start < 0:
+                matcher = self._analyzer.matcher
+                return tuple(matcher.found(sentence.lower()) for sentence in sentences)
+            starts.append(start)
+            ends.append(start + len(sentence_lower))
+            pos = ends[-1]
+        
+        hits = [set() for _ in sentences]
+        for start, pattern in self.matches:
+            i = bisect_right(starts, start) - 1
+            if i >= 0 and start + len(pattern) <= ends[i]:
+                hits[i].add(pattern)
+        return tuple(hits)
     
-    def preprocess_text(self, text: str, use_stemming: bool = False) -> List[str]:
+    def extended(self, suffix: str) -> 'AnalyzedDocument':
+        """
+        text + suffix için yeni belge (ör. metin + ' ' + başlık). Küçük harfli
+        metin eşleşiyorsa sözlük eşleşmeleri yeniden taranmaz; bu belgeninkilere
+        yalnızca eklenen kısma taşan eşleşmeler katılır.
+        """
+        doc = AnalyzedDocument(self._text + suffix, self._analyzer)
+        lower = doc.lower
+        if lower[:len(self.lower)] == self.lower:
+            matcher = self._analyzer.matcher
+            tail = lower[max(0, len(self.lower) - matcher.max_length + 1):]
+            doc._memo['hits'] = self.hits | matcher.found(tail)
+        return doc
+
+def _incidence_matrix(rows: List[set], index: Dict[str, int]):
+    """Her satırda geçen desenlerden (küme) 0/1 değerli seyrek satır x desen matrisi kur"""
+    indptr = [0]
+    indices: List[int] = []
+    for row in rows:
+        indices.extend(index[pattern] for pattern in row)
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.int64)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), len(index)))
+
+class DocumentFrequencyTable:
+    """TF-IDF/BM25 anahtar kelime puanlaması için kalıcı belge sıklığı tablosu.
+
+    Her terimin geçtiği haber sayısı, toplam haber ve token sayısı SQLite'ta
+    tutulur ve bellekte de bulunur; bir haberin puanlanması yalnızca kendi
+    token'larına bakar, derlem yeniden taranmaz. Haberler içerik özetiyle
+    tekilleştirilir, aynı haber ikinci kez sayılmaz. Yeni haberler bellekte
+    hemen sayılır, diske 'flush_every' haberde bir tek işlemle eklenir.
+    Aynı dosyayı birden çok süreç güncelleyebilir: artışlar toplanarak
+    yazılır, başka bir sürecin yazdığı görülünce tablo yeniden okunur.
+    """
+
+    def __init__(self, path: str = KEYWORD_STATS_PATH, flush_every: int = KEYWORD_STATS_FLUSH):
+        self.path = path
+        self.flush_every = flush_every
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._conn:
+            self._conn.executescript(
+                "CREATE TABLE IF NOT EXISTS terms (term TEXT PRIMARY KEY, df INTEGER NOT NULL) WITHOUT ROWID;"
+                "CREATE TABLE IF NOT EXISTS documents (key BLOB PRIMARY KEY) WITHOUT ROWID;"
+                "CREATE TABLE IF NOT EXISTS totals (name TEXT PRIMARY KEY, value INTEGER NOT NULL) WITHOUT ROWID;"
+            )
+        # Henüz yazılmamış haberler: özetin ilk 8 baytı -> (token sayısı, terimler)
+        self._pending: Dict[bytes, Tuple[int, Tuple[str, ...]]] = {}
+        self.stats = {"documents": 0, "duplicates": 0, "flushes": 0, "reloads": 0}
+        self._load()
+
+    def _load(self):
+        self.df: Dict[str, int] = dict(self._conn.execute("SELECT term, df FROM terms"))
+        totals = dict(self._conn.execute("SELECT name, value FROM totals"))
+        self.documents = totals.get("documents", 0)
+        self.total_tokens = totals.get("tokens", 0)
+        self._data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        for length, terms in self._pending.values():
+            self._count(length, terms)
+
+    def _count(self, length: int, terms: Tuple[str, ...]):
+        df = self.df
+        for term in terms:
+            df[term] = df.get(term, 0) + 1
+        self.documents += 1
+        self.total_tokens += length
+
+    def add(self, key: str, terms: Iterable[str], length: int) -> bool:
+        """İçerik özeti 'key' olan haberin farklı terimlerini say; daha önce sayıldıysa False döndür"""
+        digest = bytes.fromhex(key[:16])
+        with self._lock:
+            if digest in self._pending or self._conn.execute(
+                    "SELECT 1 FROM documents WHERE key = ?", (digest,)).fetchone():
+                self.stats["duplicates"] += 1
+                return False
+            terms = tuple(terms)
+            self._pending[digest] = (length, terms)
+            self._count(length, terms)
+            self.stats["documents"] += 1
+            if len(self._pending) >= self.flush_every:
+                self._flush()
+        return True
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        deltas: Dict[str, int] = {}
+        documents = tokens = 0
+        with self._conn:
+            for digest, (length, terms) in self._pending.items():
+                # Başka bir süreç aynı haberi saymışsa eklenmez
+                if self._conn.execute("INSERT OR IGNORE INTO documents (key) VALUES (?)", (digest,)).rowcount:
+                    documents += 1
+                    tokens += length
+                    for term in terms:
+                        deltas[term] = deltas.get(term, 0) + 1
+            self._conn.executemany(
+                "INSERT INTO terms (term, df) VALUES (?, ?)"
+                " ON CONFLICT(term) DO UPDATE SET df = df + excluded.df", deltas.items())
+            self._conn.executemany(
+                "INSERT INTO totals (name, value) VALUES (?, ?)"
+                " ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                (("documents", documents), ("tokens", tokens)))
+        skipped = len(self._pending) - documents
+        self._pending.clear()
+        self.stats["flushes"] += 1
+        if skipped or self._conn.execute("PRAGMA data_version").fetchone()[0] != self._data_version:
+            self._load()
+            self.stats["reloads"] += 1
+
+    def weights(self, counts: Dict[str, int], length: int, method: str = 'bm25') -> Dict[str, float]:
+        """Haberdeki terim sayılarından terim -> TF-IDF ya da BM25 ağırlığı"""
+        n = max(self.documents, 1)
+        df = self.df
+        if method == 'tfidf':
+            # Yumuşatılmış idf: ln((1 + N) / (1 + df)); her haberde geçen terim sıfır alır
+            return {term: count / length * math.log((1 + n) / (1 + df.get(term, 0)))
+                    for term, count in counts.items()}
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / (self.total_tokens / n if self.total_tokens else length))
+        return {term: math.log(1 + (n - df.get(term, 0) + 0.5) / (df.get(term, 0) + 0.5))
+                * count * (BM25_K1 + 1) / (count + norm)
+                for term, count in counts.items()}
+
+    def top_terms(self, counts: Dict[str, int], length: int, top_n: int = 20,
+                  method: str = 'bm25') -> Dict[str, float]:
+        """En yüksek ağırlıklı 'top_n' terim (eşitlikte metindeki ilk geçiş önce)"""
+        if not counts:
+            return {}
+        best = heapq.nlargest(top_n, self.weights(counts, length, method).items(), key=lambda item: item[1])
+        return {term: round(weight, 4) for term, weight in best}
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def report(self) -> str:
+        st = self.stats
+        return (f"📚 Anahtar kelime istatistikleri: {self.documents} haber, {len(self.df)} terim "
+                f"({st['documents']} yeni, {st['duplicates']} tekrar atlandı)")
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+class ImprovedTurkishNLPAnalyzer:
+    """Türkçe haber metinleri için NLP adımları.
+
+    Anahtar kelimeler varsayılan olarak metin içi sıklıkla sıralanır.
+    'keyword_stats' verilirse TF-IDF ya da BM25 ('keyword_scoring',
+    varsayılan 'bm25') ile sıralanır ve her haber tablonun belge
+    sıklıklarına eklenir.
+    """
+
+    def __init__(self, keyword_stats: Optional[DocumentFrequencyTable] = None,
+                 keyword_scoring: Optional[str] = None):
+        self.keyword_scoring = keyword_scoring or ('frequency' if keyword_stats is None else 'bm25')
+        if self.keyword_scoring not in KEYWORD_SCORING_MODES:
+            raise ValueError(f"Bilinmeyen anahtar kelime puanlaması: {self.keyword_scoring} "
+                             f"(geçerli: {', '.join(KEYWORD_SCORING_MODES)})")
+        if self.keyword_scoring != 'frequency' and keyword_stats is None:
+            raise ValueError(f"'{self.keyword_scoring}' puanlaması için belge sıklığı tablosu gerekli")
+        self.keyword_stats = keyword_stats
+        
+        # Sözlükler yerel paketten gelir; örnek üzerindeki değişiklikler pakete yansımaz
+        resources = load_nlp_resources()
+        
+        # Türkçe stopwords (NLTK listesi) ve ek stopwords
+        self.turkish_stopwords = set(resources['turkish_stopwords'])
+        self.turkish_stopwords.update(resources['extra_stopwords'])
+        
+        # Anahtar kelime kategorileri
+        self.keyword_categories = {category: list(keywords)
+                                   for category, keywords in resources['keyword_categories'].items()}
+        
+        # Duygu yüklü kelimeler
+        self.sentiment_words = {sentiment: list(words)
+                                for sentiment, words in resources['sentiment_words'].items()}
+        
+        # Finansal terimler cümle puanına ek +2 verir
+        self.financial_sentiment_words = {sentiment: list(words)
+                                          for sentiment, words in resources['financial_sentiment_words'].items()}
+        
+        # Başlıkta (ilk 100 karakter) geçen negatif kelimeler +2 verir
+        self.title_negative_words = list(resources['title_negative_words'])
+        
+        self.compile_lexicons()
+    
+    def compile_lexicons(self):
+        """Sözlükleri tek bir Aho–Corasick eşleyicisine derle.
+
+        Sözlükler sonradan değiştirilirse yeniden çağrılmalıdır.
+        """
+        self.matcher = KeywordMatcher()
+        for category, keywords in self.keyword_categories.items():
+            for keyword in keywords:
+                self.matcher.add(keyword, ('category', category))
+        for sentiment, words in self.sentiment_words.items():
+            for word in words:
+                self.matcher.add(word, ('sentiment', sentiment))
+        for sentiment, words in self.financial_sentiment_words.items():
+            for word in words:
+                self.matcher.add(word, ('financial', sentiment))
+        for word in self.title_negative_words:
+            self.matcher.add(word, ('title', 'negatif'))
+        
+        # Desen başına cümle puanı katkısı; sözlükte tekrar eden kelimeler tekrar sayılır
+        self._sentence_weights = {}
+        for pattern, tags in self.matcher.tags.items():
+            weights = {}
+            for kind, sentiment in tags:
+                if kind in ('sentiment', 'financial'):
+                    weights[sentiment] = weights.get(sentiment, 0) + (1 if kind == 'sentiment' else 2)
+            if weights:
+                self._sentence_weights[pattern] = weights
+    
+    def document(self, text: Union[str, AnalyzedDocument]) -> AnalyzedDocument:
+        """Metni analiz adımları arasında paylaşılan belgeye çevir (zaten belgeyse aynen döner)"""
+        if isinstance(text, AnalyzedDocument):
+            return text
+        return AnalyzedDocument(text, self)
+    
+    def preprocess_text(self, text: Union[str, AnalyzedDocument], use_stemming: bool = False) -> List[str]:
         """Metni temizle ve token'lara ayır"""
-        # Küçük harfe çevir
-        text = text.lower()
+        tokens = list(self.document(text).tokens)
+        
+        # Kök bulmayı kaldırdık - çok agresifti
+        # Sadece basit son ekleri kaldır
+        if use_stemming:
+            tokens = [self._simple_stem(token) for token in tokens]
         
+        return tokens
+    
+    def tokenize_lower(self, text: str) -> List[str]:
+        """Küçük harfe çevrilmiş metni temizle ve token'lara ayır"""
         # Özel karakterleri temizle (sayıları koru)
         text = re.sub(r'[^\w\s%.,]', ' ', text)
         
-        try:
-            # Tokenize
-            tokens = word_tokenize(text, language='turkish')
-        except:
-            # Fallback: basit split
-            tokens = text.split()
+        tokens = tr_word_tokenize(text)
         
         # Stopwords'leri ve kısa kelimeleri kaldır
         tokens = [token for token in tokens 
@@ -337,11 +1878,6 @@ class ImprovedTurkishNLPAnalyzer:
                  and len(token) > 2 
                  and not token.isdigit()]
         
-        # Kök bulmayı kaldırdık - çok agresifti
-        # Sadece basit son ekleri kaldır
-        if use_stemming:
-            tokens = [self._simple_stem(token) for token in tokens]
-        
         return tokens
     
     def _simple_stem(self, word: str) -> str:
@@ -357,43 +1893,129 @@ class ImprovedTurkishNLPAnalyzer:
         
         return word
     
-    def extract_keywords(self, text: str, top_n: int = 20) -> Dict:
-        """Metinden anahtar kelimeler çıkar"""
+    def extract_keywords(self, text: Union[str, AnalyzedDocument], top_n: int = 20,
+                         document_key: Optional[str] = None) -> Dict:
+        """Metinden anahtar kelimeler çıkar
+        
+        TF-IDF/BM25 puanlamasında top_keywords değerleri ağırlıklardır;
+        'document_key' (içerik özeti) verilirse haber önce belge
+        sıklıklarına eklenir.
+        """
+        doc = self.document(text)
         # Kök bulma OLMADAN
-        tokens = self.preprocess_text(text, use_stemming=False)
+        tokens = doc.tokens
         
         # Kelime frekansları
         word_freq = Counter(tokens)
         
-        # Kategori bazlı anahtar kelimeleri bul
-        category_keywords = {}
-        text_lower = text.lower()
+        # Kategori bazlı anahtar kelimeleri bul (tek geçişte)
+        category_keywords = self._category_keywords(doc.hits)
         
-        for category, keywords in self.keyword_categories.items():
-            found_keywords = []
-            for keyword in keywords:
-                if keyword in text_lower:
-                    found_keywords.append(keyword)
+        if self.keyword_scoring == 'frequency':
+            # En sık geçen kelimeler
+            top_keywords = dict(word_freq.most_common(top_n))
+        else:
+            top_keywords = self._ranked_terms(word_freq, len(tokens), top_n, document_key)
+        
+        keywords = {
+            'top_keywords': top_keywords,
+            'category_keywords': category_keywords,
+            'total_tokens': len(tokens),
+            'unique_tokens': len(word_freq)
+        }
+        if self.keyword_scoring != 'frequency':
+            keywords['keyword_scoring'] = self.keyword_scoring
+        return keywords
+    
+    def rank_keywords(self, text: Union[str, AnalyzedDocument], top_n: int = 20,
+                      document_key: Optional[str] = None) -> Dict[str, float]:
+        """extract_keywords'ün TF-IDF/BM25 top_keywords'ü; önbellekten gelen analizler için"""
+        tokens = self.document(text).tokens
+        return self._ranked_terms(Counter(tokens), len(tokens), top_n, document_key)
+    
+    def _ranked_terms(self, word_freq: Counter, length: int, top_n: int,
+                      document_key: Optional[str]) -> Dict[str, float]:
+        # Derlem genelinde yaygın kelimeler ('önceki', 'yüzde') geri düşer
+        if document_key is not None:
+            self.keyword_stats.add(document_key, word_freq, length)
+        return self.keyword_stats.top_terms(word_freq, length, top_n, self.keyword_scoring)
+    
+    def _category_keywords(self, found: set, categories: Optional[Iterable[str]] = None) -> Dict:
+        """Bulunan desenlerden kategori -> anahtar kelimeler sözlüğü (sözlük sırasıyla)"""
+        category_keywords = {}
+        for category in (self.keyword_categories if categories is None else categories):
+            found_keywords = [keyword for keyword in self.keyword_categories[category] if keyword in found]
             if found_keywords:
                 category_keywords[category] = found_keywords
+        return category_keywords
+    
+    def _pattern_index(self) -> Dict[str, int]:
+        """Eşleyicideki her desenin matris sütun numarası"""
+        return {pattern: i for i, pattern in enumerate(self.matcher.tags)}
+    
+    def extract_keywords_batch(self, texts: List[Union[str, AnalyzedDocument]], top_n: int = 20,
+                               document_keys: Optional[List[str]] = None) -> List[Dict]:
+        """
+        extract_keywords'ün toplu sürümü; her metin için aynı sözlüğü döndürür.
+        
+        Tüm grup için ortak sözlüklü tek bir seyrek doküman-terim matrisi
+        kurulur; frekanslar, en sık kelimeler ve kategori eşleşmeleri matris
+        işlemleriyle hesaplanır. TF-IDF/BM25 puanlamasında belge sıklıkları
+        haber haber güncellendiği için metinler sırayla işlenir.
+        """
+        if sparse is None or self.keyword_scoring != 'frequency':
+            keys = document_keys or [None] * len(texts)
+            return [self.extract_keywords(text, top_n, key) for text, key in zip(texts, keys)]
+        docs = [self.document(text) for text in texts]
+        n = len(docs)
+        if n == 0:
+            return []
+        
+        # Token -> sütun; aynı (doküman, terim) çiftleri np.unique ile sayılır
+        vocabulary: Dict[str, int] = {}
+        term_ids: List[int] = []
+        lengths = np.zeros(n, dtype=np.int64)
+        for row, doc in enumerate(docs):
+            term_ids.extend(vocabulary.setdefault(token, len(vocabulary)) for token in doc.tokens)
+            lengths[row] = len(doc.tokens)
+        width = max(len(vocabulary), 1)
+        rows = np.repeat(np.arange(n, dtype=np.int64), lengths)
+        keys, first_seen, counts = np.unique(rows * width + np.asarray(term_ids, dtype=np.int64),
+                                             return_index=True, return_counts=True)
+        dtm_rows, dtm_cols = np.divmod(keys, width)
+        dtm = sparse.csr_matrix((counts, (dtm_rows, dtm_cols)), shape=(n, width))
         
-        # En sık geçen kelimeler
-        top_keywords = dict(word_freq.most_common(top_n))
+        # Counter.most_common sırası: sayıya göre azalan, eşitlikte ilk görülen önce
+        order = np.lexsort((first_seen, -counts, dtm_rows))
+        ranks = np.arange(len(order)) - dtm.indptr[dtm_rows[order]]
+        keep = order[ranks < top_n]
+        terms = list(vocabulary)
+        top_keywords: List[Dict[str, int]] = [{} for _ in range(n)]
+        for row, col, count in zip(dtm_rows[keep].tolist(), dtm_cols[keep].tolist(), counts[keep].tolist()):
+            top_keywords[row][terms[col]] = count
         
-        return {
-            'top_keywords': top_keywords,
-            'category_keywords': category_keywords,
-            'total_tokens': len(tokens),
-            'unique_tokens': len(set(tokens))
-        }
+        # Kategori varlığı: doküman x desen @ desen x kategori
+        index = self._pattern_index()
+        categories = list(self.keyword_categories)
+        membership = np.zeros((len(index), len(categories)), dtype=np.int64)
+        for c, category in enumerate(categories):
+            for keyword in self.keyword_categories[category]:
+                membership[index[keyword], c] = 1
+        present = (_incidence_matrix([doc.hits for doc in docs], index) @ membership) > 0
+        
+        total_tokens = np.asarray(dtm.sum(axis=1)).ravel().tolist()
+        unique_tokens = np.diff(dtm.indptr).tolist()
+        return [{
+            'top_keywords': top_keywords[row],
+            'category_keywords': self._category_keywords(
+                docs[row].hits, [categories[c] for c in np.flatnonzero(present[row])]),
+            'total_tokens': total_tokens[row],
+            'unique_tokens': unique_tokens[row]
+        } for row in range(n)]
     
-    def analyze_sentiment(self, text: str) -> Dict:
+    def analyze_sentiment(self, text: Union[str, AnalyzedDocument]) -> Dict:
         """Gelişmiş duygu analizi"""
-        try:
-            sentences = sent_tokenize(text, language='turkish')
-        except:
-            # Basit cümle bölme
-            sentences = re.split(r'[.!?]+', text)
+        doc = self.document(text)
         
         # Başlık sentiment'i için özel kontrol
         sentiment_scores = {
@@ -403,37 +2025,23 @@ class ImprovedTurkishNLPAnalyzer:
         }
         
         # Başlıkta negatif kelimeler varsa ek puan
-        title_negatives = ['kayıp', 'kaybı', 'düşüş', 'zarar', 'kötü', 'olumsuz']
-        for word in title_negatives:
-            if word in text[:100].lower():  # İlk 100 karakter (başlık ve giriş)
+        title_found = doc.head_hits  # İlk 100 karakter (başlık ve giriş)
+        for word in self.title_negative_words:
+            if word in title_found:
                 sentiment_scores['negatif'] += 2
         
         # Her cümle için sentiment analizi
         sentence_sentiments = []
-        for sentence in sentences:
+        for sentence, found in zip(doc.sentences, doc.sentence_hits):
             if len(sentence.strip()) < 5:
                 continue
                 
-            sentence_lower = sentence.lower()
             sentence_score = {'pozitif': 0, 'negatif': 0, 'nötr': 0}
             
-            # Kelime bazlı sentiment
-            for sentiment, words in self.sentiment_words.items():
-                for word in words:
-                    if word in sentence_lower:
-                        sentence_score[sentiment] += 1
-            
-            # Finansal terimler için ek puan
-            financial_positives = ['artış', 'artan', 'yükseliş', 'büyüme', 'olumlu']
-            financial_negatives = ['düşüş', 'azalan', 'kayıp', 'kaybı', 'olumsuz']
-            
-            for word in financial_positives:
-                if word in sentence_lower:
-                    sentence_score['pozitif'] += 2
-            
-            for word in financial_negatives:
-                if word in sentence_lower:
-                    sentence_score['negatif'] += 2
+            # Kelime bazlı sentiment ve finansal terimler için ek puan
+            for word in found:
+                for sentiment, weight in self._sentence_weights.get(word, {}).items():
+                    sentence_score[sentiment] += weight
             
             # Cümlenin dominant sentiment'i
             if sentence_score['pozitif'] > sentence_score['negatif']:
@@ -447,6 +2055,10 @@ class ImprovedTurkishNLPAnalyzer:
             for sentiment in sentiment_scores:
                 sentiment_scores[sentiment] += sentence_score[sentiment]
         
+        return self._sentiment_result(sentiment_scores, sentence_sentiments)
+    
+    def _sentiment_result(self, sentiment_scores: Dict, sentence_sentiments: List[str]) -> Dict:
+        """Toplam puanlardan ve cümle etiketlerinden duygu analizi sonucunu kur"""
         # Toplam sentiment belirleme
         total = sum(sentiment_scores.values())
         if total > 0:
@@ -473,25 +2085,60 @@ class ImprovedTurkishNLPAnalyzer:
             'neutral_sentences': len([s for s in sentence_sentiments if s == 'nötr'])
         }
     
-    def extract_financial_entities(self, text: str) -> Dict:
-        """Finansal varlıkları ve sayısal verileri çıkar - GELİŞTİRİLMİŞ"""
-        # Gelişmiş yüzde oranları bulma
-        percentages = []
+    def analyze_sentiment_batch(self, texts: List[Union[str, AnalyzedDocument]]) -> List[Dict]:
+        """
+        analyze_sentiment'in toplu sürümü; her metin için aynı sözlüğü döndürür.
+        
+        Gruptaki tüm cümleler tek bir cümle x desen seyrek matrisine konur;
+        cümle puanları desen ağırlıklarıyla tek çarpımda, doküman toplamları
+        cümle -> doküman matrisiyle hesaplanır.
+        """
+        if sparse is None:
+            return [self.analyze_sentiment(text) for text in texts]
+        docs = [self.document(text) for text in texts]
+        n = len(docs)
+        if n == 0:
+            return []
+        labels = ('pozitif', 'negatif', 'nötr')
+        index = self._pattern_index()
         
-        # Pattern 1: "yüzde 32,2" 
-        matches1 = re.findall(r'yüzde\s+(\d+[.,]?\d*)', text.lower())
-        percentages.extend([float(m.replace(',', '.')) for m in matches1])
+        weights = np.zeros((len(index), 3), dtype=np.int64)
+        for pattern, pattern_weights in self._sentence_weights.items():
+            for sentiment, weight in pattern_weights.items():
+                weights[index[pattern], labels.index(sentiment)] = weight
+        title_weights = np.zeros(len(index), dtype=np.int64)
+        for word in self.title_negative_words:
+            title_weights[index[word]] += 2
         
-        # Pattern 2: "%32,2"
-        matches2 = re.findall(r'%(\d+[.,]?\d*)', text.lower())
-        percentages.extend([float(m.replace(',', '.')) for m in matches2])
+        # Kısa (< 5 karakter) cümleler tek tek analizde olduğu gibi atlanır
+        sentence_hits, sentence_docs = [], []
+        for row, doc in enumerate(docs):
+            for sentence, found in zip(doc.sentences, doc.sentence_hits):
+                if len(sentence.strip()) >= 5:
+                    sentence_hits.append(found)
+                    sentence_docs.append(row)
+        scores = _incidence_matrix(sentence_hits, index) @ weights
+        dominant = np.where(scores[:, 0] > scores[:, 1], 0, np.where(scores[:, 1] > scores[:, 0], 1, 2))
+        to_doc = sparse.csr_matrix((np.ones(len(sentence_docs), dtype=np.int64),
+                                    (sentence_docs, np.arange(len(sentence_docs)))),
+                                   shape=(n, len(sentence_docs)))
+        doc_scores = to_doc @ scores
+        doc_scores[:, 1] += _incidence_matrix([doc.head_hits for doc in docs], index) @ title_weights
         
-        # Pattern 3: "oranında 32,2"
-        matches3 = re.findall(r'oranında\s+(\d+[.,]?\d*)', text.lower())
-        percentages.extend([float(m.replace(',', '.')) for m in matches3])
+        sentence_labels: List[List[str]] = [[] for _ in range(n)]
+        for row, label in zip(sentence_docs, dominant.tolist()):
+            sentence_labels[row].append(labels[label])
+        return [self._sentiment_result(dict(zip(labels, doc_scores[row].tolist())), sentence_labels[row])
+                for row in range(n)]
+    
+    def extract_financial_entities(self, text: Union[str, AnalyzedDocument]) -> Dict:
+        """Finansal varlıkları ve sayısal verileri çıkar - GELİŞTİRİLMİŞ"""
+        doc = self.document(text)
+        scan = scan_financial_text(doc.lower)
+        percentages = scan['percentages']
         
         # Tüm sayıları bul (binlik, milyonluk değerler)
-        all_numbers = re.findall(r'\b(\d+[.,]?\d*)\b', text)
+        all_numbers = _ALL_NUMBERS.findall(doc.text)
         numbers = []
         for n in all_numbers:
             try:
@@ -501,43 +2148,22 @@ class ImprovedTurkishNLPAnalyzer:
             except:
                 pass
         
-        # Para birimleri
-        currency_patterns = {
-            'tl': r'(\d+[.,]?\d*)\s*(tl|₺|türk lirası)',
-            'dolar': r'(\d+[.,]?\d*)\s*(\$|dolar|usd)',
-            'euro': r'(\d+[.,]?\d*)\s*(€|euro|eur)'
-        }
-        
-        currency_values = {}
-        for currency, pattern in currency_patterns.items():
-            matches = re.findall(pattern, text.lower())
-            if matches:
-                currency_values[currency] = [float(m[0].replace(',', '.')) for m in matches]
-        
-        # Zaman ifadeleri
-        time_expressions = re.findall(
-            r'(\d+\s*(ay|yıl|hafta|gün|saat)\s*(önce|içinde|sonra)?)', 
-            text.lower()
-        )
-        
-        # KFE (Konut Fiyat Endeksi) değerleri
-        kfe_values = re.findall(r'kfe.*?(\d+[.,]?\d+)', text.lower())
-        kfe_values = [float(v.replace(',', '.')) for v in kfe_values]
-        
         return {
             'percentages': percentages,
             'significant_numbers': numbers[:20],
-            'currency_values': currency_values,
-            'time_expressions': time_expressions,
-            'kfe_values': kfe_values,
+            'currency_values': scan['currency_values'],
+            'time_expressions': scan['time_expressions'],
+            'kfe_values': scan['kfe_values'],
             'max_percentage': max(percentages) if percentages else None,
             'min_percentage': min(percentages) if percentages else None,
             'avg_percentage': np.mean(percentages) if percentages else None,
             'total_percentages': len(percentages)
         }
     
-    def analyze_temporal_context(self, text: str, publish_date: Optional[str] = None) -> Dict:
+    def analyze_temporal_context(self, text: Union[str, AnalyzedDocument],
+                                 publish_date: Optional[str] = None) -> Dict:
         """Zamansal bağlam analizi"""
+        lower = self.document(text).lower
         temporal_keywords = {
             'kısa_vade': ['kısa vadede', 'yakın dönemde', 'önümüzdeki ay', 'birkaç ay içinde',
                          '3 ay', '6 ay', 'kısa sürede', 'yakın zamanda'],
@@ -551,38 +2177,18 @@ class ImprovedTurkishNLPAnalyzer:
         
         time_context = {}
         for period, keywords in temporal_keywords.items():
-            count = sum(1 for keyword in keywords if keyword in text.lower())
+            count = sum(1 for keyword in keywords if keyword in lower)
             time_context[period] = count
         
         # Yayın tarihi analizi
         date_analysis = {}
-        if publish_date:
-            try:
-                # Tarihi parse et
-                if 'giriş' in publish_date.lower():
-                    date_str = publish_date.split(':')[-1].strip()
-                else:
-                    date_str = publish_date
-                
-                # Tarihi parse etmeye çalış
-                date_formats = ['%d %B %Y', '%d.%m.%Y', '%d/%m/%Y', '%Y-%m-%d']
-                parsed_date = None
-                
-                for fmt in date_formats:
-                    try:
-                        parsed_date = datetime.strptime(date_str, fmt)
-                        break
-                    except:
-                        continue
-                
-                if parsed_date:
-                    date_analysis = {
-                        'published_date': parsed_date.strftime('%Y-%m-%d'),
-                        'days_ago': (datetime.now() - parsed_date).days,
-                        'recency': 'recent' if (datetime.now() - parsed_date).days <= 7 else 'old'
-                    }
-            except:
-                pass
+        parsed_date = parse_publish_date(publish_date)
+        if parsed_date:
+            date_analysis = {
+                'published_date': parsed_date.strftime('%Y-%m-%d'),
+                'days_ago': (datetime.now() - parsed_date).days,
+                'recency': 'recent' if (datetime.now() - parsed_date).days <= 7 else 'old'
+            }
         
         return {
             'time_context': time_context,
@@ -591,80 +2197,705 @@ class ImprovedTurkishNLPAnalyzer:
         }
 
 
+_PUBLISH_DATE_FORMATS = ('%d.%m.%Y', '%d/%m/%Y', '%Y-%m-%d')
+_TURKISH_MONTHS = {name: number for number, name in enumerate(
+    ('ocak', 'şubat', 'mart', 'nisan', 'mayıs', 'haziran', 'temmuz',
+     'ağustos', 'eylül', 'ekim', 'kasım', 'aralık'), start=1)}
+_TURKISH_DATE_PATTERN = re.compile(r'(\d{1,2})\s+(' + '|'.join(_TURKISH_MONTHS) + r')\s+(\d{4})')
+_NUMERIC_DATE_PATTERN = re.compile(r'\d{1,4}[./-]\d{1,2}[./-]\d{1,4}')
+_district_patterns: Dict[str, Any] = {}
+
+def parse_publish_date(publish_date: Optional[str]) -> Optional[datetime]:
+    """Yayın tarihini çöz; tanınmazsa None döndür.
+
+    Sitedeki biçim ('Giriş: 16 Ekim 2025, Perşembe 10:04') ile sayısal
+    biçimler ('05.03.2025', '2025-03-05') tanınır; ön ek, gün adı ve saat
+    yok sayılır.
+    """
+    if not isinstance(publish_date, str) or not publish_date:
+        return None
+    lower = turkish_lower(publish_date)
+    match = _TURKISH_DATE_PATTERN.search(lower)
+    if match:
+        try:
+            return datetime(int(match.group(3)), _TURKISH_MONTHS[match.group(2)], int(match.group(1)))
+        except ValueError:
+            return None
+    match = _NUMERIC_DATE_PATTERN.search(lower)
+    if match:
+        for fmt in _PUBLISH_DATE_FORMATS:
+            try:
+                return datetime.strptime(match.group(0), fmt)
+            except ValueError:
+                continue
+    return None
+
+def turkish_lower(text: str) -> str:
+    """Türkçe küçük harf: 'İ' -> 'i', 'I' -> 'ı' (str.lower 'İ'yi 'i̇' yapar)"""
+    return text.replace('İ', 'i').replace('I', 'ı').lower()
+
+def extract_districts(text: str) -> List[str]:
+    """Metinde geçen İstanbul ilçeleri, ilk geçiş sırasıyla ve tekrarsız.
+
+    İlçe adı tam kelime olarak ya da kesme işaretli ekiyle (Kadıköy'de,
+    KADIKÖY'DEKİ) eşleşir; 'kartallar' gibi bitişik türetmeler sayılmaz.
+    Kişi ya da cins adı da olabilen ilçeler (Fatih, Kartal, Adalar...) ise
+    yalnızca kesme işaretli ekle ya da ardından 'ilçesi', 'Belediyesi',
+    'sahili' gibi bir yer sözcüğü gelince sayılır; 'TCMB Başkanı Fatih
+    Karahan' ya da 'Kartal kulübü' ilçe değildir.
+    """
+    pattern = _district_patterns.get('districts')
+    if pattern is None:
+        resources = load_nlp_resources()
+        ambiguous = set(resources['ambiguous_districts'])
+        names = sorted(resources['istanbul_districts'], key=len, reverse=True)
+        plain = '|'.join(re.escape(name) for name in names if name not in ambiguous)
+        guarded = '|'.join(re.escape(name) for name in names if name in ambiguous)
+        context = '|'.join(map(re.escape, resources['district_context_words']))
+        pattern = re.compile(r"\b(?:(" + plain + r")(?!\w)|(" + guarded + r")(?=['’]\w|\s+(?:" + context + r")))")
+        _district_patterns['districts'] = pattern
+    return list(dict.fromkeys(match.group(match.lastindex)
+                              for match in pattern.finditer(turkish_lower(text))))
+
+class AnalysisCache:
+    """İçerik özetine göre anahtarlanan iki katmanlı analiz önbelleği.
+
+    Sonuçlar pickle'lanmış olarak bellekte boyut sınırlı bir LRU'da ve SQLite
+    dosyasında saklanır; bellekte bulunamayan kayıt diskten okunup LRU'ya
+    alınır. Her okuma yeni bir kopya döndürür, çağıranın sonucu değiştirmesi
+    önbelleği bozmaz. Anahtarlar sözlük/kural sürümünü içerdiğinden kurallar
+    değişince eski kayıtlar kendiliğinden ıskalanır; prune() onları siler.
+    Thread'ler arasında paylaşılabilir.
+    """
+
+    def __init__(self, path: str = ANALYSIS_CACHE_PATH, max_entries: int = ANALYSIS_CACHE_SIZE):
+        self.path = path
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS analyses ("
+                " key TEXT PRIMARY KEY,"
+                " version TEXT NOT NULL,"
+                " result BLOB NOT NULL,"
+                " created_at REAL NOT NULL)"
+            )
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    def _remember(self, key: str, blob: bytes):
+        self._memory[key] = blob
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def get(self, version: str, key: str) -> Optional[Any]:
+        key = f"{version}:{key}"
+        with self._lock:
+            blob = self._memory.get(key)
+            if blob is not None:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+            else:
+                row = self._conn.execute("SELECT result FROM analyses WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self.stats["misses"] += 1
+                    return None
+                blob = row[0]
+                self._remember(key, blob)
+                self.stats["disk_hits"] += 1
+        return pickle.loads(blob)
+
+    def put(self, version: str, key: str, result: Any):
+        key = f"{version}:{key}"
+        blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock, self._conn:
+            self._remember(key, blob)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analyses (key, version, result, created_at) VALUES (?, ?, ?, ?)",
+                (key, version, blob, time.time()),
+            )
+
+    def prune(self, version: str) -> int:
+        """Başka bir sözlük/kural sürümüyle üretilmiş kayıtları sil; silinen sayısını döndür."""
+        with self._lock, self._conn:
+            for key in [key for key in self._memory if not key.startswith(version + ":")]:
+                del self._memory[key]
+            return self._conn.execute("DELETE FROM analyses WHERE version != ?", (version,)).rowcount
+
+    def hit_rate(self) -> float:
+        st = self.stats
+        lookups = st["memory_hits"] + st["disk_hits"] + st["misses"]
+        return (st["memory_hits"] + st["disk_hits"]) / lookups if lookups else 0.0
+
+    def report(self) -> str:
+        st = self.stats
+        return (f"🧠 Analiz önbelleği: {st['memory_hits']} bellek, {st['disk_hits']} disk isabeti, "
+                f"{st['misses']} analiz (isabet oranı %{self.hit_rate() * 100:.1f})")
+
+    def close(self):
+        self._conn.close()
+
+# Kelime karmalarını shingle karmasında birleştiren çarpan (64 bit, tek sayı)
+_SHINGLE_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+def _lsh_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """İmzanın (bant, satır) bölünüşü.
+
+    LSH S-eğrisinin dönüm noktası (1/b)^(1/r) eşiği geçmeyenlerin en
+    büyüğü seçilir: eşiğin biraz altındaki çiftler de aday olur (kopya
+    kaçırılmaz), fazladan adaylar imza karşılaştırmasıyla elenir.
+    """
+    splits = [(num_perm // rows, rows) for rows in range(1, num_perm + 1) if num_perm % rows == 0]
+    return max(splits, key=lambda bands_rows: ((1 / bands_rows[0]) ** (1 / bands_rows[1]) <= threshold,
+                                               (1 / bands_rows[0]) ** (1 / bands_rows[1])))
+
+class NearDuplicateIndex:
+    """MinHash imzaları ve LSH bantlarıyla yakın kopya haber kümeleri.
+
+    Haber metni kelime shingle'larına bölünüp MinHash imzasına çevrilir.
+    İmza bantlara ayrılır ve her bant bir karma tablosunda aranır; yalnızca
+    en az bir bandı tutan haberler karşılaştırılır. Böylece bir arama
+    derlem boyutundan bağımsız kalır. Tahmini Jaccard benzerliği
+    'threshold'u geçen en benzer haberin kümesine katılan haber kopya
+    sayılır; hiçbiriyle eşleşmeyen haber yeni kümenin temsilcisi olur.
+    Kümenin tüm haberleri dizinlenir, böylece aynı haberin birbirinden
+    farklı kopyaları da aynı kümede toplanır. İmzalar SQLite'a
+    'flush_every' haberde bir yazılır ve sonraki çalıştırmalarda yeniden
+    yüklenir.
+    """
+
+    def __init__(self, path: str = NEAR_DUPLICATE_INDEX_PATH, threshold: float = NEAR_DUPLICATE_THRESHOLD,
+                 num_perm: int = MINHASH_PERMUTATIONS, shingle_size: int = SHINGLE_SIZE,
+                 flush_every: int = NEWS_STORE_BATCH):
+        if not 0 < threshold <= 1:
+            raise ValueError(f"Benzerlik eşiği 0 ile 1 arasında olmalı: {threshold}")
+        self.path = path
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.flush_every = flush_every
+        self.bands, self.rows = _lsh_bands(num_perm, threshold)
+        # Sabit tohum: imzalar çalıştırmalar ve süreçler arasında karşılaştırılabilir
+        # MinHash karmaları çarp-kaydır ailesindendir: ((a * x + b) mod 2^64) >> 32, a tek
+        rng = np.random.RandomState(num_perm)
+        self._a = rng.randint(0, np.iinfo(np.uint64).max, num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.randint(0, np.iinfo(np.uint64).max, num_perm, dtype=np.uint64)
+        self._word_hashes: Dict[str, int] = {}
+        # Bant -> bant değeri -> haber numaraları; haber numarası -> imza, anahtar, küme
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(self.bands)]
+        self._signatures: List[np.ndarray] = []
+        self._keys: List[str] = []
+        self._item_clusters: List[int] = []
+        self._items: Dict[str, int] = {}
+        # Küme -> temsilcinin (ilk haberin) anahtarı ve haber sayısı
+        self._representatives: List[str] = []
+        self._sizes: List[int] = []
+        self._written = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(
+                "CREATE TABLE IF NOT EXISTS settings (name TEXT PRIMARY KEY, value INTEGER NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS signatures ("
+                " id INTEGER PRIMARY KEY, key TEXT NOT NULL UNIQUE, cluster INTEGER NOT NULL,"
+                " signature BLOB NOT NULL);"
+            )
+            self._conn.executemany("INSERT OR IGNORE INTO settings (name, value) VALUES (?, ?)",
+                                   (("num_perm", num_perm), ("shingle_size", shingle_size)))
+        settings = dict(self._conn.execute("SELECT name, value FROM settings"))
+        if (settings["num_perm"], settings["shingle_size"]) != (num_perm, shingle_size):
+            raise ValueError(f"{path} {settings['num_perm']} permütasyon ve {settings['shingle_size']} "
+                             f"kelimelik shingle ile kurulmuş; aynı ayarlarla açın ya da dosyayı silin")
+        for key, cluster, signature in self._conn.execute("SELECT key, cluster, signature FROM signatures ORDER BY id"):
+            self._insert(key, np.frombuffer(signature, dtype=np.uint32), cluster)
+        self._written = len(self._keys)
+        self.stats = {"lookups": 0, "duplicates": 0, "candidates": 0}
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """Metnin MinHash imzası (uint32 dizisi); kelimesiz metinde None"""
+        # Kelimeler boşlukla ayrılır; noktalama kelimenin parçası sayılır
+        words = text.lower().split()
+        if not words:
+            return None
+        # Shingle karmaları kelime karmalarından vektörel olarak kurulur (taşma mod 2^64'tür)
+        if len(self._word_hashes) > 1 << 20:
+            self._word_hashes.clear()
+        word_hashes = np.fromiter(map(self._word_hash, words), dtype=np.uint64, count=len(words))
+        k = min(self.shingle_size, len(words))
+        n = len(words) - k + 1
+        shingles = word_hashes[:n].copy()
+        for offset in range(1, k):
+            shingles = shingles * _SHINGLE_MULTIPLIER + word_hashes[offset:offset + n]
+        shingles = np.unique(shingles)
+        return ((np.outer(shingles, self._a) + self._b) >> np.uint64(32)).min(axis=0).astype(np.uint32)
+
+    def _word_hash(self, word: str) -> int:
+        value = self._word_hashes.get(word)
+        if value is None:
+            value = self._word_hashes[word] = zlib.crc32(word.encode('utf-8'))
+        return value
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def _insert(self, key: str, signature: np.ndarray, cluster: Optional[int] = None) -> int:
+        """İmzayı dizine ekle; küme verilmezse (ya da ilk kez görülüyorsa) yeni küme aç"""
+        item = len(self._keys)
+        for bucket, band in zip(self._buckets, self._band_keys(signature)):
+            bucket.setdefault(band, []).append(item)
+        if cluster is None or cluster == len(self._representatives):
+            cluster = len(self._representatives)
+            self._representatives.append(key)
+            self._sizes.append(0)
+        self._sizes[cluster] += 1
+        self._signatures.append(signature)
+        self._keys.append(key)
+        self._item_clusters.append(cluster)
+        self._items[key] = item
+        return cluster
+
+    def _best_match(self, signature: np.ndarray) -> Optional[int]:
+        """Bant çakışan haberler içinde eşiği geçen en benzer haberin kümesi"""
+        candidates = set()
+        for bucket, band in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(bucket.get(band, ()))
+        self.stats["candidates"] += len(candidates)
+        best, best_similarity = None, self.threshold
+        for item in candidates:
+            similarity = np.count_nonzero(self._signatures[item] == signature) / self.num_perm
+            if similarity >= best_similarity:
+                best, best_similarity = item, similarity
+        return None if best is None else self._item_clusters[best]
+
+    def assign(self, key: str, text: str) -> Tuple[Optional[int], bool]:
+        """İçerik özeti 'key' olan haberi bir kümeye ata; (küme, kopya mı) döndür.
+
+        Kelimesiz metinler kümelenmez: (None, False). Daha önce atanmış bir
+        haber yeniden gelirse aynı küme döner; yalnızca temsilci kopya sayılmaz.
+        """
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                cluster = self._item_clusters[item]
+                return cluster, self._representatives[cluster] != key
+            signature = self.signature(text)
+            if signature is None:
+                return None, False
+            self.stats["lookups"] += 1
+            cluster = self._insert(key, signature, self._best_match(signature))
+            duplicate = self._representatives[cluster] != key
+            self.stats["duplicates"] += duplicate
+            if len(self._keys) - self._written >= self.flush_every:
+                self._flush()
+            return cluster, duplicate
+
+    def representative(self, cluster: int) -> str:
+        """Kümenin temsilcisinin (ilk haberinin) içerik özeti"""
+        return self._representatives[cluster]
+
+    def cluster_size(self, cluster: int) -> int:
+        return self._sizes[cluster]
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO signatures (id, key, cluster, signature) VALUES (?, ?, ?, ?)",
+                [(item + 1, self._keys[item], self._item_clusters[item], self._signatures[item].tobytes())
+                 for item in range(self._written, len(self._keys))])
+        self._written = len(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._representatives)
+
+    def report(self) -> str:
+        st = self.stats
+        candidates = st["candidates"] / st["lookups"] if st["lookups"] else 0.0
+        return (f"🧬 Yakın kopya dizini: {len(self._keys)} haber, {len(self._representatives)} küme, "
+                f"{st['lookups']} arama, {st['duplicates']} kopya (arama başına {candidates:.1f} aday, "
+                f"{self.bands} bant x {self.rows} satır, eşik {self.threshold})")
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+def load_rule_config(path: str = RULES_CONFIG_PATH) -> Tuple[Any, Dict[str, Dict]]:
+    """Karar kuralı yapılandırmasını oku ve doğrula; (sürüm, kurallar) döndür.
+
+    Her kuralın name, keywords (küçük harfli), score ve description alanları
+    olmalıdır; isteğe bağlı min_percentage verilirse bu eşiği aşan yüzdeler de
+    kuralı tetikler. Geçersiz dosyada ValueError yükselir.
+    """
+    with open(path, encoding='utf-8') as f:
+        config = json.load(f)
+    rules = config.get('rules') if isinstance(config, dict) else None
+    if not isinstance(rules, dict) or 'version' not in config:
+        raise ValueError(f"{path}: 'version' ve 'rules' alanları gerekli")
+    for rule_id, rule_info in rules.items():
+        if not (isinstance(rule_info, dict)
+                and isinstance(rule_info.get('name'), str)
+                and isinstance(rule_info.get('description'), str)
+                and isinstance(rule_info.get('score'), (int, float))
+                and isinstance(rule_info.get('keywords'), list)
+                and all(isinstance(keyword, str) and keyword for keyword in rule_info['keywords'])
+                and isinstance(rule_info.get('min_percentage', 0), (int, float))):
+            raise ValueError(f"{path}: {rule_id} kuralı geçersiz (name, keywords, score ve description gerekli)")
+    return config['version'], rules
+
+class RuleIndex:
+    """Karar kurallarının derlenmiş dizini.
+
+    Her kural anahtar kelimesi, geçtiği kuralların bit maskesine ve kuraldaki
+    sırasına eşlenir; bir kural anahtar kelimesini içeren kategori
+    kelimelerinin maskesi ilk görüldüğünde hesaplanıp saklanır. Bir haberin
+    tetiklediği kurallar, bulunan desenlerin maskeleri OR'lanarak tek bir
+    bit kümesinde toplanır; maliyet kural sayısına değil haberdeki isabet
+    sayısına bağlıdır.
+    """
+
+    def __init__(self, rules: Dict[str, Dict]):
+        self.rules = rules
+        self.rule_ids = list(rules)
+        self.keyword_masks: Dict[str, int] = {}
+        self.keyword_positions: Dict[str, List[Tuple[int, int]]] = {}
+        self.percentage_rules: List[Tuple[int, float]] = []
+        self._matcher = KeywordMatcher()
+        for r, rule_info in enumerate(rules.values()):
+            for position, keyword in enumerate(rule_info['keywords']):
+                self.keyword_masks[keyword] = self.keyword_masks.get(keyword, 0) | 1 << r
+                self.keyword_positions.setdefault(keyword, []).append((r, position))
+                self._matcher.add(keyword)
+            if rule_info.get('min_percentage') is not None:
+                self.percentage_rules.append((r, rule_info['min_percentage']))
+        self.keywords = frozenset(self.keyword_masks)
+        self._word_rules: Dict[str, Tuple[int, Tuple[int, ...]]] = {}
+
+    def word_rules(self, word: str) -> Tuple[int, Tuple[int, ...]]:
+        """Anahtar kelimelerinden biri 'word' içinde geçen kuralların maskesi ve sıraları (önbellekli)"""
+        rules = self._word_rules.get(word)
+        if rules is None:
+            mask = 0
+            for keyword in self._matcher.found(word.lower()):
+                mask |= self.keyword_masks[keyword]
+            rules = (mask, tuple(r for r in range(mask.bit_length()) if mask >> r & 1))
+            self._word_rules[word] = rules
+        return rules
+
+    def evaluate(self, found: set, category_keywords: Dict[str, List[str]],
+                 percentages: List[float]) -> Dict[str, List[str]]:
+        """Tetiklenen kural -> tetikleyen kelimeler (kural sırasıyla).
+
+        Kelimeler önce kuralın kendi anahtar kelimeleri (kuraldaki sırayla),
+        sonra onları içeren kategori kelimeleri, en son eşiği aşan yüzdeler
+        olmak üzere tekrarsız listelenir.
+        """
+        fired = 0
+        keyword_hits: Dict[int, List[Tuple[int, str]]] = {}
+        # Küme kesişimi küçük olan küme üzerinden yürür: isabet sayısıyla orantılı
+        for pattern in found & self.keywords:
+            fired |= self.keyword_masks[pattern]
+            for r, position in self.keyword_positions[pattern]:
+                keyword_hits.setdefault(r, []).append((position, pattern))
+        word_hits: Dict[int, List[str]] = {}
+        word_rules = self._word_rules
+        for words in category_keywords.values():
+            for word in words:
+                mask, rules = word_rules.get(word) or self.word_rules(word)
+                if mask:
+                    fired |= mask
+                    for r in rules:
+                        word_hits.setdefault(r, []).append(word)
+        high_percentages: Dict[int, List[float]] = {}
+        for r, threshold in self.percentage_rules:
+            high = [p for p in percentages if p > threshold]
+            if high:
+                high_percentages[r] = high
+                fired |= 1 << r
+        
+        triggered = {}
+        while fired:
+            bit = fired & -fired
+            r = bit.bit_length() - 1
+            words = [keyword for _, keyword in sorted(keyword_hits.get(r, ()))]
+            words.extend(word_hits.get(r, ()))
+            if r in high_percentages:
+                words.append(f"Yüksek oranlar: {high_percentages[r]}")
+            triggered[self.rule_ids[r]] = list(dict.fromkeys(words))
+            fired ^= bit
+        return triggered
+
 class ImprovedHousingNewsAnalyzer:
-    """Gelişmiş konut haberleri analiz sınıfı"""
+    """Gelişmiş konut haberleri analiz sınıfı
     
-    def __init__(self):
-        self.nlp_analyzer = ImprovedTurkishNLPAnalyzer()
-        
-        # Gelişmiş karar kuralları
-        self.decision_rules = {
-            'K1': {
-                'name': 'Düşük Kredi Faizi ve Talep Artışı',
-                'keywords': ['faiz indirimi', 'faiz oranı', 'kredi oranı', 'talep artışı', 
-                           'mortgage', 'tcmb', 'politika faizi'],
-                'score': 3,
-                'description': 'Düşük faiz ortamı ve artan talep'
-            },
-            'K2': {
-                'name': 'Arz Azlığı ve Fiyat Artışı',
-                'keywords': ['arz azlığı', 'fiyat artışı', 'konut fiyatı', 'kira artışı',
-                           'konut fiyat endeksi', 'kfe', 'arttı', 'yükseldi'],
-                'score': 2,
-                'description': 'Arz kısıtlılığı fiyatları yukarı çekiyor'
-            },
-            'K3': {
-                'name': 'Enflasyona Karşı Koruma',
-                'keywords': ['enflasyon', 'değer saklama', 'yatırım aracı', 'koruma',
-                           'reel değer', 'enflasyon baskısı'],
-                'score': 1,
-                'description': 'Gayrimenkul enflasyona karşı koruma sağlıyor'
-            },
-            'K4': {
-                'name': 'Aşırı Değerlenme Riski',
-                'keywords': ['aşırı değerlenme', 'balon', 'risk', 'düşüş riski',
-                           'kayıp', 'kaybı', 'düşüş', 'zarar'],
-                'score': -2,  # Daha güçlü negatif etki
-                'description': 'Aşırı değerlenme riski mevcut'
-            },
-            'K5': {
-                'name': 'İstanbul Özelinde Güçlü Performans',
-                'keywords': ['istanbul', 'kadıköy', 'beşiktaş', 'avrupa yakası',
-                           'anadolu yakası', 'semt', 'bölge'],
-                'score': 1,
-                'description': 'İstanbul özelinde güçlü performans'
-            },
-            'K6': {
-                'name': 'Yüksek Artış Oranları',
-                'keywords': ['yüzde', '%', 'oranında', 'artış', 'yükseliş'],
-                'score': 1,
-                'description': 'Yüksek yüzdelik artış oranları'
-            }
-        }
+    'cache' verilirse analyze_article ve analyze_articles sonuçları
+    AnalysisCache üzerinden saklanır ve aynı başlık/metin tekrar analiz edilmez.
+    Karar kuralları 'rules_path' yapılandırmasından yüklenir; dosya
+    değiştiğinde yeniden başlatmaya gerek kalmadan yeniden derlenir.
+    'keyword_stats' ve 'keyword_scoring' için bkz. ImprovedTurkishNLPAnalyzer.
+    'near_duplicates' verilirse her haber yakın kopya kümesine atanır; bir
+    kümenin analizi bir kez yapılır ve kopyalar onu paylaşır (başlık, URL,
+    tarih ve zamansal bağlam her haberin kendisinindir). Sonuçta küme ve
+    kopyaysa temsilcinin içerik özeti ('duplicate_of') bulunur.
+    TF-IDF/BM25 puanlamasında önbellek sürümü belge sıklığı tablosunu
+    kapsamaz: önbellekten ya da kümeden gelen haber de tabloya eklenir ve
+    top_keywords'ü güncel tabloyla yeniden sıralanır (saklanan sıralama
+    kullanılmaz).
+    """
+    
+    def __init__(self, cache: Optional[AnalysisCache] = None, rules_path: str = RULES_CONFIG_PATH,
+                 keyword_stats: Optional[DocumentFrequencyTable] = None, keyword_scoring: Optional[str] = None,
+                 near_duplicates: Optional[NearDuplicateIndex] = None):
+        self.nlp_analyzer = ImprovedTurkishNLPAnalyzer(keyword_stats, keyword_scoring)
+        self.cache = cache
+        self.near_duplicates = near_duplicates
+        # Küme -> temsilcinin pickle'lanmış analizi (her okuma yeni kopya)
+        self._cluster_analyses: "OrderedDict[int, bytes]" = OrderedDict()
+        # analysis_version() özeti; kurallar derlenince sıfırlanır
+        self._version: Optional[str] = None
+        
+        # Gelişmiş karar kuralları (bkz. karar_kurallari.json)
+        self.load_rules(rules_path)
+        if cache is not None:
+            cache.prune(self.analysis_version())
+    
+    def load_rules(self, path: Optional[str] = None):
+        """Karar kurallarını sürümlü yapılandırma dosyasından yükle ve derle"""
+        path = path or self.rules_path
+        stat = os.stat(path)
+        version, rules = load_rule_config(path)
+        self.rules_path = path
+        self.rules_version = version
+        self._rules_signature = (stat.st_mtime_ns, stat.st_size)
+        self.decision_rules = rules
+        self.compile_rules()
+    
+    def reload_rules(self) -> bool:
+        """Kural dosyası değiştiyse yeniden yükle; yüklendiyse True döndür.
+        
+        Geçersiz bir dosya çalışan analizi durdurmaz: uyarı basılır, önceki
+        kurallarla devam edilir ve dosya yeniden değişince tekrar denenir.
+        """
+        try:
+            stat = os.stat(self.rules_path)
+        except OSError:
+            return False
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._rules_signature:
+            return False
+        try:
+            self.load_rules()
+        except (OSError, ValueError) as e:
+            self._rules_signature = signature
+            print(f"⚠️ Karar kuralları yüklenemedi, önceki kurallar kullanılıyor: {e}")
+            return False
+        print(f"🔁 Karar kuralları yeniden yüklendi: sürüm {self.rules_version}, {len(self.decision_rules)} kural")
+        if self.cache is not None:
+            self.cache.prune(self.analysis_version())
+        return True
+    
+    def compile_rules(self):
+        """Kuralları RuleIndex'e derle ve anahtar kelimelerini NLP eşleyicisine ekle.
+
+        decision_rules sonradan değiştirilirse yeniden çağrılmalıdır. Eşleyicide
+        önceki kuralların etiketleri varsa eşleyici sözlüklerden yeniden
+        kurulur; böylece kaldırılan kural ve anahtar kelimeler taranmaz.
+        """
+        matcher = self.nlp_analyzer.matcher
+        if any(kind == 'rule' for tags in matcher.tags.values() for kind, _ in tags):
+            self.nlp_analyzer.compile_lexicons()
+            matcher = self.nlp_analyzer.matcher
+        for rule_id, rule_info in self.decision_rules.items():
+            for keyword in rule_info['keywords']:
+                if ('rule', rule_id) not in matcher.tags.get(keyword, ()):
+                    matcher.add(keyword, ('rule', rule_id))
+        self.rule_index = RuleIndex(self.decision_rules)
+        self._version = None
+    
+    def analysis_version(self) -> str:
+        """Sözlüklerin ve karar kurallarının özeti; önbellek anahtarlarının parçası"""
+        if self._version is None:
+            nlp = self.nlp_analyzer
+            state = [ANALYSIS_CACHE_FORMAT, sorted(nlp.turkish_stopwords), nlp.keyword_categories,
+                     nlp.sentiment_words, nlp.financial_sentiment_words, nlp.title_negative_words,
+                     self.decision_rules, nlp.keyword_scoring]
+            self._version = hashlib.sha256(
+                json.dumps(state, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        return self._version
     
-    def analyze_article(self, article: Dict) -> Dict:
-        """Tek bir haberi kapsamlı analiz et"""
+    def analyze_article(self, article: Dict, fields: Optional[Iterable[str]] = None) -> Dict:
+        """Tek bir haberi kapsamlı analiz et
         
+        'fields' verilirse yalın sonuç döner (bkz. _lean_result); değer,
+        LEAN_RESULT_FIELDS içinden istenen isteğe bağlı bölümlerdir.
+        """
+        fields = self._lean_fields(fields)
+        self.reload_rules()
         text = article.get('text', '')
         title = article.get('title', '')
         publish_date = article.get('giris', '')
         
         print(f"\n📝 Analiz edilen metin özeti: {text[:200]}...")
         
-        # 1. Anahtar kelime analizi
-        keywords = self.nlp_analyzer.extract_keywords(text + ' ' + title)
+        # Metin bir kez küçültülür, bölünür ve taranır; tüm adımlar aynı belgeyi kullanır
+        doc = self.nlp_analyzer.document(text)
+        
+        cluster, duplicate_of = self._assign_cluster(article)
+        cached = self._cached_analysis(article)
+        if cached is None and duplicate_of is not None:
+            # Yakın kopya: kümenin analizi paylaşılır
+            cached = self._cluster_analysis(cluster)
+        if cached is not None:
+            keywords, sentiment, financial_entities, rule_scores, rule_details = cached
+            if self.nlp_analyzer.keyword_scoring != 'frequency':
+                keywords['top_keywords'] = self.nlp_analyzer.rank_keywords(
+                    doc.extended(' ' + title), document_key=content_hash(article))
+        else:
+            # 1. Anahtar kelime analizi
+            keywords = self.nlp_analyzer.extract_keywords(doc.extended(' ' + title),
+                                                          document_key=content_hash(article))
+            
+            # 2. Duygu analizi
+            sentiment = self.nlp_analyzer.analyze_sentiment(doc)
+            
+            # 3. Finansal varlık çıkarma
+            financial_entities = self.nlp_analyzer.extract_financial_entities(doc)
+            
+            # 4. Karar kurallarını uygula
+            rule_scores, rule_details = self.apply_decision_rules(doc, keywords, financial_entities)
+            
+            self._store_analysis(article, (keywords, sentiment, financial_entities, rule_scores, rule_details))
+        if cluster is not None and (cached is None or cluster not in self._cluster_analyses):
+            self._remember_cluster(cluster, (keywords, sentiment, financial_entities, rule_scores, rule_details))
+        
+        # 5. Zamansal bağlam analizi (güne bağlı olduğu için önbelleğe alınmaz)
+        temporal_context = self.nlp_analyzer.analyze_temporal_context(doc, publish_date)
         
-        # 2. Duygu analizi
-        sentiment = self.nlp_analyzer.analyze_sentiment(text)
+        build = self._article_result if fields is None else partial(self._lean_result, fields=fields)
+        result = build(article, keywords, sentiment, financial_entities,
+                       temporal_context, rule_scores, rule_details)
+        return self._mark_cluster(result, cluster, duplicate_of)
+    
+    def _assign_cluster(self, article: Dict) -> Tuple[Optional[int], Optional[str]]:
+        """Haberi yakın kopya kümesine ata; (küme, kopyaysa temsilcinin içerik özeti)"""
+        if self.near_duplicates is None:
+            return None, None
+        cluster, duplicate = self.near_duplicates.assign(content_hash(article), article.get('text', ''))
+        return cluster, self.near_duplicates.representative(cluster) if duplicate else None
+    
+    def _cluster_analysis(self, cluster: int) -> Optional[Tuple]:
+        blob = self._cluster_analyses.get(cluster)
+        if blob is None:
+            return None
+        self._cluster_analyses.move_to_end(cluster)
+        return pickle.loads(blob)
+    
+    def _remember_cluster(self, cluster: int, analysis: Tuple):
+        self._cluster_analyses[cluster] = pickle.dumps(analysis, protocol=pickle.HIGHEST_PROTOCOL)
+        self._cluster_analyses.move_to_end(cluster)
+        while len(self._cluster_analyses) > NEAR_DUPLICATE_CACHE_SIZE:
+            self._cluster_analyses.popitem(last=False)
+    
+    @staticmethod
+    def _mark_cluster(result: Dict, cluster: Optional[int], duplicate_of: Optional[str]) -> Dict:
+        if cluster is not None:
+            info = result.get('article_info', result)
+            info['cluster'] = cluster
+            info['duplicate_of'] = duplicate_of
+        return result
+    
+    def _cached_analysis(self, article: Dict) -> Optional[Tuple]:
+        """Önbellekteki (keywords, sentiment, financial_entities, rule_scores, rule_details)"""
+        if self.cache is None:
+            return None
+        return self.cache.get(self.analysis_version(), content_hash(article))
+    
+    def _store_analysis(self, article: Dict, analysis: Tuple):
+        if self.cache is not None:
+            self.cache.put(self.analysis_version(), content_hash(article), analysis)
+    
+    def analyze_articles(self, articles: Iterable[Dict], fields: Optional[Iterable[str]] = None) -> List[Dict]:
+        """
+        Bir haber grubunu toplu analiz et; her haber için analyze_article ile
+        aynı sonucu döndürür.
         
-        # 3. Finansal varlık çıkarma
-        financial_entities = self.nlp_analyzer.extract_financial_entities(text)
+        Anahtar kelime frekansları, duygu puanları ve kural tetiklenmeleri
+        tüm grup için ortak sözlüklü seyrek matrislerle hesaplanır; binlerce
+        arşiv haberi saniyeler içinde puanlanabilir. scipy yoksa haberler tek
+        tek analiz edilir. Önbellekte bulunan haberler gruba katılmaz.
+        'fields' analyze_article'daki gibidir.
+        """
+        fields = self._lean_fields(fields)
+        self.reload_rules()
+        articles = list(articles)
+        print(f"\n📚 Toplu analiz: {len(articles)} haber")
+        nlp = self.nlp_analyzer
+        docs = [nlp.document(article.get('text', '')) for article in articles]
         
-        # 4. Zamansal bağlam analizi
-        temporal_context = self.nlp_analyzer.analyze_temporal_context(text, publish_date)
+        clusters = [self._assign_cluster(article) for article in articles]
+        analyses = [self._cached_analysis(article) for article in articles]
+        # Yakın kopyalar kümenin analizini paylaşır; kümesi bu grupta ilk kez
+        # görülenler bir kez analiz edilir, gruptaki diğer kopyalar ona bağlanır
+        todo, shared, first = [], {}, {}
+        for i, (cluster, duplicate_of) in enumerate(clusters):
+            if analyses[i] is None and duplicate_of is not None:
+                analyses[i] = self._cluster_analysis(cluster)
+                if analyses[i] is None and cluster in first:
+                    shared[i] = first[cluster]
+                    continue
+            if analyses[i] is None:
+                todo.append(i)
+            if cluster is not None:
+                first.setdefault(cluster, i)
+        todo_set = set(todo)
+        todo_docs = [docs[i] for i in todo]
+        ranked = {}
+        if nlp.keyword_scoring == 'frequency':
+            keywords = nlp.extract_keywords_batch(
+                [doc.extended(' ' + articles[i].get('title', '')) for i, doc in zip(todo, todo_docs)],
+                document_keys=[content_hash(articles[i]) for i in todo])
+        else:
+            # Belge sıklıkları haber sırasıyla güncellenir (analyze_article ile aynı);
+            # önbellekten ya da kümeden gelen haberler de sayılıp yeniden sıralanır
+            keywords = []
+            for i, (doc, article) in enumerate(zip(docs, articles)):
+                text, key = doc.extended(' ' + article.get('title', '')), content_hash(article)
+                if i in todo_set:
+                    keywords.append(nlp.extract_keywords(text, document_key=key))
+                else:
+                    ranked[i] = nlp.rank_keywords(text, document_key=key)
+        sentiments = nlp.analyze_sentiment_batch(todo_docs)
+        financial = [nlp.extract_financial_entities(doc) for doc in todo_docs]
+        rules = self.apply_decision_rules_batch(todo_docs, keywords, financial)
+        for i, kw, sentiment, fin, (rule_scores, rule_details) in zip(todo, keywords, sentiments, financial, rules):
+            analyses[i] = (kw, sentiment, fin, rule_scores, rule_details)
+            self._store_analysis(articles[i], analyses[i])
+        for cluster, i in first.items():
+            if i in todo_set or cluster not in self._cluster_analyses:
+                self._remember_cluster(cluster, analyses[i])
+        for i, j in shared.items():
+            analyses[i] = pickle.loads(pickle.dumps(analyses[j], protocol=pickle.HIGHEST_PROTOCOL))
+        for i, top_keywords in ranked.items():
+            analyses[i][0]['top_keywords'] = top_keywords
         
-        # 5. Karar kurallarını uygula
-        rule_scores, rule_details = self.apply_decision_rules(text, keywords, financial_entities)
+        temporal = [nlp.analyze_temporal_context(doc, article.get('giris', ''))
+                    for doc, article in zip(docs, articles)]
+        build = self._article_result if fields is None else partial(self._lean_result, fields=fields)
+        return [self._mark_cluster(build(article, kw, sentiment, fin, context, rule_scores, rule_details),
+                                   cluster, duplicate_of)
+                for article, (kw, sentiment, fin, rule_scores, rule_details), context, (cluster, duplicate_of)
+                in zip(articles, analyses, temporal, clusters)]
+    
+    def _article_result(self, article: Dict, keywords: Dict, sentiment: Dict, financial_entities: Dict,
+                        temporal_context: Dict, rule_scores: Dict, rule_details: Dict) -> Dict:
+        """NLP ve kural çıktılarından öneri, risk ve özeti üretip haber sonucunu kur"""
+        title = article.get('title', '')
+        publish_date = article.get('giris', '')
         total_score = sum(rule_scores.values())
         
         # 6. Öneri oluştur
@@ -703,38 +2934,99 @@ class ImprovedHousingNewsAnalyzer:
             'summary': summary
         }
     
-    def apply_decision_rules(self, text: str, keywords: Dict, financial_entities: Dict) -> Tuple[Dict, Dict]:
-        """Karar kurallarını uygula ve puanları hesapla"""
+    @staticmethod
+    def _lean_fields(fields: Optional[Iterable[str]]) -> Optional[frozenset]:
+        """Alan maskesini doğrula; None tam sonuç demektir"""
+        if fields is None:
+            return None
+        fields = frozenset(fields)
+        unknown = fields.difference(LEAN_RESULT_FIELDS)
+        if unknown:
+            raise ValueError(f"Bilinmeyen sonuç alanı: {', '.join(sorted(unknown))} "
+                             f"(geçerli alanlar: {', '.join(LEAN_RESULT_FIELDS)})")
+        return fields
+    
+    def _lean_result(self, article: Dict, keywords: Dict, sentiment: Dict, financial_entities: Dict,
+                     temporal_context: Dict, rule_scores: Dict, rule_details: Dict, fields: frozenset) -> Dict:
+        """Saklamaya uygun yalın sonuç.
+        
+        Öneri, risk düzeyi, yalnızca tetiklenen kuralların puanları ve duygu
+        puanları her zaman bulunur; cümle duyguları SENTIMENT_CODES ile
+        array('b') olarak tutulur. Özet metni saklanmaz, render_summary ile
+        istendiğinde üretilir. Kural adları ve açıklamaları decision_rules'ta
+        durduğu için tekrarlanmaz; diğer bölümler 'fields' ile istenir.
+        """
+        total_score = sum(rule_scores.values())
+        recommendation = self.generate_recommendation(total_score, rule_scores, sentiment, financial_entities)
+        risk_analysis = self.analyze_risks(rule_scores, financial_entities, sentiment)
+        result = {
+            'title': article.get('title', ''),
+            'url': article.get('url'),
+            'publish_date': article.get('giris', ''),
+            'action': recommendation['action'],
+            'confidence': recommendation['confidence'],
+            'total_score': total_score,
+            'time_horizon': recommendation['time_horizon'],
+            'risk_level': risk_analysis['risk_level'],
+            'rule_scores': {rule_id: score for rule_id, score in rule_scores.items() if score},
+            'dominant_sentiment': sentiment['dominant_sentiment'],
+            'sentiment_scores': sentiment['sentiment_scores'],
+            'sentence_sentiments': array('b', [SENTIMENT_CODES[s] for s in sentiment['sentence_sentiments']])
+        }
+        if 'keywords' in fields:
+            result['keywords'] = {
+                'top_keywords': keywords['top_keywords'],
+                'category_keywords': {category: words for category, words
+                                      in keywords['category_keywords'].items() if words}
+            }
+        if 'financial' in fields:
+            result['financial'] = {key: financial_entities[key] for key in
+                                   ('percentages', 'currency_values', 'kfe_values', 'time_expressions')}
+        if 'temporal' in fields:
+            result['temporal'] = temporal_context
+        if 'numerical' in fields:
+            result['numerical'] = self.analyze_numerical_data(financial_entities)
+        if 'rules' in fields:
+            result['rules'] = {rule_id: detail['triggered_keywords']
+                               for rule_id, detail in rule_details.items() if detail['score']}
+        if 'risks' in fields:
+            result['risks'] = risk_analysis['identified_risks']
+        if 'features' in fields:
+            result['features'] = article.get('features', {})
+        return result
+    
+    def render_summary(self, result: Dict) -> str:
+        """Analiz sonucunun özet metni; yalın sonuçlar için generate_summary ile aynı metni üretir"""
+        if 'summary' in result:
+            return result['summary']
+        sentiment = self.nlp_analyzer._sentiment_result(result['sentiment_scores'], [])
+        rule_scores = {rule_id: result['rule_scores'].get(rule_id, 0) for rule_id in self.decision_rules}
+        rule_details = {rule_id: {'name': rule_info['name']} for rule_id, rule_info in self.decision_rules.items()}
+        recommendation = {
+            'action': result['action'],
+            'confidence': result['confidence'],
+            'total_score': result['total_score'],
+            'time_horizon': result['time_horizon'],
+            'details': self._recommendation_details(rule_scores)
+        }
+        return self.generate_summary(result['title'], sentiment, rule_scores, recommendation, rule_details)
+    
+    def apply_decision_rules(self, text: Union[str, AnalyzedDocument], keywords: Dict,
+                             financial_entities: Dict) -> Tuple[Dict, Dict]:
+        """Karar kurallarını derlenmiş dizinle uygula ve puanları hesapla"""
+        index = self.rule_index
+        triggered = index.evaluate(self.nlp_analyzer.document(text).hits,
+                                   keywords.get('category_keywords', {}),
+                                   financial_entities.get('percentages', []))
+        return self._rule_result(triggered, index.rules)
+    
+    def _rule_result(self, triggered: Dict[str, List[str]], rules: Dict[str, Dict]) -> Tuple[Dict, Dict]:
+        """Kural başına tetikleyen kelimelerden puan ve ayrıntı sözlüklerini kur"""
         rule_scores = {}
         rule_details = {}
-        text_lower = text.lower()
-        
-        for rule_id, rule_info in self.decision_rules.items():
-            score = 0
-            triggered_keywords = []
-            
-            # Anahtar kelimeleri kontrol et
-            for keyword in rule_info['keywords']:
-                if keyword in text_lower:
-                    score = rule_info['score']
-                    triggered_keywords.append(keyword)
-            
-            # Kategori anahtar kelimelerini de kontrol et
-            category_keywords = keywords.get('category_keywords', {})
-            for category, words in category_keywords.items():
-                for word in words:
-                    if any(kw in word.lower() for kw in rule_info['keywords']):
-                        score = rule_info['score']
-                        triggered_keywords.append(word)
-            
-            # Özel kurallar
-            if rule_id == 'K6':  # Yüksek artış oranları
-                percentages = financial_entities.get('percentages', [])
-                if any(p > 20 for p in percentages):  # %20'den yüksek artış
-                    score = rule_info['score']
-                    high_percentages = [p for p in percentages if p > 20]
-                    triggered_keywords.append(f"Yüksek oranlar: {high_percentages}")
-            
+        for rule_id, rule_info in rules.items():
+            triggered_keywords = triggered.get(rule_id, [])
+            score = rule_info['score'] if triggered_keywords else 0
             rule_scores[rule_id] = score
             rule_details[rule_id] = {
                 'name': rule_info['name'],
@@ -742,9 +3034,18 @@ class ImprovedHousingNewsAnalyzer:
                 'triggered_keywords': triggered_keywords,
                 'description': rule_info['description']
             }
-        
         return rule_scores, rule_details
     
+    def apply_decision_rules_batch(self, texts: List[Union[str, AnalyzedDocument]], keywords: List[Dict],
+                                   financial_entities: List[Dict]) -> List[Tuple[Dict, Dict]]:
+        """
+        apply_decision_rules'un toplu sürümü; her metin için aynı (puan, ayrıntı)
+        çiftini döndürür. Derlenmiş dizinde haber başına maliyet isabet
+        sayısıyla orantılı olduğundan matris çarpımına gerek kalmaz.
+        """
+        return [self.apply_decision_rules(text, kw, fin)
+                for text, kw, fin in zip(texts, keywords, financial_entities)]
+    
     def generate_recommendation(self, total_score: int, rule_scores: Dict, 
                                sentiment: Dict, financial_entities: Dict) -> Dict:
         """Toplam puana göre öneri oluştur"""
@@ -787,7 +3088,16 @@ class ImprovedHousingNewsAnalyzer:
             base_recommendation = 'AL'
             confidence = 'yüksek'
         
-        # Kural bazlı detaylar
+        return {
+            'action': base_recommendation,
+            'confidence': confidence,
+            'total_score': total_score,
+            'details': self._recommendation_details(rule_scores),
+            'time_horizon': self.determine_time_horizon(rule_scores, sentiment, financial_entities)
+        }
+    
+    def _recommendation_details(self, rule_scores: Dict) -> List[str]:
+        """Kural bazlı detaylar"""
         details = []
         if rule_scores.get('K1', 0) > 0:
             details.append("Düşük kredi faizleri alım için uygun ortam")
@@ -801,14 +3111,7 @@ class ImprovedHousingNewsAnalyzer:
             details.append("İstanbul özelinde güçlü performans")
         if rule_scores.get('K6', 0) > 0:
             details.append("Yüksek artış oranları gözleniyor")
-        
-        return {
-            'action': base_recommendation,
-            'confidence': confidence,
-            'total_score': total_score,
-            'details': details,
-            'time_horizon': self.determine_time_horizon(rule_scores, sentiment, financial_entities)
-        }
+        return details
     
     def determine_time_horizon(self, rule_scores: Dict, sentiment: Dict, financial_entities: Dict) -> str:
         """Zaman dilimi belirle"""
@@ -942,9 +3245,740 @@ class ImprovedHousingNewsAnalyzer:
         return summary
 
 
-def run_analysis_on_article(article: Dict):
+# ==================== ANALİZ DEPOSU ====================
+
+# İlçe/gün sayaçları: haber sayısı, baskın duyguya göre sayılar ve haber
+# başına değerlerin toplamları (ortalamalar okunurken hesaplanır)
+_AGGREGATE_FIELDS = ('articles', 'positive', 'negative', 'neutral', 'sentiment_score', 'total_score',
+                     'percentage_sum', 'percentage_count', 'kfe_sum', 'kfe_count')
+_AGGREGATE_SUMS = frozenset({'sentiment_score', 'total_score', 'percentage_sum', 'kfe_sum'})
+
+def _empty_aggregate() -> List:
+    """[sayaçlar, kural -> [tetiklenme sayısı, puan toplamı]]"""
+    return [[0] * len(_AGGREGATE_FIELDS), {}]
+
+def _merge_aggregate(target: List, counts: List[float], rules: Dict[str, List[float]], sign: int = 1):
+    """Bir katkıyı toplama ekle; sign=-1 ise çıkar"""
+    totals, rule_totals = target
+    for i, value in enumerate(counts):
+        totals[i] += sign * value
+    for rule_id, (fired, score) in rules.items():
+        entry = rule_totals.setdefault(rule_id, [0, 0.0])
+        entry[0] += sign * fired
+        entry[1] += sign * score
+
+def _aggregate_counts(sentiment: str, total_score: float, sentiment_score: float, percentage_sum: float,
+                      percentage_count: int, kfe_sum: float, kfe_count: int) -> List[float]:
+    """Bir haberin ilçe/gün sayaçlarına katkısı (_AGGREGATE_FIELDS sırasıyla)"""
+    return [1, int(sentiment == 'pozitif'), int(sentiment == 'negatif'), int(sentiment == 'nötr'),
+            sentiment_score, total_score, percentage_sum, percentage_count, kfe_sum, kfe_count]
+
+class RollingDistrictAggregates:
+    """İlçe başına kayan pencere (ör. 7/30/90 gün) toplamları.
+
+    Günlük sayaçlar en uzun pencere kadar geriye tutulur; her pencerenin
+    toplamı ayrıca saklanır. Yeni bir katkı kapsadığı pencerelerin
+    toplamına eklenir, gün ilerlediğinde pencereye giren ve çıkan günler
+    eklenip çıkarılır. Böylece bir pencerenin özeti, pencere uzunluğundan
+    bağımsız olarak sabit sürede okunur.
+    """
+
+    def __init__(self, windows: Iterable[int] = AGGREGATE_WINDOWS, today: Optional[int] = None):
+        self.windows = tuple(sorted(windows))
+        self.today = date.today().toordinal() if today is None else today
+        self._days: Dict[str, Dict[int, List]] = {}
+        self._totals: Dict[str, Dict[int, List]] = {}
+
+    def _district_totals(self, district: str) -> Dict[int, List]:
+        totals = self._totals.get(district)
+        if totals is None:
+            totals = self._totals[district] = {window: _empty_aggregate() for window in self.windows}
+        return totals
+
+    def add(self, district: str, day: int, counts: List[float], rules: Dict[str, List[float]], sign: int = 1):
+        """'day' (gün sırası, date.toordinal) tarihli katkıyı ekle; sign=-1 ise çıkar"""
+        if day <= self.today - self.windows[-1]:
+            return
+        days = self._days.setdefault(district, {})
+        bucket = days.get(day)
+        if bucket is None:
+            bucket = days[day] = _empty_aggregate()
+        _merge_aggregate(bucket, counts, rules, sign)
+        if day <= self.today:
+            totals = self._district_totals(district)
+            for window in self.windows:
+                if day > self.today - window:
+                    _merge_aggregate(totals[window], counts, rules, sign)
+
+    def advance(self, today: int):
+        """Pencereleri 'today' gününe kaydır; her gün yalnızca bir kez girer ve çıkar"""
+        if today <= self.today:
+            return
+        longest = self.windows[-1]
+        for district, days in self._days.items():
+            totals = self._district_totals(district)
+            for window in self.windows:
+                if today - self.today >= window:
+                    totals[window] = _empty_aggregate()
+                    entering = range(today - window + 1, today + 1)
+                    leaving = range(0)
+                else:
+                    entering = range(self.today + 1, today + 1)
+                    leaving = range(self.today - window + 1, today - window + 1)
+                for day in entering:
+                    if day in days:
+                        _merge_aggregate(totals[window], *days[day])
+                for day in leaving:
+                    if day in days:
+                        _merge_aggregate(totals[window], *days[day], sign=-1)
+            for day in [day for day in days if day <= today - longest]:
+                del days[day]
+        self.today = today
+
+    def summary(self, district: str, window: int) -> Dict:
+        """Bir ilçenin pencere özeti: sayılar, ortalamalar ve tetiklenen kurallar"""
+        totals = self._totals.get(district)
+        counts, rules = totals[window] if totals else _empty_aggregate()
+        c = dict(zip(_AGGREGATE_FIELDS, counts))
+        articles = c['articles']
+        return {
+            'articles': articles,
+            'positive': c['positive'],
+            'negative': c['negative'],
+            'neutral': c['neutral'],
+            'avg_sentiment': c['sentiment_score'] / articles if articles else 0.0,
+            'avg_score': c['total_score'] / articles if articles else 0.0,
+            'avg_percentage': c['percentage_sum'] / c['percentage_count'] if c['percentage_count'] else None,
+            'avg_kfe': c['kfe_sum'] / c['kfe_count'] if c['kfe_count'] else None,
+            'rules': {rule_id: {'fired': fired, 'score': score}
+                      for rule_id, (fired, score) in sorted(rules.items()) if fired}
+        }
+
+# Şema sürümü -> o sürümde articles tablosuna eklenen sütunlar
+_NEWS_STORE_MIGRATIONS = {
+    2: ("sentiment_score REAL", "percentage_sum REAL", "percentage_count INTEGER",
+        "kfe_sum REAL", "kfe_count INTEGER"),
+    3: ("duplicate_of TEXT",),
+}
+
+class NewsAnalysisStore:
+    """analyze_article sonuçlarının kalıcı, sorgulanabilir deposu (SQLite).
+
+    Her haber URL'siyle (URL yoksa içerik özetiyle) bir kez saklanır; yeniden
+    eklenen haberin kaydı güncellenir. Yayın tarihi ('giris' alanından),
+    baskın duygu, öneri ve toplam puan dizinli sütunlarda; metinde geçen
+    ilçeler, tetiklenen kurallar ve kategori anahtar kelimeleri ayrı dizinli
+    tablolarda tutulur. Sonucun kendisi sıkıştırılmış JSON olarak saklanır;
+    tam ve yalın sonuçların ikisi de eklenebilir. Haberler 'batch_size'lık
+    işlemlerle yazılır.
+
+    Aynı işlemde ilçe/gün sayaçları (duygu, kural puanları, ortalama yüzde
+    ve KFE) artımlı güncellenir; bir haber yeniden yazılırsa eski katkısı
+    çıkarılır. climate() bu sayaçlardan 7/30/90 günlük pencereleri okur.
+    Yayın tarihi çözülemeyen haberler ve yakın kopyalar ('duplicate_of')
+    sayaçlara katılmaz.
+
+    Şema sürümü dosyada (PRAGMA user_version) tutulur; eski sürümle yazılmış
+    bir depo açılırken eksik sütunlar eklenir ve sayaçlar saklanan
+    sonuçlardan bir kez yeniden kurulur.
+    """
+
+    def __init__(self, path: str = NEWS_STORE_PATH, batch_size: int = NEWS_STORE_BATCH):
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._rolling: Optional[RollingDistrictAggregates] = None
+        self._data_version: Optional[int] = None
+        self.stats = {"stored": 0, "batches": 0, "queries": 0}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(
+                "CREATE TABLE IF NOT EXISTS articles ("
+                " id INTEGER PRIMARY KEY,"
+                " key TEXT NOT NULL UNIQUE,"
+                " url TEXT,"
+                " title TEXT,"
+                " publish_date TEXT,"
+                " dominant_sentiment TEXT,"
+                " action TEXT,"
+                " total_score REAL,"
+                " result BLOB NOT NULL,"
+                " stored_at REAL NOT NULL);"
+                "CREATE INDEX IF NOT EXISTS articles_by_date ON articles (publish_date);"
+                "CREATE INDEX IF NOT EXISTS articles_by_sentiment ON articles (dominant_sentiment, publish_date);"
+                "CREATE TABLE IF NOT EXISTS article_districts ("
+                " district TEXT NOT NULL, article_id INTEGER NOT NULL,"
+                " PRIMARY KEY (district, article_id)) WITHOUT ROWID;"
+                "CREATE INDEX IF NOT EXISTS article_districts_by_article ON article_districts (article_id);"
+                "CREATE TABLE IF NOT EXISTS article_rules ("
+                " rule_id TEXT NOT NULL, article_id INTEGER NOT NULL, score REAL NOT NULL,"
+                " PRIMARY KEY (rule_id, article_id)) WITHOUT ROWID;"
+                "CREATE INDEX IF NOT EXISTS article_rules_by_article ON article_rules (article_id);"
+                "CREATE TABLE IF NOT EXISTS article_keywords ("
+                " keyword TEXT NOT NULL, article_id INTEGER NOT NULL,"
+                " PRIMARY KEY (keyword, article_id)) WITHOUT ROWID;"
+                "CREATE INDEX IF NOT EXISTS article_keywords_by_article ON article_keywords (article_id);"
+                "CREATE TABLE IF NOT EXISTS district_days ("
+                " district TEXT NOT NULL, day TEXT NOT NULL, "
+                + ", ".join(f"{field} {'REAL' if field in _AGGREGATE_SUMS else 'INTEGER'} NOT NULL"
+                            for field in _AGGREGATE_FIELDS) + ","
+                " PRIMARY KEY (district, day)) WITHOUT ROWID;"
+                "CREATE INDEX IF NOT EXISTS district_days_by_day ON district_days (day);"
+                "CREATE TABLE IF NOT EXISTS district_day_rules ("
+                " district TEXT NOT NULL, day TEXT NOT NULL, rule_id TEXT NOT NULL,"
+                " fired INTEGER NOT NULL, score REAL NOT NULL,"
+                " PRIMARY KEY (district, day, rule_id)) WITHOUT ROWID;"
+                "CREATE INDEX IF NOT EXISTS district_day_rules_by_day ON district_day_rules (day);"
+            )
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < NEWS_STORE_SCHEMA:
+                self._migrate(version)
+
+    def _migrate(self, version: int):
+        """Eski şemayla yazılmış depoyu yükselt: eksik sütunları ekle, doldur, sayaçları kur"""
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(articles)")}
+        for added in range(version + 1, NEWS_STORE_SCHEMA + 1):
+            for column in _NEWS_STORE_MIGRATIONS.get(added, ()):
+                if column.split()[0] not in existing:
+                    self._conn.execute(f"ALTER TABLE articles ADD COLUMN {column}")
+        if version < 2:
+            # İlçe/gün sayaçlarından önce yazılmış haberlerin katkı sütunları
+            # saklanan sonuçtan hesaplanır, sayaçlar tüm depodan yeniden kurulur
+            self._conn.executemany(
+                "UPDATE articles SET sentiment_score = ?, percentage_sum = ?, percentage_count = ?,"
+                " kfe_sum = ?, kfe_count = ? WHERE id = ?",
+                [(*self._aggregate_columns(json.loads(zlib.decompress(blob)))[1:], article_id)
+                 for article_id, blob in self._conn.execute(
+                     "SELECT id, result FROM articles WHERE sentiment_score IS NULL").fetchall()],
+            )
+            self._rebuild_aggregates()
+        self._conn.execute(f"PRAGMA user_version = {NEWS_STORE_SCHEMA}")
+
+    def _rebuild_aggregates(self):
+        """İlçe/gün sayaçlarını depodaki haberlerden baştan hesapla"""
+        self._conn.execute("DELETE FROM district_days")
+        self._conn.execute("DELETE FROM district_day_rules")
+        keys = [key for key, in self._conn.execute("SELECT key FROM articles")]
+        deltas: Dict[Tuple[str, str], List] = {}
+        for start in range(0, len(keys), self.batch_size):
+            for day, districts, counts, rules in self._stored_contributions(keys[start:start + self.batch_size]):
+                self._collect_delta(deltas, day, districts, counts, rules)
+        self._apply_deltas(deltas)
+
+    @staticmethod
+    def _aggregate_columns(result: Dict) -> Tuple:
+        """(karar bölümü, duygu puanı, yüzde toplamı/sayısı, KFE toplamı/sayısı); tam ya da yalın sonuçtan"""
+        if 'decision_analysis' in result:
+            decision = result['decision_analysis']
+            sentiment_scores = result['nlp_analysis']['sentiment']['sentiment_scores']
+            financial = result['nlp_analysis']['financial_entities']
+        else:
+            decision = result
+            sentiment_scores = result['sentiment_scores']
+            financial = result.get('financial', {})
+        # Duygu puanı: olumlu ve olumsuz payların farkı (-1..1)
+        sentiment_total = sum(sentiment_scores.values())
+        sentiment_score = ((sentiment_scores['pozitif'] - sentiment_scores['negatif']) / sentiment_total
+                           if sentiment_total else 0.0)
+        percentages = financial.get('percentages', [])
+        kfe_values = financial.get('kfe_values', [])
+        return decision, sentiment_score, sum(percentages), len(percentages), sum(kfe_values), len(kfe_values)
+
+    @staticmethod
+    def _row(article: Dict, result: Dict) -> Tuple:
+        """(anahtar, sütunlar, ilçeler, kural puanları, anahtar kelimeler)"""
+        if 'decision_analysis' in result:
+            sentiment = result['nlp_analysis']['sentiment']['dominant_sentiment']
+            action = result['decision_analysis']['recommendation']['action']
+            category_keywords = result['nlp_analysis']['keywords']['category_keywords']
+        else:
+            sentiment = result['dominant_sentiment']
+            action = result['action']
+            category_keywords = result.get('keywords', {}).get('category_keywords', {})
+        decision, *aggregate_columns = NewsAnalysisStore._aggregate_columns(result)
+        title = article.get('title', '')
+        published = parse_publish_date(article.get('giris', ''))
+        blob = zlib.compress(json.dumps(result, ensure_ascii=False, separators=(",", ":"),
+                                        default=_json_default).encode("utf-8"))
+        duplicate_of = result.get('article_info', result).get('duplicate_of')
+        columns = (article.get('url'), title, published.strftime('%Y-%m-%d') if published else None,
+                   sentiment, action, decision['total_score'], *aggregate_columns, duplicate_of, blob)
+        rules = [(rule_id, score) for rule_id, score in decision['rule_scores'].items() if score]
+        keywords = list(dict.fromkeys(word for words in category_keywords.values() for word in words))
+        districts = extract_districts(f"{title} {article.get('text', '')}")
+        return article.get('url') or content_hash(article), columns, districts, rules, keywords
+
+    def add(self, article: Dict, result: Dict):
+        self.add_many([(article, result)])
+
+    def add_many(self, items: Iterable[Tuple[Dict, Dict]]) -> int:
+        """(haber, sonuç) çiftlerini batch_size'lık işlemlerle yaz; yazılan sayıyı döndür."""
+        items = iter(items)
+        stored = 0
+        while True:
+            batch = list(islice(items, self.batch_size))
+            if not batch:
+                return stored
+            self._write_batch(batch)
+            stored += len(batch)
+
+    def _write_batch(self, batch: List[Tuple[Dict, Dict]]):
+        # Aynı haber bir işlemde birden çok kez gelirse sonuncusu geçerlidir
+        rows = list({row[0]: row for row in (self._row(article, result) for article, result in batch)}.values())
+        keys = [row[0] for row in rows]
+        now = time.time()
+        with self._lock, self._conn:
+            # Güncellenen haberlerin eski katkısı sayaçlardan çıkarılır
+            deltas: Dict[Tuple[str, str], List] = {}
+            for day, districts, counts, rules in self._stored_contributions(keys):
+                self._collect_delta(deltas, day, districts, counts, rules, sign=-1)
+            for _, columns, districts, rules, _ in rows:
+                if columns[11] is not None:
+                    continue
+                self._collect_delta(deltas, columns[2], districts, _aggregate_counts(columns[3], *columns[5:11]),
+                                    {rule_id: (1, score) for rule_id, score in rules})
+            self._conn.executemany(
+                "INSERT INTO articles (key, url, title, publish_date, dominant_sentiment, action,"
+                " total_score, sentiment_score, percentage_sum, percentage_count, kfe_sum, kfe_count,"
+                " duplicate_of, result, stored_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET url = excluded.url, title = excluded.title,"
+                " publish_date = excluded.publish_date, dominant_sentiment = excluded.dominant_sentiment,"
+                " action = excluded.action, total_score = excluded.total_score,"
+                " sentiment_score = excluded.sentiment_score, percentage_sum = excluded.percentage_sum,"
+                " percentage_count = excluded.percentage_count, kfe_sum = excluded.kfe_sum,"
+                " kfe_count = excluded.kfe_count, duplicate_of = excluded.duplicate_of,"
+                " result = excluded.result, stored_at = excluded.stored_at",
+                [(key, *columns, now) for key, columns, _, _, _ in rows],
+            )
+            ids = dict(self._conn.execute(
+                f"SELECT key, id FROM articles WHERE key IN ({','.join('?' * len(keys))})", keys
+            ).fetchall())
+            article_ids = [(ids[key],) for key in keys]
+            for table in ("article_districts", "article_rules", "article_keywords"):
+                self._conn.executemany(f"DELETE FROM {table} WHERE article_id = ?", article_ids)
+            self._conn.executemany(
+                "INSERT INTO article_districts (district, article_id) VALUES (?, ?)",
+                [(district, ids[key]) for key, _, districts, _, _ in rows for district in districts],
+            )
+            self._conn.executemany(
+                "INSERT INTO article_rules (rule_id, article_id, score) VALUES (?, ?, ?)",
+                [(rule_id, ids[key], score) for key, _, _, rules, _ in rows for rule_id, score in rules],
+            )
+            self._conn.executemany(
+                "INSERT INTO article_keywords (keyword, article_id) VALUES (?, ?)",
+                [(keyword, ids[key]) for key, _, _, _, keywords in rows for keyword in keywords],
+            )
+            self._apply_deltas(deltas)
+            self.stats["stored"] += len(rows)
+            self.stats["batches"] += 1
+
+    def _stored_contributions(self, keys: List[str]) -> List[Tuple]:
+        """Depoda zaten bulunan haberlerin (gün, ilçeler, sayaçlar, kurallar) katkıları"""
+        marks = ','.join('?' * len(keys))
+        stored = self._conn.execute(
+            "SELECT id, publish_date, dominant_sentiment, total_score, sentiment_score, percentage_sum,"
+            f" percentage_count, kfe_sum, kfe_count FROM articles WHERE key IN ({marks})"
+            " AND publish_date IS NOT NULL AND duplicate_of IS NULL", keys
+        ).fetchall()
+        if not stored:
+            return []
+        ids = [row[0] for row in stored]
+        marks = ','.join('?' * len(ids))
+        districts: Dict[int, List[str]] = {}
+        for article_id, district in self._conn.execute(
+                f"SELECT article_id, district FROM article_districts WHERE article_id IN ({marks})", ids):
+            districts.setdefault(article_id, []).append(district)
+        rules: Dict[int, Dict[str, Tuple]] = {}
+        for article_id, rule_id, score in self._conn.execute(
+                f"SELECT article_id, rule_id, score FROM article_rules WHERE article_id IN ({marks})", ids):
+            rules.setdefault(article_id, {})[rule_id] = (1, score)
+        return [(day, districts.get(article_id, []), _aggregate_counts(*values), rules.get(article_id, {}))
+                for article_id, day, *values in stored]
+
+    @staticmethod
+    def _collect_delta(deltas: Dict, day: Optional[str], districts: List[str], counts: List[float],
+                       rules: Dict, sign: int = 1):
+        if day is None:
+            return
+        for district in (*districts, ALL_DISTRICTS):
+            delta = deltas.get((district, day))
+            if delta is None:
+                delta = deltas[(district, day)] = _empty_aggregate()
+            _merge_aggregate(delta, counts, rules, sign)
+
+    def _apply_deltas(self, deltas: Dict):
+        """İlçe/gün değişimlerini sayaç tablolarına ve yüklüyse kayan pencerelere ekle"""
+        fields = ", ".join(_AGGREGATE_FIELDS)
+        self._conn.executemany(
+            f"INSERT INTO district_days (district, day, {fields})"
+            f" VALUES (?, ?, {', '.join('?' * len(_AGGREGATE_FIELDS))})"
+            " ON CONFLICT(district, day) DO UPDATE SET "
+            + ", ".join(f"{field} = {field} + excluded.{field}" for field in _AGGREGATE_FIELDS),
+            [(district, day, *counts) for (district, day), (counts, _) in deltas.items()],
+        )
+        self._conn.executemany(
+            "INSERT INTO district_day_rules (district, day, rule_id, fired, score) VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT(district, day, rule_id) DO UPDATE SET"
+            " fired = fired + excluded.fired, score = score + excluded.score",
+            [(district, day, rule_id, fired, score)
+             for (district, day), (_, rules) in deltas.items() for rule_id, (fired, score) in rules.items()],
+        )
+        if self._rolling is not None:
+            for (district, day), (counts, rules) in deltas.items():
+                self._rolling.add(district, date.fromisoformat(day).toordinal(), counts, rules)
+
+    def _load_rolling(self, today: int) -> RollingDistrictAggregates:
+        """Kayan pencereleri son en uzun pencere kadar günün sayaçlarından kur"""
+        rolling = RollingDistrictAggregates(AGGREGATE_WINDOWS, today)
+        since = date.fromordinal(today - rolling.windows[-1] + 1).isoformat()
+        no_counts = [0] * len(_AGGREGATE_FIELDS)
+        for district, day, *counts in self._conn.execute(
+                f"SELECT district, day, {', '.join(_AGGREGATE_FIELDS)} FROM district_days WHERE day >= ?", (since,)):
+            rolling.add(district, date.fromisoformat(day).toordinal(), counts, {})
+        for district, day, rule_id, fired, score in self._conn.execute(
+                "SELECT district, day, rule_id, fired, score FROM district_day_rules WHERE day >= ?", (since,)):
+            rolling.add(district, date.fromisoformat(day).toordinal(), no_counts, {rule_id: (fired, score)})
+        return rolling
+
+    def climate(self, district: str = ALL_DISTRICTS, today: Optional[date] = None) -> Dict[int, Dict]:
+        """Bir ilçenin (varsayılan: tüm haberler) kayan pencere özetleri; pencere (gün) -> özet.
+
+        Pencereler bellekte tutulur ve yazma sırasında güncellenir; okuma
+        sabit sürelidir. Depoya başka bir bağlantı yazdıysa pencereler son
+        en uzun pencere kadar günün sayaçlarından yeniden kurulur.
+        """
+        today = (today or date.today()).toordinal()
+        with self._lock:
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if self._rolling is None or version != self._data_version or today < self._rolling.today:
+                self._rolling = self._load_rolling(today)
+                self._data_version = version
+            self._rolling.advance(today)
+            district = turkish_lower(district)
+            return {window: self._rolling.summary(district, window) for window in self._rolling.windows}
+
+    def query(self, district: Optional[str] = None, sentiment: Optional[str] = None,
+              rule: Optional[str] = None, keyword: Optional[str] = None,
+              start: Optional[str] = None, end: Optional[str] = None, days: Optional[int] = None,
+              limit: Optional[int] = None, results: bool = True) -> List[Dict]:
+        """Dizinli alanlara göre haberleri yeniden eskiye döndür.
+
+        'start' ve 'end' YYYY-MM-DD biçiminde ve dahildir; 'days' bugünden
+        geriye gün sayısıdır. 'rule' yalnızca tetiklenen kuralları eşler.
+        results=False ise saklanan sonuçlar açılmaz, yalnızca dizinli
+        sütunlar döner.
+
+        Örnek: son 90 günde Kadıköy'ün geçtiği, KFE'den söz eden olumsuz haberler
+            store.query(district='Kadıköy', keyword='kfe', sentiment='negatif', days=90)
+        """
+        clauses, params = [], []
+        if days is not None:
+            since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+            start = max(start, since) if start else since
+        if start:
+            clauses.append("publish_date >= ?")
+            params.append(start)
+        if end:
+            clauses.append("publish_date <= ?")
+            params.append(end)
+        if sentiment:
+            clauses.append("dominant_sentiment = ?")
+            params.append(sentiment)
+        # Tarih/duygu dizini adayları daraltıyorsa etiket tabloları aday başına
+        # birincil anahtarla yoklanır; yoksa ilk etiketin listesi sorguyu sürer
+        for table, column, value in (("article_districts", "district", district and turkish_lower(district)),
+                                     ("article_rules", "rule_id", rule),
+                                     ("article_keywords", "keyword", keyword and turkish_lower(keyword))):
+            if not value:
+                continue
+            if clauses:
+                clauses.append(f"EXISTS (SELECT 1 FROM {table} WHERE {column} = ? AND article_id = articles.id)")
+            else:
+                clauses.append(f"id IN (SELECT article_id FROM {table} WHERE {column} = ?)")
+            params.append(value)
+        sql = ("SELECT url, title, publish_date, dominant_sentiment, action, total_score, sentiment_score"
+               + (", result" if results else "") + " FROM articles")
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY publish_date DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            self.stats["queries"] += 1
+        found = []
+        for row in rows:
+            item = {'url': row[0], 'title': row[1], 'publish_date': row[2],
+                    'dominant_sentiment': row[3], 'action': row[4], 'total_score': row[5],
+                    'sentiment_score': row[6]}
+            if results:
+                item['result'] = json.loads(zlib.decompress(row[7]))
+            found.append(item)
+        return found
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def report(self) -> str:
+        st = self.stats
+        return (f"🗄️ Haber deposu: {len(self)} haber; bu oturumda {st['stored']} haber "
+                f"{st['batches']} işlemde yazıldı, {st['queries']} sorgu")
+
+    def close(self):
+        self._conn.close()
+
+# ==================== AKIŞ (STREAMING) ANALİZİ ====================
+
+def iter_analyzed_articles(articles: Iterable[Dict],
+                           analyzer: Optional[ImprovedHousingNewsAnalyzer] = None,
+                           seen_index: Optional[SeenIndex] = None,
+                           fields: Optional[Iterable[str]] = None) -> Iterator[Tuple[Dict, Dict]]:
+    """Gelen her haberi beklemeden analiz et ve (haber, analiz) çiftleri üret.
+
+    'articles' iter_bloomberght_konut_tr_ist gibi bir generator olabilir; böylece
+    ilk analiz, crawl'un geri kalanını beklemeden hazır olur.
+    'seen_index' verilirse analiz edilen haberler işaretlenir; 'fields'
+    verilirse yalın sonuçlar üretilir (bkz. analyze_article).
+    """
+    analyzer = analyzer or ImprovedHousingNewsAnalyzer()
+    for article in articles:
+        analysis = analyzer.analyze_article(article, fields)
+        if seen_index is not None:
+            seen_index.mark_analyzed(article["url"])
+        yield article, analysis
+
+async def aiter_analyzed_articles(articles: AsyncIterable[Dict],
+                                  analyzer: Optional[ImprovedHousingNewsAnalyzer] = None,
+                                  seen_index: Optional[SeenIndex] = None,
+                                  fields: Optional[Iterable[str]] = None
+                                  ) -> AsyncIterator[Tuple[Dict, Dict]]:
+    """iter_analyzed_articles'ın asyncio sürümü.
+
+    Analiz ayrı bir thread'de çalışır; bu sırada aiter_bloomberght_konut_tr_ist
+    crawl'a devam edip kuyruğunu doldurur.
+    """
+    analyzer = analyzer or ImprovedHousingNewsAnalyzer()
+    loop = asyncio.get_running_loop()
+    async for article in articles:
+        analysis = await loop.run_in_executor(None, analyzer.analyze_article, article, fields)
+        if seen_index is not None:
+            seen_index.mark_analyzed(article["url"])
+        yield article, analysis
+
+# Her işçi süreçte bir kez kurulan analizci (bkz. _init_analysis_worker)
+_worker_analyzer: Optional[ImprovedHousingNewsAnalyzer] = None
+
+def _init_analysis_worker():
+    """İşçi süreç başlatıcısı: sözlükler ve eşleyici süreç başına bir kez derlenir."""
+    global _worker_analyzer
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        _worker_analyzer = ImprovedHousingNewsAnalyzer()
+
+def _analyze_chunk(chunk: List[Dict], fields: Optional[Iterable[str]] = None) -> List[Dict]:
+    """Bir haber parçasını işçinin analizcisiyle toplu analiz et (çıktı basılmaz)."""
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        return _worker_analyzer.analyze_articles(chunk, fields)
+
+def iter_analyzed_articles_parallel(articles: Iterable[Dict], processes: Optional[int] = None,
+                                    chunk_size: int = ANALYSIS_CHUNK_SIZE,
+                                    seen_index: Optional[SeenIndex] = None,
+                                    fields: Optional[Iterable[str]] = None) -> Iterator[Tuple[Dict, Dict]]:
+    """iter_analyzed_articles'ın çok süreçli sürümü; büyük haber arşivleri için.
+
+    Haberler chunk_size'lık parçalar halinde bir süreç havuzuna dağıtılır;
+    her işçi analizciyi yalnızca bir kez kurar ve parçayı analyze_articles
+    ile toplu işler. (haber, analiz) çiftleri girdi sırasıyla, parçalar
+    bittikçe üretilir. Bellek sınırlı kalsın diye havuzda en fazla
+    2 x processes parça bekler; tüketici erken durursa kalanlar iptal edilir.
+    İşçiler metin içi sıklıkla puanlar: TF-IDF/BM25 sonucu, haberden önce
+    sayılan belgelere bağlı olduğundan yalnızca sıralı analizde tekrarlanabilir.
+    """
+    processes = processes or os.cpu_count() or 1
+    fields = None if fields is None else tuple(fields)
+    remaining = iter(articles)
+    pool = ProcessPoolExecutor(max_workers=processes, initializer=_init_analysis_worker)
+    pending = deque()
+    try:
+        while True:
+            chunk = list(islice(remaining, chunk_size))
+            if chunk:
+                pending.append((chunk, pool.submit(_analyze_chunk, chunk, fields)))
+                if len(pending) < 2 * processes:
+                    continue
+            if not pending:
+                break
+            chunk, future = pending.popleft()
+            for article, analysis in zip(chunk, future.result()):
+                if seen_index is not None:
+                    seen_index.mark_analyzed(article["url"])
+                yield article, analysis
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+def open_jsonl(path: str, mode: str = "r"):
+    """JSON satırları dosyasını metin modunda aç; '.gz' uzantılıysa gzip ile."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+def iter_jsonl(path: str) -> Iterator[Dict]:
+    """JSONL(.gz) dosyasındaki kayıtları satır satır üret (boş satırlar atlanır)."""
+    with open_jsonl(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def _json_default(value):
+    """json.dumps için: yalın sonuçlardaki array('b') listeye, diğer tipler metne çevrilir."""
+    if isinstance(value, array):
+        return value.tolist()
+    return str(value)
+
+def _completed_results(path: str) -> Tuple[int, Optional[Dict]]:
+    """Önceki çalıştırmanın eksiksiz yazılmış sonuç satırlarını say.
+
+    Çökme sonrası yarım kalan son satır (ya da bozuk gzip kuyruğu) atılır ve
+    dosya yalnızca tam satırlarla yeniden yazılır. (satır sayısı, son sonuç) döner.
+    """
+    if not os.path.exists(path):
+        return 0, None
+    count, last, intact = 0, None, True
+    try:
+        with open_jsonl(path) as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    intact = False
+                    break
+                count += 1
+                last = line
+    except (EOFError, OSError, zlib.error):
+        intact = False
+    if not intact:
+        # Geçici dosya aynı uzantıyı taşır ki aynı biçimde (gzip/düz) yazılsın
+        tmp_path = os.path.join(os.path.dirname(path), ".yarim-" + os.path.basename(path))
+        with open_jsonl(path) as src, open_jsonl(tmp_path, "w") as dst:
+            for line in islice(src, count):
+                dst.write(line)
+        os.replace(tmp_path, path)
+    return count, json.loads(last) if last else None
+
+def analyze_jsonl_archive(input_path: str, output_path: str,
+                          analyzer: Optional[ImprovedHousingNewsAnalyzer] = None,
+                          processes: int = 1, fields: Optional[Iterable[str]] = None,
+                          flush_every: int = JSONL_FLUSH_EVERY,
+                          progress_interval: float = PROGRESS_INTERVAL,
+                          store: Optional[NewsAnalysisStore] = None,
+                          keyword_scoring: Optional[str] = None,
+                          keyword_stats_path: str = KEYWORD_STATS_PATH,
+                          near_duplicate_threshold: Optional[float] = None,
+                          near_duplicate_path: str = NEAR_DUPLICATE_INDEX_PATH,
+                          cache: Optional[AnalysisCache] = None) -> Dict:
+    """JSONL(.gz) haber arşivini akış halinde analiz edip sonuçları JSONL(.gz) dosyasına ekle.
+
+    Girdinin her satırı bir haberdir (crawl çıktısındaki title/text/giris/url);
+    çıktıya girdiyle aynı sırada, haber başına bir sıkıştırılmış JSON satırı
+    yazılır. Bellek kullanımı arşiv boyutundan bağımsızdır: haberler okundukça
+    analiz edilip yazılır. Çıktı 'flush_every' sonuçta bir diske aktarılır;
+    çalışma yarıda kalırsa aynı komut, çıktıdaki tam satırlar kadar haberi
+    atlayarak kaldığı yerden devam eder. processes > 1 ise analiz
+    iter_analyzed_articles_parallel ile süreç havuzunda yapılır. 'fields'
+    verilirse yalın sonuçlar yazılır (bkz. analyze_article). 'store'
+    verilirse sonuçlar depoya da store.batch_size'lık işlemlerle eklenir;
+    bir sonuç JSONL'a ancak depoya yazıldıktan sonra yazılır, böylece devam
+    eden çalışma depoda eksik haber bırakmaz. 'keyword_scoring' TF-IDF/BM25
+    ise anahtar kelimeler 'keyword_stats_path' tablosuyla puanlanır; bir
+    haberin ağırlıkları kendisinden önce sayılan haberlere bağlı olduğundan
+    bu da yalnızca tek süreçte yapılır (aksi halde sonuç süreç sayısına ve
+    zamanlamaya göre değişirdi).
+    'near_duplicate_threshold' verilirse yakın kopyalar 'near_duplicate_path'
+    dizinine göre kümelenir ve küme başına bir kez analiz edilir; kümeler
+    tek bir dizinde tutulduğu için bu yalnızca tek süreçte yapılır.
+    'cache' verilirse daha önce analiz edilmiş haberler (önceki çalıştırmalar
+    ya da crawl dahil) yeniden analiz edilmez; o da yalnızca tek süreçte.
+    'analyzer' verilmişse bu üç ayar yerine onunkiler geçerlidir.
+    """
+    if near_duplicate_threshold is not None and processes > 1:
+        raise ValueError("Yakın kopya tespiti tek süreçte yapılır; processes=1 kullanın")
+    if keyword_scoring not in (None, 'frequency') and processes > 1:
+        raise ValueError(f"'{keyword_scoring}' puanlaması tek süreçte yapılır; processes=1 kullanın")
+    if cache is not None and processes > 1:
+        raise ValueError("Analiz önbelleği tek süreçte kullanılır; processes=1 kullanın")
+    fields = ImprovedHousingNewsAnalyzer._lean_fields(fields)
+    done, last_result = _completed_results(output_path)
+    articles = iter_jsonl(input_path)
+    if done:
+        last_article = None
+        for last_article in islice(articles, done):
+            pass
+        last_url = last_result["article_info"]["url"] if "article_info" in last_result else last_result.get("url")
+        if last_article is None or last_article.get("url") != last_url:
+            raise ValueError(f"{output_path} bu arşive ait değil; devam etmek için önce çıktıyı silin")
+        print(f"↩️ Devam ediliyor: {done} haber önceki çalıştırmada analiz edilmiş")
+
+    keyword_stats = near_duplicates = None
+    if processes > 1:
+        results = iter_analyzed_articles_parallel(articles, processes=processes, fields=fields)
+    else:
+        if analyzer is None:
+            if keyword_scoring not in (None, 'frequency'):
+                keyword_stats = DocumentFrequencyTable(keyword_stats_path)
+            if near_duplicate_threshold is not None:
+                near_duplicates = NearDuplicateIndex(near_duplicate_path, near_duplicate_threshold)
+            analyzer = ImprovedHousingNewsAnalyzer(cache=cache, keyword_stats=keyword_stats,
+                                                   keyword_scoring=keyword_scoring,
+                                                   near_duplicates=near_duplicates)
+        results = iter_analyzed_articles(articles, analyzer, fields=fields)
+
+    analyzed = flushed = 0
+    pending: List[Tuple[Dict, Dict]] = []
+    started = last_report = time.perf_counter()
+    with open_jsonl(output_path, "a") as out, open(os.devnull, "w") as devnull:
+        try:
+            while True:
+                # Haber başına analiz çıktısı basılmaz; yalnızca ilerleme raporlanır
+                with redirect_stdout(devnull):
+                    item = next(results, None)
+                if item is None:
+                    break
+                pending.append(item)
+                if store is not None and len(pending) < store.batch_size:
+                    continue
+                analyzed += _write_results(out, pending, store)
+                if analyzed - flushed >= flush_every:
+                    out.flush()
+                    flushed = analyzed
+                now = time.perf_counter()
+                if now - last_report >= progress_interval:
+                    last_report = now
+                    print(f"⏱️ {done + analyzed} haber ({analyzed / (now - started):.1f} haber/sn)")
+        finally:
+            analyzed += _write_results(out, pending, store)
+            results.close()
+            for index in (keyword_stats, near_duplicates):
+                if index is not None:
+                    print(index.report())
+                    index.close()
+
+    elapsed = time.perf_counter() - started
+    rate = analyzed / elapsed if elapsed > 0 else 0.0
+    print(f"✅ {analyzed} haber analiz edildi ({rate:.1f} haber/sn), toplam {done + analyzed} sonuç: {output_path}")
+    return {"resumed": done, "analyzed": analyzed, "seconds": elapsed, "rate": rate}
+
+def _write_results(out, items: List[Tuple[Dict, Dict]], store: Optional[NewsAnalysisStore]) -> int:
+    """(haber, sonuç) çiftlerini önce depoya, sonra JSONL'a yaz ve listeyi boşalt."""
+    if store is not None and items:
+        store.add_many(items)
+    for _, result in items:
+        out.write(json.dumps(result, ensure_ascii=False, separators=(",", ":"), default=_json_default) + "\n")
+    written = len(items)
+    items.clear()
+    return written
+
+def run_analysis_on_article(article: Dict, analyzer: Optional[ImprovedHousingNewsAnalyzer] = None):
     """Tek bir haber için analiz çalıştır"""
-    analyzer = ImprovedHousingNewsAnalyzer()
+    analyzer = analyzer or ImprovedHousingNewsAnalyzer()
     
     print("🔍 Haber analiz ediliyor...")
     print(f"📰 Haber: {article.get('title')}")
@@ -1009,25 +4043,109 @@ def run_analysis_on_article(article: Dict):
 
 # Ana çalıştırma kodu
 if __name__ == "__main__":
+    cli = argparse.ArgumentParser(description="BloombergHT konut haberleri analizi")
+    cli.add_argument("--girdi", help="Haberleri crawl yerine bu JSONL(.gz) arşivinden oku ve akış halinde analiz et")
+    cli.add_argument("--cikti", default="haber_analizleri.jsonl",
+                     help="--girdi sonuçlarının ekleneceği JSONL(.gz) dosyası; varsa kaldığı yerden devam edilir")
+    cli.add_argument("--surec", type=int, default=1, help="--girdi analizinde kullanılacak süreç sayısı")
+    cli.add_argument("--yalin", action="store_true", help="--girdi sonuçlarını yalın biçimde yaz")
+    cli.add_argument("--alanlar", default="",
+                     help=f"Yalın sonuca eklenecek bölümler, virgülle ({','.join(LEAN_RESULT_FIELDS)})")
+    cli.add_argument("--depo", default=NEWS_STORE_PATH, help="Sonuçların ayrıca ekleneceği SQLite haber deposu")
+    cli.add_argument("--depo-yok", action="store_true", help="Sonuçları haber deposuna ekleme")
+    cli.add_argument("--puanlama", choices=KEYWORD_SCORING_MODES, default="frequency",
+                     help="Anahtar kelime sıralaması: metin içi sıklık, TF-IDF ya da BM25 (TF-IDF/BM25 tek süreçte)")
+    cli.add_argument("--df-tablosu", default=KEYWORD_STATS_PATH,
+                     help="TF-IDF/BM25 belge sıklıklarının artımlı güncellendiği SQLite tablosu")
+    cli.add_argument("--yakin-kopya", type=float, metavar="ESIK",
+                     help=f"Yakın kopyaları bu benzerlik eşiğiyle (ör. {NEAR_DUPLICATE_THRESHOLD}) kümele "
+                          "ve küme başına bir kez analiz et (--girdi ile tek süreçte)")
+    cli.add_argument("--kopya-dizini", default=NEAR_DUPLICATE_INDEX_PATH,
+                     help="Yakın kopya imzalarının tutulduğu SQLite dizini")
+    cli.add_argument("--analiz-onbellegi", nargs="?", const=ANALYSIS_CACHE_PATH, metavar="YOL",
+                     help=f"Analizleri kalıcı önbellekte tut; aynı haber çalıştırmalar arasında yeniden "
+                          f"analiz edilmez (varsayılan yol {ANALYSIS_CACHE_PATH}, --girdi ile tek süreçte)")
+    cli.add_argument("--artimli", nargs="?", const=SEEN_INDEX_PATH, metavar="YOL",
+                     help=f"Artımlı crawl (ör. saatlik cron): görülen URL'ler bu dizinde tutulur, yalnızca yeni "
+                          f"ya da değişmiş haberler çekilip analiz edilir (varsayılan yol {SEEN_INDEX_PATH})")
+    cli.add_argument("--http-onbellek", nargs="?", const=HTTP_CACHE_PATH, metavar="YOL",
+                     help=f"Crawl yanıtlarını kalıcı HTTP önbelleğinde tut ve koşullu GET ile doğrula "
+                          f"(varsayılan yol {HTTP_CACHE_PATH})")
+    archive_args = cli.add_mutually_exclusive_group()
+    archive_args.add_argument("--arsiv-kaydet", metavar="YOL",
+                              help="Crawl'un ağ trafiğini bu HTTP arşivine (jsonl.gz) kaydet")
+    archive_args.add_argument("--arsiv-oynat", metavar="YOL",
+                              help="Crawl'u ağa çıkmadan bu HTTP arşivinden oynat")
+    cli_args = cli.parse_args()
+    news_store = None if cli_args.depo_yok else NewsAnalysisStore(cli_args.depo)
+    analysis_cache = AnalysisCache(cli_args.analiz_onbellegi) if cli_args.analiz_onbellegi else None
+    if cli_args.girdi:
+        lean_fields = [f for f in cli_args.alanlar.split(",") if f] if cli_args.yalin or cli_args.alanlar else None
+        analyze_jsonl_archive(cli_args.girdi, cli_args.cikti, processes=cli_args.surec, fields=lean_fields,
+                              store=news_store, keyword_scoring=cli_args.puanlama,
+                              keyword_stats_path=cli_args.df_tablosu,
+                              near_duplicate_threshold=cli_args.yakin_kopya,
+                              near_duplicate_path=cli_args.kopya_dizini, cache=analysis_cache)
+        if analysis_cache is not None:
+            print(analysis_cache.report())
+            analysis_cache.close()
+        if news_store is not None:
+            print(news_store.report())
+            news_store.close()
+        sys.exit(0)
+    
     print("🚀 GELİŞMİŞ BLOOMBERGHT KONUT HABER ANALİZ SİSTEMİ")
     print("="*80)
     
     # Önce haberleri çek
     print("\n📥 BloombergHT'den konut haberleri çekiliyor...")
-    articles = crawl_bloomberght_konut_tr_ist(max_results=1)
+    crawl_fetcher = None
+    if cli_args.http_onbellek or cli_args.arsiv_kaydet or cli_args.arsiv_oynat:
+        archive = None
+        if cli_args.arsiv_kaydet or cli_args.arsiv_oynat:
+            archive = HttpArchive(cli_args.arsiv_kaydet or cli_args.arsiv_oynat,
+                                  mode="record" if cli_args.arsiv_kaydet else "replay")
+        crawl_fetcher = HttpFetcher(archive=archive,
+                                    cache=HttpCache(cli_args.http_onbellek) if cli_args.http_onbellek else None)
+    seen_index = SeenIndex(cli_args.artimli) if cli_args.artimli else None
+    # Artımlı çalışmada liste penceresindeki tüm yeni ya da değişmiş haberler çekilir
+    articles = crawl_bloomberght_konut_tr_ist(max_results=1 if seen_index is None else PREFILTER_LIMIT,
+                                              fetcher=crawl_fetcher, seen_index=seen_index)
+    if crawl_fetcher is not None:
+        crawl_fetcher.close()
+        if crawl_fetcher.cache is not None:
+            crawl_fetcher.cache.close()
     
     if articles:
         # İlk haberi analiz et
         article = articles[0]
         
         # NLP analizini çalıştır
-        analysis_result = run_analysis_on_article(article)
+        keyword_stats = None if cli_args.puanlama == "frequency" else DocumentFrequencyTable(cli_args.df_tablosu)
+        analyzer = ImprovedHousingNewsAnalyzer(cache=analysis_cache, keyword_stats=keyword_stats,
+                                               keyword_scoring=cli_args.puanlama)
+        analysis_result = run_analysis_on_article(article, analyzer)
+        if seen_index is not None:
+            seen_index.mark_analyzed(article["url"])
+            # Diğer yeni haberler ayrıntı basılmadan analiz edilip depoya eklenir
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                other_results = list(iter_analyzed_articles(articles[1:], analyzer, seen_index=seen_index))
+            if news_store is not None:
+                for other, other_result in other_results:
+                    news_store.add(other, other_result)
+            print(f"🔖 Artımlı çalışma: {len(articles)} yeni ya da değişmiş haber analiz edildi")
+        if keyword_stats is not None:
+            print(keyword_stats.report())
+            keyword_stats.close()
         
         # JSON olarak kaydet
         with open('haber_analizi_detayli.json', 'w', encoding='utf-8') as f:
             json.dump(analysis_result, f, ensure_ascii=False, indent=2, default=str)
         
         print("✅ Analiz tamamlandı ve 'haber_analizi_detayli.json' dosyasına kaydedildi.")
+        if news_store is not None:
+            news_store.add(article, analysis_result)
+            print(news_store.report())
         
         # Senaryodaki formatta öneri oluştur
         print("\n" + "="*80)
@@ -1092,4 +4210,15 @@ if __name__ == "__main__":
         else:
             print("   ✅ Önemli risk faktörü tespit edilmedi")
     else:
-        print("❌ Analiz edilecek haber bulunamadı.")
\ No newline at end of file
+        print("❌ Analiz edilecek haber bulunamadı.")
+    
+    if seen_index is not None:
+        # Crawl sonu raporundan sonra analiz zamanı değiştiyse güncel hali basılır
+        if articles:
+            print(seen_index.report())
+        seen_index.close()
+    if analysis_cache is not None:
+        print(analysis_cache.report())
+        analysis_cache.close()
+    if news_store is not None:
+        news_store.close()
\ No newline at end of file
@@ -7,14 +7,22 @@ import requests
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import urljoin
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.model_selection import train_test_split
 import warnings
 warnings.filterwarnings('ignore')
 import json
+import os
 import random
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+
+if TYPE_CHECKING:
+    from haber_analizi_bloomberght import NewsAnalysisStore
 
 app = Flask(__name__)
 CORS(app)
@@ -25,19 +33,242 @@ scaler = StandardScaler()
 label_encoders = {}
 feature_columns = []
 
+# ==================== HABER KAYNAĞI ADAPTÖRLERİ ====================
+
+HABER_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0 Safari/537.36"
+    )
+}
+
+# Bir kaynağın yanıt vermesi için beklenecek en uzun süre (sn)
+KAYNAK_ZAMAN_ASIMI = 4.0
+# Kaynak sayfalarının okunduğu parça boyutu (bayt)
+KAYNAK_PARCA_BOYUTU = 64 * 1024
+
+# Haber başına etki puanının sınırı (simüle haberlerdeki ±2 ölçeği); birden
+# çok anahtar kelime eşleşen haberin toplam etkisi bu aralığa kırpılır
+HABER_ETKI_SINIRI = 2.0
+
+# Başlık kelimelerinin Jaccard benzerliği bu eşiği geçen canlı haberler aynı
+# haberin başka kaynaktaki kopyası sayılır
+HABER_KOPYA_ESIGI = 0.8
+
+_KUCUK_HARF_TABLOSU = str.maketrans({'I': 'ı', 'İ': 'i'})
+_ASCII_TABLOSU = str.maketrans('çğıöşüâîû', 'cgiosuaiu')
+
+def turkce_kucult(metin: str) -> str:
+    """Türkçe kurallarla küçült ('İ' -> 'i', 'I' -> 'ı')"""
+    return metin.translate(_KUCUK_HARF_TABLOSU).lower()
+
+def ascii_katla(metin: str) -> str:
+    """Küçültüp Türkçe karakterleri ASCII karşılıklarına çevir (ilçe eşleştirme için)"""
+    return turkce_kucult(metin).translate(_ASCII_TABLOSU)
+
+def etki_sinirla(etki: float) -> float:
+    """Etki puanını ±HABER_ETKI_SINIRI aralığına kırp"""
+    return round(max(-HABER_ETKI_SINIRI, min(HABER_ETKI_SINIRI, etki)), 2)
+
+
+class HaberKaynagi:
+    """Tek bir haber sitesi için adaptör.
+
+    Liste sayfasındaki haber kartlarını CSS seçicileriyle okur ve ham haber
+    sözlükleri (baslik, icerik, kaynak, tarih, url) döndürür. Farklı yapıdaki
+    siteler için alt sınıflar seçicileri ya da haberleri_ayikla'yı değiştirir.
+    'url' verilirse varsayılan adres yerine kullanılır (ör. yerel fixture sunucusu).
+    """
+
+    ad = 'Kaynak'
+    varsayilan_url = ''
+    kart_secici = 'article'
+    baslik_secici = 'h2 a, h3 a'
+    ozet_secici = 'p'
+    tarih_secici = 'time'
+
+    def __init__(self, url: str = None, zaman_asimi: float = KAYNAK_ZAMAN_ASIMI):
+        self.url = url or self.varsayilan_url
+        self.zaman_asimi = zaman_asimi
+
+    def cek(self, limit: int = 10) -> List[Dict]:
+        """Liste sayfasını indir ve en fazla 'limit' ham haber döndür"""
+        return self.haberleri_ayikla(self.indir())[:limit]
+
+    def indir(self) -> str:
+        """Liste sayfasını en fazla 'zaman_asimi' saniyede indir.
+
+        requests'in timeout'u yalnızca tek bir okumayı sınırlar; baytları
+        yavaşça gönderen bir site isteği süresiz uzatabilir. Gövde parça parça
+        okunur ve toplam süre aşılınca requests.Timeout fırlatılır, böylece
+        takılan istek thread'ini en geç bir okuma süresi sonra bırakır.
+        """
+        baslangic = time.monotonic()
+        with requests.get(self.url, headers=HABER_HEADERS, timeout=self.zaman_asimi, stream=True) as yanit:
+            yanit.raise_for_status()
+            # urllib3 2'nin read1'i gelen baytı parça dolmasını beklemeden döndürür
+            if hasattr(yanit.raw, 'read1'):
+                akis = iter(lambda: yanit.raw.read1(KAYNAK_PARCA_BOYUTU, decode_content=True), b'')
+            else:
+                akis = yanit.iter_content(KAYNAK_PARCA_BOYUTU)
+            parcalar = []
+            for parca in akis:
+                if time.monotonic() - baslangic > self.zaman_asimi:
+                    raise requests.Timeout(f"{self.ad}: {self.zaman_asimi} sn içinde indirilemedi")
+                parcalar.append(parca)
+            return str(b''.join(parcalar), yanit.encoding or yanit.apparent_encoding or 'utf-8', errors='replace')
+
+    def haberleri_ayikla(self, html: str) -> List[Dict]:
+        soup = BeautifulSoup(html, 'html.parser')
+        haberler = []
+        gorulen = set()
+
+        for kart in soup.select(self.kart_secici):
+            link = kart.select_one(self.baslik_secici)
+            if link is None:
+                continue
+            baslik = link.get_text(' ', strip=True)
+            url = urljoin(self.url, link.get('href') or '#')
+            if not baslik or url in gorulen:
+                continue
+            gorulen.add(url)
+
+            ozet = kart.select_one(self.ozet_secici)
+            haberler.append({
+                'baslik': baslik,
+                'icerik': ozet.get_text(' ', strip=True) if ozet else '',
+                'kaynak': self.ad,
+                'tarih': self.tarih_oku(kart.select_one(self.tarih_secici)),
+                'url': url
+            })
+
+        return haberler
+
+    @staticmethod
+    def tarih_oku(etiket) -> str:
+        """<time> etiketinden gg.aa.yyyy tarih üret; bulunamazsa bugünü kullan"""
+        if etiket is not None:
+            deger = etiket.get('datetime') or etiket.get_text(strip=True)
+            try:
+                return datetime.fromisoformat(deger[:10]).strftime('%d.%m.%Y')
+            except ValueError:
+                if deger:
+                    return deger
+        return datetime.now().strftime('%d.%m.%Y')
+
+
+class EmlakKulisiKaynagi(HaberKaynagi):
+    ad = 'EmlakKulisi'
+    varsayilan_url = 'https://www.emlakkulisi.com/'
+    kart_secici = 'article, div.news-item'
+
+
+class EmlakNewsKaynagi(HaberKaynagi):
+    ad = 'EmlakNews'
+    varsayilan_url = 'https://www.emlaknews.com.tr/'
+    kart_secici = 'article, div.post'
+
+
+class HurriyetEmlakKaynagi(HaberKaynagi):
+    ad = 'HürriyetEmlak'
+    varsayilan_url = 'https://www.hurriyetemlak.com/haberler'
+    kart_secici = 'article, div.news-card'
+
+
+class MilliyetEmlakKaynagi(HaberKaynagi):
+    ad = 'Milliyet'
+    varsayilan_url = 'https://www.milliyet.com.tr/emlak/'
+    kart_secici = 'article, div.news-card'
+
+
+class SozcuEmlakKaynagi(HaberKaynagi):
+    ad = 'Sözcü'
+    varsayilan_url = 'https://www.sozcu.com.tr/kategori/emlak/'
+    kart_secici = 'article, div.news-card'
+
+
+def varsayilan_haber_kaynaklari() -> List[HaberKaynagi]:
+    return [EmlakKulisiKaynagi(), EmlakNewsKaynagi(), HurriyetEmlakKaynagi(),
+            MilliyetEmlakKaynagi(), SozcuEmlakKaynagi()]
+
+
+class HaberToplayici:
+    """Tüm kaynakları eşzamanlı çeken toplayıcı.
+
+    Her kaynak ayrı bir thread'de çekilir; toplam süre kaynakların toplamıyla
+    değil en uzun zaman aşımıyla sınırlıdır. Süresi içinde yanıt vermeyen ya
+    da hata veren kaynaklar atlanır, diğerlerinin haberleri (kısmi sonuç)
+    döndürülür. Son çağrının kaynak bazlı durumu 'son_durum' içinde tutulur.
+    Her çağrı kendi thread havuzunu kurar: süresi dolmuş ama hâlâ çalışan
+    bir istek (bkz. HaberKaynagi.indir) sonraki çağrıların önünü tıkamaz.
+    """
+
+    def __init__(self, kaynaklar: List[HaberKaynagi]):
+        self.kaynaklar = kaynaklar
+        self.son_durum = {}
+
+    @staticmethod
+    def _zamanli_cek(kaynak: HaberKaynagi, limit: int) -> Tuple[List[Dict], float]:
+        baslangic = time.monotonic()
+        haberler = kaynak.cek(limit)
+        return haberler, time.monotonic() - baslangic
+
+    def topla(self, kaynak_basina: int = 10) -> List[Dict]:
+        """Her kaynaktan en fazla 'kaynak_basina' haber çek; kaynak sırasını korur"""
+        if not self.kaynaklar:
+            return []
+
+        havuz = ThreadPoolExecutor(max_workers=len(self.kaynaklar), thread_name_prefix='haber-kaynagi')
+        isler = {havuz.submit(self._zamanli_cek, kaynak, kaynak_basina): kaynak
+                 for kaynak in self.kaynaklar}
+        # Havuz beklenmeden kapatılır; yavaş kaynağın thread'i bitince kendiliğinden çıkar
+        havuz.shutdown(wait=False)
+        bitenler, _ = wait(isler, timeout=max(k.zaman_asimi for k in self.kaynaklar))
+
+        haberler = []
+        durum = {}
+        for is_, kaynak in isler.items():
+            if is_ not in bitenler:
+                is_.cancel()
+                durum[kaynak.ad] = {'durum': 'zaman_asimi', 'haber_sayisi': 0}
+                continue
+            try:
+                kaynak_haberleri, sure = is_.result()
+            except Exception as e:
+                durum[kaynak.ad] = {'durum': 'hata', 'haber_sayisi': 0, 'hata': str(e)}
+                continue
+            # Havuz beklemesi uzun sürdüyse kaynağın kendi süresi aşılmış olabilir
+            if sure > kaynak.zaman_asimi:
+                durum[kaynak.ad] = {'durum': 'zaman_asimi', 'haber_sayisi': 0}
+                continue
+            durum[kaynak.ad] = {'durum': 'tamam', 'haber_sayisi': len(kaynak_haberleri),
+                                'sure': round(sure, 3)}
+            haberler.extend(kaynak_haberleri)
+
+        self.son_durum = durum
+        return haberler
+
 # ==================== HABER ANALİZ MODÜLÜ ====================
 
 class HaberAnalizSistemi:
-    """Haberlerden piyasa analizi yapan sistem"""
+    """Haberlerden piyasa analizi yapan sistem.
+
+    Bir analiz deposu (haber_deposu.sqlite) verilirse ya da varsa, ilçe
+    analizleri depoda güncel tutulan ilçe/gün toplamlarından okunur;
+    yoksa haberler kaynaklardan çekilip analiz edilir.
+    """
     
-    def __init__(self):
-        self.haber_kaynaklari = [
-            'https://www.emlakkulisi.com/',
-            'https://www.emlaknews.com.tr/',
-            'https://www.hurriyetemlak.com/haberler',
-            'https://www.milliyet.com.tr/emlak/',
-            'https://www.sozcu.com.tr/kategori/emlak/'
-        ]
+    def __init__(self, kaynaklar: Optional[List[HaberKaynagi]] = None,
+                 depo: Optional['NewsAnalysisStore'] = None):
+        self.haber_toplayici = HaberToplayici(
+            kaynaklar if kaynaklar is not None else varsayilan_haber_kaynaklari()
+        )
+        self.haber_kaynaklari = [kaynak.url for kaynak in self.haber_toplayici.kaynaklar]
+        # Depo (ve tarayıcı modülü) ilk kullanımda açılır; uygulamanın içe aktarılması yavaşlamaz
+        self._haber_deposu = depo
+        self._depo_arandi = depo is not None
+        self._depo_ilceleri = None
         
         # Anahtar kelimeler ve etkileri
         self.anahtar_kelimeler = {
@@ -80,9 +311,68 @@ class HaberAnalizSistemi:
             'gaziosmanpasa': 0.7, 'ortakoy': 1.2, 'etiler': 1.4,
             'nisantasi': 1.4, 'bebek': 1.3, 'levent': 1.2, 'maslak': 1.2
         }
+        # İlçe adı tam kelime ya da kesme işaretli ekle geçmeli ('bebekler' Bebek değildir)
+        self._ilce_deseni = re.compile(
+            r'\b(' + '|'.join(sorted(self.ilce_agirliklari, key=len, reverse=True)) + r')(?!\w)'
+        )
     
     def haber_cek(self, ilce: str = None, limit: int = 10) -> List[Dict]:
-        """Haberleri çek (simülasyon - gerçek uygulamada BeautifulSoup ile çekilecek)"""
+        """Haberleri tüm kaynaklardan eşzamanlı çek.
+
+        Başka kaynaklardaki kopyalar elenir; hiçbir kaynaktan haber gelmezse
+        simüle edilmiş haberlere dönülür.
+        İlçeyle ilgili ve anahtar kelime içeren haberler listenin başına alınır.
+        """
+        haberler = self.kopyalari_ele([self.haber_normalize_et(haber, ilce)
+                                       for haber in self.haber_toplayici.topla(kaynak_basina=limit)])
+        if not haberler:
+            return self.simule_haber_cek(ilce, limit)
+
+        haberler.sort(key=lambda h: (not ilce or h['ilgili_ilce'] != ilce, h['etki'] == 0))
+        return haberler[:limit]
+
+    @staticmethod
+    def kopyalari_ele(haberler: List[Dict]) -> List[Dict]:
+        """Birden çok kaynağın yayımladığı aynı haberin yalnızca ilk kopyasını tut.
+
+        Aynı ajans haberi kaynaklarda küçük başlık farklarıyla yer alır;
+        kopyalar sayılırsa haber analizinde etkisi katlanır.
+        """
+        tekiller, kelime_kumeleri = [], []
+        for haber in haberler:
+            kelimeler = set(re.findall(r'\w+', ascii_katla(haber['baslik'])))
+            if kelimeler and any(len(kelimeler & k) / len(kelimeler | k) >= HABER_KOPYA_ESIGI
+                                 for k in kelime_kumeleri):
+                continue
+            kelime_kumeleri.append(kelimeler)
+            tekiller.append(haber)
+        return tekiller
+
+    def haber_normalize_et(self, haber: Dict, ilce: str = None) -> Dict:
+        """Ham kaynak haberini etki / kategori / ilgili_ilce alanlarıyla tamamla"""
+        metin = turkce_kucult(f"{haber.get('baslik', '')} {haber.get('icerik', '')}")
+        eslesenler = [bilgi for kelime, bilgi in self.anahtar_kelimeler.items() if kelime in metin]
+
+        return {
+            'baslik': haber.get('baslik', ''),
+            'icerik': haber.get('icerik', ''),
+            'kaynak': haber.get('kaynak', ''),
+            'tarih': haber.get('tarih', datetime.now().strftime('%d.%m.%Y')),
+            'url': haber.get('url', '#'),
+            'etki': etki_sinirla(sum(bilgi['etki'] for bilgi in eslesenler)),
+            'kategori': max(eslesenler, key=lambda b: abs(b['etki']))['kategori'] if eslesenler else 'genel',
+            'ilgili_ilce': self.ilgili_ilce_bul(metin, ilce)
+        }
+
+    def ilgili_ilce_bul(self, metin: str, ilce: str = None) -> str:
+        """Metinde geçen ilçeyi bul; aranan ilçe geçiyorsa onu, hiçbiri yoksa 'genel' döndür"""
+        bulunanlar = self._ilce_deseni.findall(ascii_katla(metin))
+        if ilce and ascii_katla(ilce) in bulunanlar:
+            return ilce
+        return bulunanlar[0] if bulunanlar else 'genel'
+
+    def simule_haber_cek(self, ilce: str = None, limit: int = 10) -> List[Dict]:
+        """Simüle edilmiş haberler (kaynaklara ulaşılamadığında kullanılır)"""
         
         # Simüle edilmiş haberler (gerçek uygulamada web scraping yapılacak)
         bugun = datetime.now()
@@ -180,6 +470,99 @@ class HaberAnalizSistemi:
         random.shuffle(haberler)
         return haberler[:limit]
     
+    @property
+    def haber_deposu(self) -> Optional['NewsAnalysisStore']:
+        """Analiz deposu; verilmediyse varsayılan dosya varsa ilk erişimde açılır"""
+        if not self._depo_arandi:
+            self._depo_arandi = True
+            from haber_analizi_bloomberght import NEWS_STORE_PATH, NewsAnalysisStore
+            if os.path.exists(NEWS_STORE_PATH):
+                self._haber_deposu = NewsAnalysisStore(NEWS_STORE_PATH)
+        return self._haber_deposu
+
+    def depo_ilcesi(self, ilce: str = None) -> str:
+        """İlçe adını ('kadikoy', 'Kadıköy') depodaki Türkçe ilçe adına çevir; bilinmiyorsa 'genel'"""
+        from haber_analizi_bloomberght import ALL_DISTRICTS, load_nlp_resources
+        if self._depo_ilceleri is None:
+            self._depo_ilceleri = {ascii_katla(ad): ad for ad in load_nlp_resources()['istanbul_districts']}
+        return self._depo_ilceleri.get(ascii_katla(ilce), ALL_DISTRICTS) if ilce else ALL_DISTRICTS
+
+    def ilce_agirligi(self, ilce: str = None) -> float:
+        """İlçenin haber etkisi ağırlığı (depo ve canlı yol için ortak; bilinmiyorsa 1.0)"""
+        return self.ilce_agirliklari.get(ascii_katla(ilce), 1.0) if ilce else 1.0
+
+    def haber_iklimi(self, ilce: str = None) -> Optional[Dict]:
+        """İlçenin son 7/30/90 gündeki haber iklimi (depo yoksa None).
+
+        Toplamlar depoya her haber eklendiğinde güncellenir; okuma haber
+        sayısından bağımsızdır.
+        """
+        if self.haber_deposu is None:
+            return None
+        iklim = {}
+        for gun, ozet in self.haber_deposu.climate(self.depo_ilcesi(ilce)).items():
+            iklim[f'{gun}_gun'] = {
+                'haber_sayisi': ozet['articles'],
+                'pozitif': ozet['positive'],
+                'negatif': ozet['negative'],
+                'notr': ozet['neutral'],
+                'ortalama_duygu': round(ozet['avg_sentiment'], 3),
+                'ortalama_puan': round(ozet['avg_score'], 3),
+                'ortalama_yuzde': None if ozet['avg_percentage'] is None else round(ozet['avg_percentage'], 2),
+                'ortalama_kfe': None if ozet['avg_kfe'] is None else round(ozet['avg_kfe'], 2),
+                'kurallar': ozet['rules']
+            }
+        return iklim
+
+    def ilce_haber_analizi(self, ilce: str = None, limit: int = 20, canli: bool = False) -> Tuple[Dict, List[Dict]]:
+        """İlçe için (analiz, haberler) döndür.
+
+        Depoda son 30 güne ait haber varsa analiz hazır toplamlardan, haber
+        listesi depodaki son haberlerden kurulur; yoksa ya da canli=True ise
+        haberler kaynaklardan çekilip haber_analizi_yap ile analiz edilir.
+        """
+        iklim = None if canli else self.haber_iklimi(ilce)
+        if not iklim or not iklim['30_gun']['haber_sayisi']:
+            haberler = self.haber_cek(ilce=ilce, limit=limit)
+            return self.haber_analizi_yap(haberler, ilce), haberler
+
+        from haber_analizi_bloomberght import ALL_DISTRICTS
+        ozet = iklim['30_gun']
+        depo_ilcesi = self.depo_ilcesi(ilce)
+        # Haber etkisi canlı yoldakiyle aynı ölçekte: duygu puanı (-1..1) x 2
+        haberler = [
+            {
+                'baslik': kayit['title'],
+                'kaynak': 'BloombergHT',
+                'tarih': kayit['publish_date'],
+                'url': kayit['url'],
+                'etki': etki_sinirla(kayit['sentiment_score'] * 2),
+                'duygu': kayit['dominant_sentiment'],
+                'ilgili_ilce': depo_ilcesi
+            }
+            for kayit in self.haber_deposu.query(district=None if depo_ilcesi == ALL_DISTRICTS else depo_ilcesi,
+                                                 days=30, end=datetime.now().strftime('%Y-%m-%d'),
+                                                 limit=limit, results=False)
+        ]
+        ilce_agirligi = self.ilce_agirligi(ilce)
+        # Etki: haber başına ortalama duygu puanı (-1..1) x 2, ilçe ağırlığıyla
+        ortalama_etki = ozet['ortalama_duygu'] * 2 * ilce_agirligi
+        analiz = {
+            'toplam_etki': ortalama_etki * ozet['haber_sayisi'],
+            'ortalama_etki': ortalama_etki,
+            'haber_puani': max(0, min(10, 5 + ortalama_etki * 2)),
+            'pozitif_haber_sayisi': ozet['pozitif'],
+            'negatif_haber_sayisi': ozet['negatif'],
+            'nötr_haber_sayisi': ozet['notr'],
+            'haber_yogunlugu': ozet['haber_sayisi'] / 30,  # Günlük haber sayısı
+            'kategori_analizi': {kural: {'toplam': bilgi['score'], 'sayi': bilgi['fired']}
+                                 for kural, bilgi in ozet['kurallar'].items()},
+            'ilce_agirligi': ilce_agirligi,
+            'haber_iklimi': iklim,
+            'kaynak': 'depo'
+        }
+        return analiz, haberler
+
     def haber_analizi_yap(self, haber_listesi: List[Dict], ilce: str = None) -> Dict:
         """Haber analizi yap ve puan hesapla"""
         
@@ -204,7 +587,7 @@ class HaberAnalizSistemi:
                 negatif_haber_sayisi += 1
         
         # İlçe ağırlığını uygula
-        ilce_agirligi = self.ilce_agirliklari.get(ilce.lower() if ilce else 'ortalam', 1.0)
+        ilce_agirligi = self.ilce_agirligi(ilce)
         toplam_etki *= ilce_agirligi
         
         # Ortalama etki ve yoğunluk
@@ -226,7 +609,9 @@ class HaberAnalizSistemi:
             'nötr_haber_sayisi': len(haber_listesi) - pozitif_haber_sayisi - negatif_haber_sayisi,
             'haber_yogunlugu': haber_yogunlugu,
             'kategori_analizi': kategoriler,
-            'ilce_agirligi': ilce_agirligi
+            'ilce_agirligi': ilce_agirligi,
+            'haber_iklimi': self.haber_iklimi(ilce),
+            'kaynak': 'canli'
         }
 
 # ==================== KİŞİSELLEŞTİRİLMİŞ ÖNERİ SİSTEMİ ====================
@@ -526,8 +911,7 @@ class GelismisEvDegerlemeSistemi:
         
         # 2. Haber analizi yap
         ilce = ev_degeri.get('ilce', '').lower()
-        haberler = self.haber_analiz.haber_cek(ilce=ilce, limit=15)
-        haber_analizi = self.haber_analiz.haber_analizi_yap(haberler, ilce)
+        haber_analizi, haberler = self.haber_analiz.ilce_haber_analizi(ilce, limit=15)
         
         # 3. Piyasa puanı (model tahmini + haber analizi)
         piyasa_puani = (haber_analizi['haber_puani'] + 
@@ -723,14 +1107,33 @@ def haber_analizi():
         data = request.get_json()
         ilce = data.get('ilce', 'İstanbul')
         
-        haberler = sistem.haber_analiz.haber_cek(ilce=ilce, limit=20)
-        analiz = sistem.haber_analiz.haber_analizi_yap(haberler, ilce)
+        analiz, haberler = sistem.haber_analiz.ilce_haber_analizi(ilce, limit=20, canli=data.get('canli', False))
         
         return jsonify({
             'success': True,
             'ilce': ilce,
             'analiz': analiz,
             'haberler': haberler[:10],
+            'kaynak_durumu': sistem.haber_analiz.haber_toplayici.son_durum,
+            'timestamp': datetime.now().isoformat()
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/haber-iklimi/<ilce>', methods=['GET'])
+def haber_iklimi(ilce):
+    """İlçenin 7/30/90 günlük haber iklimi (depodaki hazır toplamlardan)"""
+    try:
+        iklim = sistem.haber_analiz.haber_iklimi(ilce)
+        if iklim is None:
+            return jsonify({'error': 'Haber deposu bulunamadı'}), 404
+        
+        return jsonify({
+            'success': True,
+            'ilce': ilce,
+            'depo_ilcesi': sistem.haber_analiz.depo_ilcesi(ilce),
+            'iklim': iklim,
             'timestamp': datetime.now().isoformat()
         })
         
@@ -815,6 +1218,7 @@ if __name__ == '__main__':
     🌐 API Endpoint'leri:
     - POST /advanced-predict : Tam analiz
     - POST /haber-analizi    : Haber analizi
+    - GET  /haber-iklimi/<ilce> : 7/30/90 günlük haber iklimi
     - POST /oneri-sistemi    : Öneri sistemi
     - POST /predict          : Mevcut tahmin (geriye uyumlu)
     
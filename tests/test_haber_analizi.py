@@ -0,0 +1,118 @@
+"""haber_analizi_bloomberght bileşenleri: analiz önbelleği ile BM25, kural
+yeniden yükleme ve artımlı crawl dizini."""
+
+import contextlib
+import io
+import json
+import os
+
+import pytest
+
+import haber_analizi_bloomberght as hab
+
+RULES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "karar_kurallari.json")
+
+METINLER = [
+    "TCMB politika faizini indirdi, konut kredisi faiz oranı geriledi ve İstanbul'da talep artışı başladı.",
+    "İstanbul'da kira artışı sürerken konut fiyat endeksi yüzde 2,1 yükseldi; arz azlığı fiyatları itiyor.",
+    "Ankara'da konut satışları geriledi, yüksek faiz nedeniyle ipotekli satışlar yüzde 30 azaldı.",
+    "Kentsel dönüşüm projeleri Kadıköy ve Üsküdar'da hızlandı, yeni konut arzı yolda.",
+]
+
+
+def haberler():
+    """Son haber ilkinin aynısıdır (farklı URL): önbellekten gelir"""
+    items = [{"title": f"Konut haberi {i}", "text": metin, "url": f"https://ornek/{i}"}
+             for i, metin in enumerate(METINLER)]
+    return items + [dict(items[0], url="https://ornek/tekrar")]
+
+
+def sessiz(fn, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args, **kwargs)
+
+
+def anahtar_kelimeler(sonuclar):
+    return [sonuc["nlp_analysis"]["keywords"]["top_keywords"] for sonuc in sonuclar]
+
+
+def bm25_analizci(tmp_path, ad, cache=None):
+    stats = hab.DocumentFrequencyTable(str(tmp_path / f"{ad}.sqlite"))
+    return sessiz(hab.ImprovedHousingNewsAnalyzer, cache=cache, keyword_stats=stats, keyword_scoring="bm25")
+
+
+@pytest.mark.parametrize("toplu", [False, True])
+def test_onbellek_isabeti_bm25_tablosunu_gunceller(tmp_path, toplu):
+    cache = hab.AnalysisCache(str(tmp_path / "cache.sqlite"))
+    sessiz(bm25_analizci(tmp_path, "isitma", cache).analyze_articles, haberler())
+    iskalar = cache.stats["misses"]
+
+    # Aynı önbellek, boş bir belge sıklığı tablosuyla: her haber isabettir
+    analizci = bm25_analizci(tmp_path, "isabet", cache)
+    if toplu:
+        sonuclar = sessiz(analizci.analyze_articles, haberler())
+    else:
+        sonuclar = [sessiz(analizci.analyze_article, haber) for haber in haberler()]
+    referans = bm25_analizci(tmp_path, "referans")
+    beklenen = [sessiz(referans.analyze_article, haber) for haber in haberler()]
+
+    assert cache.stats["misses"] == iskalar
+    assert analizci.nlp_analyzer.keyword_stats.documents == len(METINLER)
+    assert anahtar_kelimeler(sonuclar) == anahtar_kelimeler(beklenen)
+
+
+def kural_dosyasi_yaz(path, config):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(config, f, ensure_ascii=False)
+    # mtime çözünürlüğü kaba olan dosya sistemlerinde de değişiklik görülsün
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def kural_etiketleri(analizci):
+    return {tag for tags in analizci.nlp_analyzer.matcher.tags.values() for tag in tags if tag[0] == "rule"}
+
+
+def test_kural_yeniden_yukleme_eski_etiketleri_kaldirir(tmp_path):
+    with open(RULES_PATH, encoding="utf-8") as f:
+        config = json.load(f)
+    path = str(tmp_path / "kurallar.json")
+    config["rules"]["K1"]["keywords"].append("eski-kural-deseni")
+    kural_dosyasi_yaz(path, config)
+    analizci = sessiz(hab.ImprovedHousingNewsAnalyzer, rules_path=path)
+    assert ("rule", "K1") in kural_etiketleri(analizci)
+
+    del config["rules"]["K1"]
+    config["version"] += 1
+    kural_dosyasi_yaz(path, config)
+    assert sessiz(analizci.reload_rules)
+
+    taze = sessiz(hab.ImprovedHousingNewsAnalyzer, rules_path=path)
+    assert kural_etiketleri(analizci) == kural_etiketleri(taze)
+    assert "eski-kural-deseni" not in analizci.nlp_analyzer.matcher.tags
+    assert "eski-kural-deseni" not in analizci.nlp_analyzer.matcher.found("bir eski-kural-deseni geçti")
+    haber = haberler()[0]
+    assert sessiz(analizci.analyze_article, haber) == sessiz(taze.analyze_article, haber)
+
+
+def test_seen_index_suzme_ve_kayit(tmp_path):
+    index = hab.SeenIndex(str(tmp_path / "crawl_index.sqlite"), recheck_after=60)
+    linkler = [{"url": "https://ornek/a"}, {"url": "https://ornek/b"}]
+    assert index.filter_due(linkler, now=1000) == linkler
+    assert index.last_run() == {"last_checked": None, "last_analyzed": None}
+
+    haber = {"url": "https://ornek/a", "title": "Başlık", "text": "Metin"}
+    assert index.record(haber, now=1000)
+    index.mark_checked("https://ornek/b", now=1000)
+    # Yeniden kontrol süresi dolmadan ikisi de atlanır, dolunca ikisi de döner
+    assert index.filter_due(linkler, now=1030) == []
+    assert index.filter_due(linkler, now=1060) == linkler
+
+    assert not index.record(haber, now=1060)
+    assert index.record(dict(haber, text="Güncellenmiş metin"), now=1070)
+    assert index.stats == {"skipped": 2, "new": 1, "changed": 1, "unchanged": 1}
+
+    index.mark_analyzed("https://ornek/a", now=1080)
+    assert index.last_run() == {"last_checked": 1070, "last_analyzed": 1080}
+    assert "son analiz" in index.report()
+    index.close()
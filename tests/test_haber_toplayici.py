@@ -0,0 +1,79 @@
+"""python.py HaberToplayici: takılan kaynak sonraki çağrıları bekletmez."""
+
+import http.server
+import socketserver
+import threading
+import time
+
+import pytest
+import requests
+
+import python as uygulama
+
+
+class SahteKaynak(uygulama.HaberKaynagi):
+    """Ağa çıkmadan 'bekle' olayı gelene kadar takılabilen kaynak"""
+
+    def __init__(self, ad, zaman_asimi=0.3, bekle=None):
+        super().__init__(url="http://yerel/", zaman_asimi=zaman_asimi)
+        self.ad = ad
+        self.bekle = bekle
+
+    def cek(self, limit=10):
+        if self.bekle is not None:
+            self.bekle.wait(10)
+        return [{"baslik": f"{self.ad} haberi", "icerik": "", "kaynak": self.ad,
+                 "tarih": "01.01.2025", "url": f"http://yerel/{self.ad}"}]
+
+
+def test_zaman_asimindan_sonraki_cagri_saglikli_kaynaklari_bekletmez():
+    serbest = threading.Event()
+    toplayici = uygulama.HaberToplayici(
+        [SahteKaynak("yavas", bekle=serbest), SahteKaynak("hizli1"), SahteKaynak("hizli2")])
+    try:
+        for _ in range(3):
+            baslangic = time.monotonic()
+            haberler = toplayici.topla(kaynak_basina=1)
+            assert time.monotonic() - baslangic < 1.0
+            assert {ad: durum["durum"] for ad, durum in toplayici.son_durum.items()} == {
+                "yavas": "zaman_asimi", "hizli1": "tamam", "hizli2": "tamam"}
+            assert [haber["kaynak"] for haber in haberler] == ["hizli1", "hizli2"]
+    finally:
+        serbest.set()
+
+
+class DamlatanSunucu(http.server.BaseHTTPRequestHandler):
+    """Başlıktan sonra gövdeyi 0.1 sn'de bir bayt gönderir"""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.end_headers()
+        try:
+            for _ in range(100):
+                self.wfile.write(b" ")
+                self.wfile.flush()
+                time.sleep(0.1)
+        except OSError:
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def damlatan_url():
+    sunucu = socketserver.ThreadingTCPServer(("127.0.0.1", 0), DamlatanSunucu)
+    sunucu.daemon_threads = True
+    threading.Thread(target=sunucu.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{sunucu.server_address[1]}/"
+    sunucu.shutdown()
+    sunucu.server_close()
+
+
+def test_indirme_toplam_sure_asiminda_kesilir(damlatan_url):
+    kaynak = uygulama.HaberKaynagi(url=damlatan_url, zaman_asimi=0.5)
+    baslangic = time.monotonic()
+    with pytest.raises(requests.Timeout):
+        kaynak.cek()
+    assert time.monotonic() - baslangic < 1.5